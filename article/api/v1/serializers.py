@@ -1,7 +1,12 @@
 from rest_framework import serializers
 
 from article import models
-from core.api.v1.serializers import LanguageSerializer, LicenseStatementSerializer, LicenseSerializer
+from core.api.v1.serializers import (
+    LanguageSerializer,
+    LicenseSerializer,
+    LicenseStatementSerializer,
+    SparseFieldsetsMixin,
+)
 from doi.api.v1.serializers import DoiSerializer
 from institution.api.v1.serializers import SponsorSerializer
 from issue.api.v1.serializers import IssueSerializer, TableOfContentsSerializer
@@ -85,7 +90,7 @@ class ContribPersonSerializer(serializers.ModelSerializer):
         ]
 
 
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     journal = JournalSerializer(many=False, read_only=True)
     publisher = SponsorSerializer(many=True, read_only=True)
     titles = TitleSerializer(many=True, read_only=True)
@@ -1,18 +1,192 @@
+from django.db.models import Prefetch
 from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.settings import api_settings
 
 from article import models
+from core.utils.utils import formated_date_api_params
+from core.validators import validate_params
+from issue.models import TableOfContents
+from journal.models import SciELOJournal
 
 from .serializers import ArticleSerializer
 
 
+# Plano de carga dos relacionamentos serializados por ArticleSerializer.
+# Cada campo do serializer indica os caminhos de select_related e
+# prefetch_related necessários para serializá-lo sem consultas por linha.
+ARTICLE_SELECT_RELATED = {
+    "journal": [
+        "journal__official",
+        "journal__contact_location",
+        "journal__crossref_configuration",
+        "journal__journal_use_license",
+    ],
+    "license": ["license"],
+    "issue": [
+        "issue__journal__official",
+        "issue__journal__journal_use_license",
+    ],
+}
+
+ARTICLE_PREFETCH_RELATED = {
+    "journal": [
+        Prefetch(
+            "journal__scielojournal_set",
+            queryset=SciELOJournal.objects.select_related(
+                "collection"
+            ).prefetch_related("journal_history"),
+        ),
+        "journal__subject_descriptor",
+        "journal__subject",
+        "journal__text_language",
+        "journal__mission__language",
+        "journal__title_in_database__indexed_at",
+        "journal__other_titles",
+        "journal__journal_email",
+        "journal__wos_area",
+        "journal__owner_history",
+        "journal__publisher_history",
+        "journal__sponsor_history",
+        "journal__copyright_holder_history",
+        "journal__journaltocsection_set__toc_items__language",
+        "journal__journaltableofcontents_set__language",
+        "journal__journaltableofcontents_set__collection",
+        "journal__crossmark_policy__language",
+    ],
+    "titles": ["titles__language"],
+    "doi": ["doi__language"],
+    "abstracts": ["abstracts__language"],
+    "contrib_persons": [
+        Prefetch(
+            "contrib_persons",
+            queryset=models.ContribPerson.objects.select_related("affiliation"),
+        ),
+    ],
+    "contrib_collabs": [
+        Prefetch(
+            "contrib_collabs",
+            queryset=models.ContribCollab.objects.select_related("affiliation"),
+        ),
+    ],
+    "languages": ["languages"],
+    "fundings": ["fundings__funding_source"],
+    "license_statements": ["license_statements__language"],
+    "issue": [
+        "issue__legacy_issue__collection",
+        Prefetch(
+            "issue__table_of_contents",
+            queryset=TableOfContents.objects.select_related(
+                "journal_toc__language", "journal_toc__collection"
+            ),
+        ),
+        "issue__license",
+        "issue__issue_title__language",
+        "issue__bibliographic_strip__language",
+        "issue__journal__publisher_history",
+        "issue__journal__indexed_at",
+    ],
+    "keywords": ["keywords__language"],
+}
+
+
+def get_requested_fields(query_params):
+    """
+    Obtém do parâmetro ``fields`` a lista de campos pedidos pelo cliente.
+
+    Retorna None quando o parâmetro não foi informado (todos os campos).
+    """
+    fields = query_params.get("fields")
+    if not fields:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    invalid = set(requested) - set(ArticleSerializer.Meta.fields)
+    if invalid:
+        raise ValidationError(
+            f"Only {ArticleSerializer.Meta.fields} fields are allowed. Fields invalid: {invalid}"
+        )
+    return requested
+
+
+def optimize_article_queryset(queryset, fields=None):
+    """
+    Aplica select_related / prefetch_related somente para os relacionamentos
+    que serão serializados.
+    """
+    if fields is None:
+        fields = ArticleSerializer.Meta.fields
+    select_related = []
+    prefetch_related = []
+    for name in fields:
+        select_related.extend(ARTICLE_SELECT_RELATED.get(name) or [])
+        prefetch_related.extend(ARTICLE_PREFETCH_RELATED.get(name) or [])
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+class ArticleCursorPagination(CursorPagination):
+    """
+    Paginação por cursor (keyset) ordenada pela data de atualização.
+
+    Evita OFFSET em tabela grande e permite sincronização incremental
+    combinada com ``from_date_updated``.
+    """
+
+    ordering = ("updated", "id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
 class ArticleViewSet(viewsets.ModelViewSet):
     serializer_class = ArticleSerializer
     http_method_names = ["get"]
     queryset = models.Article.objects.all()
+    pagination_class = ArticleCursorPagination
+
+    @property
+    def paginator(self):
+        # mantém a paginação por número de página para clientes que usam ``page``
+        if not hasattr(self, "_paginator"):
+            if "page" in self.request.query_params:
+                self._paginator = api_settings.DEFAULT_PAGINATION_CLASS()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = get_requested_fields(self.request.query_params)
+        return context
 
     def get_queryset(self):
-        queryset = models.Article.objects.all()
-        doi_prefix = self.request.query_params.get("doi_prefix", None)
-        if doi_prefix is not None:
-            queryset = queryset.filter(doi__value__startswith=doi_prefix)
-        return queryset
+        query_params = self.request.query_params
+
+        validate_params(
+            self.request,
+            "doi_prefix",
+            "from_date_created",
+            "until_date_created",
+            "from_date_updated",
+            "until_date_updated",
+            "fields",
+            "cursor",
+            "page",
+            "page_size",
+            "",
+        )
+
+        queryset = super().get_queryset()
+        if doi_prefix := query_params.get("doi_prefix"):
+            queryset = queryset.filter(doi__value__startswith=doi_prefix).distinct()
+
+        dates = formated_date_api_params(query_params)
+        if dates:
+            queryset = queryset.filter(**dates)
+
+        return optimize_article_queryset(
+            queryset, get_requested_fields(query_params)
+        )
@@ -1,4 +1,6 @@
+import copy
 import csv
+import itertools
 import json
 import logging
 import sys
@@ -10,6 +12,8 @@ from article.models import Article, ArticleExporter, ArticleFunding, ArticleSour
 from article import choices
 from collection.models import Collection
 from core.mongodb import write_item
+from core.utils.fair_share import weighted_round_robin
+from core.utils.metrics import timed_stage
 from core.utils.harvesters import AMHarvester, OPACHarvester
 from institution.models import Sponsor
 from journal.models import Journal
@@ -124,12 +128,29 @@ def read_file(user, file_path):
             load_financial_data(row, user)
 
 
+def get_articlemeta_issue_data(issue, collection_acron3, issue_data_cache=None):
+    """
+    Obtém a parte do documento ArticleMeta referente ao fascículo e ao
+    periódico. Com issue_data_cache, o resultado é calculado uma única vez
+    por (fascículo, coleção) e compartilhado entre os artigos do fascículo.
+    """
+    if issue_data_cache is None:
+        return issue.articlemeta_format(collection_acron3)
+    key = (issue.id, collection_acron3)
+    if key not in issue_data_cache:
+        issue_data_cache[key] = issue.articlemeta_format(collection_acron3)
+    # cópia, pois write_item altera o documento (convert_dates)
+    return copy.deepcopy(issue_data_cache[key])
+
+
+@timed_stage("export_articlemeta")
 def export_article_to_articlemeta(
     user,
     article,
     collection_acron_list=None,
     force_update=None,
     version=None,
+    issue_data_cache=None,
 ) -> bool:
 
     try:
@@ -187,20 +208,14 @@ def export_article_to_articlemeta(
                     events.append("building articlemeta format for article")
                     article_data = am.build(article.xmltree, external_data)
 
-                events.append("check articlemeta exportation demand")
-                exporter = ArticleExporter.get_demand(
-                    user, article, "articlemeta", pid, col, version, force_update
-                )
-                if not exporter:
-                    # não encontrou necessidade de exportar
-                    continue
-
                 data = {"collection": col.acron3}
                 data.update(article_data)
                 data["article"]["fulltext_langs"] = text_langs.get(col.acron3, {})
 
                 events.append("building articlemeta format for issue")
-                issue_data = article.issue.articlemeta_format(col.acron3)
+                issue_data = get_articlemeta_issue_data(
+                    article.issue, col.acron3, issue_data_cache
+                )
                 data.update(issue_data)
 
                 events.append("updating articlemeta format with issue data")
@@ -229,6 +244,22 @@ def export_article_to_articlemeta(
                     logging.info(data)
                     raise e
 
+                events.append("check articlemeta exportation demand")
+                content_hash = ArticleExporter.generate_content_hash(data)
+                exporter = ArticleExporter.get_demand(
+                    user,
+                    article,
+                    "articlemeta",
+                    pid,
+                    col,
+                    version,
+                    force_update,
+                    content_hash=content_hash,
+                )
+                if not exporter:
+                    # conteúdo não mudou desde a última exportação
+                    continue
+
                 # Export the article to ArticleMeta
                 events.append("writing article to articlemeta database")
                 response = write_item("articles", data)
@@ -241,6 +272,7 @@ def export_article_to_articlemeta(
                     response=response,
                     errors=None,
                     exceptions=None,
+                    content_hash=content_hash,
                 )
 
             except Exception as e:
@@ -345,8 +377,16 @@ def bulk_export_articles_to_articlemeta(
             )
             return False
 
+        # artigos agrupados por fascículo: os dados do fascículo e do
+        # periódico são calculados uma vez por (fascículo, coleção)
+        issue_data_cache = {}
+        current_issue_id = None
+        queryset = queryset.select_related("issue__journal").order_by("issue_id", "id")
         for article in queryset.iterator():
             try:
+                if article.issue_id != current_issue_id:
+                    issue_data_cache.clear()
+                    current_issue_id = article.issue_id
                 if force_update:
                     article.check_availability(user)
                 if not article.is_classic_public:
@@ -357,6 +397,7 @@ def bulk_export_articles_to_articlemeta(
                     collection_acron_list=collection_acron_list,
                     force_update=force_update,
                     version=version,
+                    issue_data_cache=issue_data_cache,
                 )
             except Exception as e:
                 # Registra erro do article mas continua processando outros
@@ -466,6 +507,8 @@ class ArticleIteratorBuilder:
         self._iter_from_article_source_count = 0
         self._iter_from_pid_provider_count = 0
         self._iter_from_article_count = 0
+        # restrito às coleções informadas (ver iter_by_collection)
+        self._scoped = False
 
     def __iter__(self):
         yield from self._iter_from_harvest()
@@ -478,16 +521,80 @@ class ArticleIteratorBuilder:
                      f"pid_provider={self._iter_from_pid_provider_count}, "
                      f"article={self._iter_from_article_count}")
 
+    def iter_by_collection(self, weights=None):
+        """
+        Como __iter__, mas retorna (acrônimo da coleção, kwargs), intercalando
+        as coleções por rodízio ponderado (core.utils.fair_share).
+
+        Os itens de ArticleSource, que não são filtrados por coleção, vêm
+        com acrônimo None. Cada pp_xml é despachado uma vez, mesmo que o
+        periódico pertença a mais de uma coleção. Sem collection_acron_list,
+        os XML / artigos fora dos periódicos das coleções vêm por último,
+        com acrônimo None.
+        """
+        if Collection.objects.count() == 0:
+            Collection.load(self.user)
+
+        seen = set()
+        groups = {}
+        for collection_acron in self.collection_acron_list or list(
+            Collection.get_acronyms()
+        ):
+            scoped = copy.copy(self)
+            scoped.collection_acron_list = [collection_acron]
+            scoped._scoped = True
+            groups[collection_acron] = self._unseen(
+                scoped._iter_collection_items(), seen
+            )
+        groups[None] = self._iter_from_article_source()
+        items = weighted_round_robin(groups, weights)
+        if self.collection_acron_list:
+            return items
+        return itertools.chain(
+            items,
+            (
+                (None, item)
+                for item in self._unseen(self._iter_without_collection(), seen)
+            ),
+        )
+
+    def _iter_collection_items(self):
+        yield from self._iter_from_harvest()
+        yield from self._iter_from_pid_provider()
+        yield from self._iter_from_article()
+
+    def _iter_without_collection(self):
+        # seleção de __iter__ sem filtro de coleção; os itens já despachados
+        # pelas coleções são descartados por _unseen
+        yield from self._iter_from_pid_provider()
+        yield from self._iter_from_article()
+
+    @staticmethod
+    def _unseen(items, seen):
+        """
+        Descarta os itens cujo pp_xml_id está em seen e o acrescenta a seen
+        """
+        for item in items:
+            pp_xml_id = item and item.get("pp_xml_id")
+            if pp_xml_id:
+                if pp_xml_id in seen:
+                    continue
+                seen.add(pp_xml_id)
+            yield item
+
     # ------------------------------------------------------------------
     # Iteradores de seleção
     # ------------------------------------------------------------------
 
     def _iter_from_pid_provider(self):
         """Itera PidProviderXML filtrados por periódico, data e status."""
-        journal_issn_groups = (
-            Journal.get_journal_issns(self.collection_acron_list, self.journal_acron_list)
-            or [None]
+        journal_issn_groups = Journal.get_journal_issns(
+            self.collection_acron_list, self.journal_acron_list
         )
+        if not journal_issn_groups and self._scoped:
+            # coleção sem periódicos: sem o filtro, todos os XML seriam selecionados
+            return
+        journal_issn_groups = journal_issn_groups or [None]
         for journal_issns in journal_issn_groups:
             issn_list = [i for i in journal_issns if i] if journal_issns else None
             if journal_issns and not issn_list:
@@ -521,6 +628,9 @@ class ArticleIteratorBuilder:
             collection_acron_list=self.collection_acron_list,
             journal_acron_list=self.journal_acron_list,
         )
+        if not journal_id_list and self._scoped:
+            # coleção sem periódicos: sem o filtro, todos os artigos seriam selecionados
+            return
         if journal_id_list:
             filters["journal__in"] = journal_id_list
         if self.from_pub_year:
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("article", "0048_alter_articlesource_status"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["updated", "id"], name="article_art_updated_430f65_idx"
+            ),
+        ),
+    ]
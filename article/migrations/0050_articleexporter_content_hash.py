@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("article", "0049_article_article_art_updated_430f65_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="articleexporter",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, max_length=64, null=True, verbose_name="Content hash"
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:02
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def delete_duplicated_records(apps, schema_editor):
+    """
+    Mantém somente o registro atualizado mais recentemente para cada
+    (pid, collection), condição para criar a restrição de unicidade
+    """
+    Model = apps.get_model("article", "AMArticle")
+    ArticleSource = apps.get_model("article", "ArticleSource")
+    duplicated = (
+        Model.objects.filter(pid__isnull=False, collection__isnull=False)
+        .values("pid", "collection")
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+    )
+    for item in duplicated.iterator():
+        ids = list(
+            Model.objects.filter(pid=item["pid"], collection=item["collection"])
+            .order_by("-updated")
+            .values_list("id", flat=True)
+        )
+        ArticleSource.objects.filter(am_article_id__in=ids[1:]).update(
+            am_article_id=ids[0]
+        )
+        Model.objects.filter(id__in=ids[1:]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("article", "0050_articleexporter_content_hash"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicated_records, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="amarticle",
+            constraint=models.UniqueConstraint(
+                fields=("pid", "collection"), name="unique_amarticle_pid_collection"
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:30
+
+from django.db import migrations
+
+from core.utils.partitioning import convert_to_partitioned
+
+
+def partition_table(apps, schema_editor):
+    model = apps.get_model("article", "ArticleEvent")
+    convert_to_partitioned(schema_editor, model._meta.db_table)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("article", "0053_contribperson_blocking_key"),
+    ]
+
+    operations = [
+        # a tabela particionada continua compatível com o modelo
+        migrations.RunPython(partition_table, migrations.RunPython.noop),
+    ]
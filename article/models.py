@@ -30,6 +30,7 @@ from core.models import CommonControlField  # Ajuste o import conforme sua estru
 from core.models import (
     BaseExporter,
     BaseLegacyRecord,
+    DeferredPayloadManager,
     FlexibleDate,
     Language,
     License,
@@ -37,6 +38,8 @@ from core.models import (
     TextLanguageMixin,
     CharFieldLangMixin,
 )
+from core.panels import RecentEventsPanel
+from core.utils.metrics import timed_stage
 from core.utils.utils import NonRetryableError, fetch_data
 from doi.models import DOI
 from doi_manager.models import CrossRefConfiguration
@@ -49,6 +52,7 @@ from pid_provider.provider import PidProvider
 from location.models import Location
 from organization.models import Organization, NormAffiliation
 from researcher.models import AffiliationMixin, CollabMixin, ResearchNameMixin
+from researcher.resolvers import BlockingKeyResolver
 from tracker.models import BaseEvent, EventSaveError, UnexpectedEvent
 from vocabulary.models import Keyword
 
@@ -107,6 +111,12 @@ class AMArticle(BaseLegacyRecord):
                 ]
             ),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["pid", "collection"],
+                name="unique_amarticle_pid_collection",
+            ),
+        ]
 
 
 class Article(
@@ -295,7 +305,7 @@ class Article(
     ]
     panels_errors = [
         FieldPanel("errors", read_only=True),
-        InlinePanel("events", label=_("Events")),
+        RecentEventsPanel("events", heading=_("Events")),
     ]
 
     edit_handler = TabbedInterface(
@@ -356,6 +366,7 @@ class Article(
             models.Index(fields=["days_preprint_to_published"]),
             models.Index(fields=["days_receive_to_published"]),
             models.Index(fields=["days_receive_to_published_estimated"]),
+            models.Index(fields=["updated", "id"]),
         ]
 
     def __unicode__(self):
@@ -625,7 +636,7 @@ class Article(
         if is_active:
             params["collection__is_active"] = bool(is_active)
         data = {}
-        for item in self.legacy_article.filter(**params):
+        for item in self.legacy_article.with_payload().filter(**params):
             data[item.collection.acron3] = item.legacy_keys
         if not data:
             UnexpectedEvent.create(
@@ -764,6 +775,7 @@ class Article(
         logging.info(f"get_availability {params}")
         return self.article_availability.filter(available=True, **params)
 
+    @timed_stage("check_availability")
     def check_availability(self, user, force_update=False):
         try:
             if not self.is_pp_xml_valid():
@@ -1740,6 +1752,9 @@ class ArticleSource(CommonControlField):
         verbose_name=_("Legacy Article"),
         help_text=_("Related Legacy Article instance"),
     )
+
+    objects = DeferredPayloadManager("detail")
+
     base_form_class = CoreAdminModelForm
 
     panels = [
@@ -1871,6 +1886,7 @@ class ArticleSource(CommonControlField):
         except Exception:
             pass
 
+    @timed_stage("article_source_request_xml")
     def request_xml(self, detail):
         if not self.url:
             raise ValueError("URL is required")
@@ -2239,6 +2255,7 @@ class ArticleAvailability(CommonControlField):
                 timeout=timeout,
             )
 
+    @timed_stage("check_url_availability")
     def check_availability(self, timeout=None):
         if not self.collection.is_active:
             self.available = False
@@ -3073,7 +3090,7 @@ class ContribPerson(ResearchNameMixin, CommonControlField):
     @classmethod
     def create_or_update(cls, user, article, declared_name=None, given_names=None,
                         last_name=None, suffix=None, orcid=None, email=None,
-                        affiliation=None):
+                        affiliation=None, resolver=None):
         """
         Create a new contrib person or update an existing one.
         
@@ -3092,6 +3109,10 @@ class ContribPerson(ResearchNameMixin, CommonControlField):
             orcid: ORCID identifier (optional)
             email: Email address (optional)
             affiliation: ArticleAffiliation instance (optional)
+            resolver: researcher.resolvers.BlockingKeyResolver with the
+                article's contributors (optional); when given, the lookup
+                is done in memory by blocking key and tolerates spelling
+                variants of the name
             
         Returns:
             ContribPerson instance (created or updated)
@@ -3103,7 +3124,20 @@ class ContribPerson(ResearchNameMixin, CommonControlField):
             raise ValueError("ContribPerson.create_or_update requires article parameter")
         
         try:
-            obj = cls.get(article, declared_name, orcid, given_names, last_name, suffix)
+            if resolver:
+                affiliation_id = affiliation.pk if affiliation else None
+                obj = resolver.match(
+                    given_names=given_names,
+                    last_name=last_name,
+                    suffix=suffix,
+                    declared_name=declared_name,
+                    orcid=orcid,
+                    accept=lambda item: item.affiliation_id == affiliation_id,
+                )
+                if obj is None:
+                    raise cls.DoesNotExist
+            else:
+                obj = cls.get(article, declared_name, orcid, given_names, last_name, suffix)
             
             # Update fields (including those used in lookup for consistency)
             if declared_name is not None:
@@ -3128,7 +3162,7 @@ class ContribPerson(ResearchNameMixin, CommonControlField):
             return obj
             
         except cls.DoesNotExist:
-            return cls.create(
+            obj = cls.create(
                 user=user,
                 article=article,
                 declared_name=declared_name,
@@ -3139,6 +3173,18 @@ class ContribPerson(ResearchNameMixin, CommonControlField):
                 email=email,
                 affiliation=affiliation
             )
+            if resolver:
+                resolver.add(obj)
+            return obj
+
+    @classmethod
+    def get_resolver(cls, article, people):
+        """
+        Returns a BlockingKeyResolver loaded, in one query, with the
+        article's contributors that share a blocking key with people
+        (dicts with given_names, last_name and declared_name)
+        """
+        return BlockingKeyResolver(cls.objects.filter(article=article), people)
     
     def add_orcid(self, user, orcid):
         """
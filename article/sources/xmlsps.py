@@ -36,6 +36,7 @@ from article.models import (
 )
 from core.models import Language, LicenseStatement, License
 from core.utils.extracts_normalized_email import extracts_normalized_email
+from core.utils.metrics import timed_stage
 from doi.models import DOI
 from institution.models import Sponsor
 from issue.models import Issue, TableOfContents, AMIssue
@@ -70,6 +71,7 @@ def add_error(errors, function_name, error, **kwargs):
     errors.append(error_dict)
 
 
+@timed_stage("load_article")
 def load_article(user, xml=None, file_path=None, v3=None, pp_xml=None):
     """
     Carrega um artigo a partir de XML.
@@ -177,7 +179,8 @@ def load_article(user, xml=None, file_path=None, v3=None, pp_xml=None):
         )
         logging.info(f"...Article {pid_v3} {sps_pkg_name}")
 
-        article.events.all().delete()
+        # os eventos anteriores são mantidos; a retenção remove as partições
+        # antigas de ArticleEvent (core.utils.partitioning)
         event = article.add_event(user, _("load article"))
 
         # Configurar todos os campos antes de salvar (Sugestão 9)
@@ -537,7 +540,7 @@ def get_or_create_toc_sections(xmltree, user, errors, issue):
     data = []
     try:
         if not issue.table_of_contents.exists():
-            for am_issue in AMIssue.objects.filter(new_record=issue):
+            for am_issue in AMIssue.objects.with_payload().filter(new_record=issue):
                 load_issue_sections(user, issue, am_issue=am_issue)
         toc_sections = ArticleTocSections(xmltree=xmltree).sections
         for item in toc_sections:
@@ -687,7 +690,18 @@ def create_or_update_contrib_persons(xmltree, article, user, item, errors):
 
     data = []
     try:
-        authors = XMLContribs(xmltree=xmltree).contribs
+        authors = list(XMLContribs(xmltree=xmltree).contribs)
+        # candidatos de todos os autores obtidos em uma única consulta
+        resolver = ContribPerson.get_resolver(
+            article,
+            [
+                {
+                    "given_names": (author.get("contrib_name") or {}).get("given-names"),
+                    "last_name": (author.get("contrib_name") or {}).get("surname"),
+                }
+                for author in authors
+            ],
+        )
 
         for author in authors:
             try:
@@ -719,6 +733,7 @@ def create_or_update_contrib_persons(xmltree, article, user, item, errors):
                         orcid=orcid,
                         email=author.get("email"),
                         affiliation=None,
+                        resolver=resolver,
                     )
                     data.append(obj)
                 else:
@@ -753,6 +768,7 @@ def create_or_update_contrib_persons(xmltree, article, user, item, errors):
                             orcid=orcid,
                             email=email,
                             affiliation=affiliation,
+                            resolver=resolver,
                         )
                         data.append(obj)
             except Exception as e:
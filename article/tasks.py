@@ -1,6 +1,8 @@
 import logging
 import sys
 
+from celery.exceptions import Retry
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 
@@ -11,7 +13,9 @@ from article.sources.xmlsps import load_article
 from collection.models import Collection
 from config import celery_app
 from core.models import License
+from core.utils import fair_share, idempotency
 from core.utils.extracts_normalized_email import extracts_normalized_email
+from core.utils.tracing import span
 from core.utils.utils import _get_user
 from journal.models import Journal
 from pid_provider.models import PidProviderXML
@@ -781,7 +785,7 @@ def task_dispatch_articles(
 
         dispatched = skipped = 0
 
-        for item_kwargs in controller.ArticleIteratorBuilder(
+        builder = controller.ArticleIteratorBuilder(
             user=user,
             collection_acron_list=collection_acron_list,
             journal_acron_list=journal_acron_list,
@@ -796,12 +800,26 @@ def task_dispatch_articles(
             timeout=timeout,
             opac_url=opac_url,
             force_update=force_update,
+        )
+        # coleções intercaladas: uma coleção grande não ocupa a fila sozinha
+        for collection_acron, item_kwargs in builder.iter_by_collection(
+            getattr(settings, "PIPELINE_COLLECTION_WEIGHTS", None)
         ):
             if item_kwargs is None:
                 skipped += 1
                 continue
+            if not force_update and idempotency.recently_completed(
+                _completed_key(_document_key(**item_kwargs))
+            ):
+                skipped += 1
+                continue
             logging.info(f"Dispatching article with kwargs: {item_kwargs}")
-            task_process_article_pipeline.delay(**item_kwargs, **common_kwargs)
+            # um trace por artigo: dispatch -> pipeline -> export
+            with span("article.dispatch", item_kwargs, new_trace=True):
+                task_process_article_pipeline.apply_async(
+                    kwargs={**item_kwargs, **common_kwargs},
+                    headers=fair_share.dispatch_headers(collection_acron),
+                )
             dispatched += 1
 
         return {
@@ -832,7 +850,61 @@ def task_dispatch_articles(
         )
         raise
 
-@celery_app.task(bind=True)
+
+def _document_key(
+    xml_url=None, source_date=None, article_source_id=None, pp_xml_id=None, **kwargs
+):
+    """
+    Chave de idempotência do documento a partir do ponto de entrada
+    de task_process_article_pipeline
+    """
+    if xml_url:
+        return ("xml_url", xml_url, source_date)
+    if article_source_id:
+        return ("article_source", article_source_id)
+    if pp_xml_id:
+        return ("pp_xml", pp_xml_id)
+
+
+def _completed_key(document_key):
+    """
+    Chave da marca de documento recém-processado: somente a entrada por
+    xml_url traz a versão do documento (source_date); ArticleSource e
+    PidProviderXML recebem novas versões do XML mantendo o mesmo id
+    """
+    if document_key and document_key[0] == "xml_url" and document_key[2]:
+        return document_key
+
+
+def _task_time_limit(task):
+    """
+    Tempo limite, em segundos, da execução em andamento de task
+    """
+    hard, soft = getattr(task.request, "timelimit", None) or (None, None)
+    return (
+        hard
+        or task.time_limit
+        or getattr(settings, "CELERY_TASK_TIME_LIMIT", None)
+        or soft
+        or task.soft_time_limit
+        or getattr(settings, "CELERY_TASK_SOFT_TIME_LIMIT", None)
+    )
+
+
+def _retry_when_busy(task, document_key):
+    """
+    Documento em processamento por outra tarefa: a execução é repetida
+    depois, pois pode trazer conteúdo que a outra não carregou
+    """
+    logging.info(f"Article pipeline already in progress, retrying: {document_key}")
+    raise task.retry(
+        countdown=getattr(settings, "DOCUMENT_LOCK_RETRY_DELAY", 60),
+        max_retries=None,
+        headers=fair_share.retry_headers(task.request),
+    )
+
+
+@celery_app.task(bind=True, fair_share_slot=True)
 def task_process_article_pipeline(
     self,
     # Entrada para fluxo A (XML URL → ArticleSource → PidProviderXML)
@@ -913,64 +985,107 @@ def task_process_article_pipeline(
             export_to_articlemeta=True
         )
     """
+    document_key = _document_key(
+        xml_url=xml_url,
+        source_date=source_date,
+        article_source_id=article_source_id,
+        pp_xml_id=pp_xml_id,
+    )
+    completed_key = _completed_key(document_key)
+    if not force_update and idempotency.recently_completed(completed_key):
+        return {"status": "skipped", "reason": "recently completed"}
+
+    # vaga e locks não expiram antes do tempo limite da tarefa
+    lock_ttl = idempotency.lock_ttl(_task_time_limit(self))
+    acquired, slot = fair_share.acquire_slot(
+        fair_share.request_header(self.request, fair_share.COLLECTION_HEADER),
+        ttl=lock_ttl,
+    )
+    if not acquired:
+        # coleção no limite de tarefas simultâneas: volta para o fim da fila
+        raise self.retry(
+            countdown=getattr(settings, "PIPELINE_COLLECTION_RETRY_DELAY", 30),
+            max_retries=None,
+            headers=fair_share.retry_headers(self.request),
+        )
+    fair_share.record_task_start(self.request)
+
     try:
-        user = _get_user(self.request, username=username, user_id=user_id)
+        with idempotency.document_lock(document_key, lock_ttl) as acquired:
+            if not acquired:
+                if completed_key and not force_update:
+                    # mesma versão do XML já em processamento
+                    logging.info(f"Article pipeline already in progress: {document_key}")
+                    return {"status": "skipped", "reason": "already in progress"}
+                _retry_when_busy(self, document_key)
+            user = _get_user(self.request, username=username, user_id=user_id)
         
-        if xml_url:
-            if not collection_acron:
-                raise ValueError("collection_acron is required when xml_url is provided")
-            if not pid:
-                raise ValueError("pid is required when xml_url is provided")
-            am_article = AMArticle.create_or_update(
-                pid, Collection.get(collection_acron), None, user
-            )
-            if not am_article:
+            if xml_url:
+                if not collection_acron:
+                    raise ValueError("collection_acron is required when xml_url is provided")
+                if not pid:
+                    raise ValueError("pid is required when xml_url is provided")
+                am_article = AMArticle.create_or_update(
+                    pid, Collection.get(collection_acron), None, user
+                )
+                if not am_article:
+                    raise ValueError(
+                        f"Failed to create or update AMArticle with pid: {pid} and collection: {collection_acron}"
+                    )
+
+                article_source = ArticleSource.create_or_update(
+                    user=user,
+                    url=xml_url,
+                    source_date=source_date,
+                    force_update=force_update,
+                    am_article=am_article,
+                    auto_solve_pid_conflict=auto_solve_pid_conflict,
+                )
+                pp_xml_id = article_source.pid_provider_xml.id
+        
+            if article_source_id:
+                article_source = ArticleSource.objects.get(id=article_source_id)
+                article_source.add_pid_provider(
+                    user=user,
+                    force_update=force_update,
+                    auto_solve_pid_conflict=auto_solve_pid_conflict,
+                )
+                pp_xml_id = article_source.pid_provider_xml.id
+
+            if not pp_xml_id:
                 raise ValueError(
-                    f"Failed to create or update AMArticle with pid: {pid} and collection: {collection_acron}"
+                    "No valid entry point provided. Please provide either xml_url, "
+                    "article_source_id, pp_xml_id or pid_v3."
                 )
 
-            article_source = ArticleSource.create_or_update(
-                user=user,
-                url=xml_url,
-                source_date=source_date,
-                force_update=force_update,
-                am_article=am_article,
-                auto_solve_pid_conflict=auto_solve_pid_conflict,
-            )
-            pp_xml_id = article_source.pid_provider_xml.id
-        
-        if article_source_id:
-            article_source = ArticleSource.objects.get(id=article_source_id)
-            article_source.add_pid_provider(
-                user=user,
-                force_update=force_update,
-                auto_solve_pid_conflict=auto_solve_pid_conflict,
-            )
-            pp_xml_id = article_source.pid_provider_xml.id
-
-        if not pp_xml_id:
-            raise ValueError(
-                "No valid entry point provided. Please provide either xml_url, "
-                "article_source_id, pp_xml_id or pid_v3."
-            )
-
-        pp_xml = PidProviderXML.objects.select_related(
-            "current_version"
-        ).get(id=pp_xml_id)
-
-        article = load_article(user, pp_xml=pp_xml)
-        pp_xml.collections.set(article.collections)
-
-        article.check_availability(user, force_update=export_to_articlemeta or force_update)
-        
-        if export_to_articlemeta:
-            task_export_article_to_articlemeta.delay(
-                pid_v3=article.pid_v3,
-                collection_acron_list=collection_acron_list,
-                force_update=force_update,
-                user_id=user.id,
-                username=user.username,
-            )
+            pp_xml = PidProviderXML.objects.select_related(
+                "current_version"
+            ).get(id=pp_xml_id)
+
+            # tarefas com outro ponto de entrada podem chegar ao mesmo documento
+            pid_v3_key = ("pid_v3", pp_xml.v3) if pp_xml.v3 else None
+            with idempotency.document_lock(pid_v3_key, lock_ttl) as acquired:
+                if not acquired:
+                    # a outra tarefa pode ter carregado uma versão anterior
+                    _retry_when_busy(self, pid_v3_key)
+                article = load_article(user, pp_xml=pp_xml)
+                pp_xml.collections.set(article.collections)
+
+                article.check_availability(user, force_update=export_to_articlemeta or force_update)
+
+            if export_to_articlemeta:
+                task_export_article_to_articlemeta.delay(
+                    pid_v3=article.pid_v3,
+                    collection_acron_list=collection_acron_list,
+                    force_update=force_update,
+                    user_id=user.id,
+                    username=user.username,
+                )
+
+            idempotency.mark_completed(completed_key)
+            return {"status": "success", "pid_v3": article.pid_v3}
+    except Retry:
+        raise
     except Exception as e:
         exc_type, exc_value, exc_traceback = sys.exc_info()
         UnexpectedEvent.create(
@@ -987,3 +1102,5 @@ def task_process_article_pipeline(
                 "force_update": force_update,
             },
         )
+    finally:
+        fair_share.release_slot(slot)
@@ -4,18 +4,32 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+from celery.exceptions import Retry
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import make_aware
 from freezegun import freeze_time
 
-from article.models import Article
+from article.controller import ArticleIteratorBuilder, bulk_export_articles_to_articlemeta
+from article.models import Article, ContribPerson, DocumentTitle
 from article.tasks import (
+    _completed_key,
+    _document_key,
+    _task_time_limit,
     get_researcher_identifier_unnormalized,
     migrate_path_xml_pid_provider_to_pid_provider,
     normalize_stored_email,
     remove_duplicate_articles,
+    task_process_article_pipeline,
 )
+from core.models import Language
+from core.panels import RecentEventsPanel
+from core.utils import idempotency
+from issue.models import Issue
+from journal.models import Journal
 from researcher.models import ResearcherIdentifier
 
 User = get_user_model()
@@ -1171,3 +1185,284 @@ class ContribPersonTest(TestCase):
         self.assertEqual(person.declared_name, "Dr. John R. Smith Jr.")
 
 
+class ArticleAPITest(TestCase):
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="api", password="api")
+        self.client.force_authenticate(user=self.user)
+        self.language = Language.objects.create(code2="pt", name="Português")
+        self.create_article("pid-api-1", "S0000-00002023000100001")
+        self.create_article("pid-api-2", "S0000-00002023000100002")
+
+    def create_article(self, pid_v3, pid_v2):
+        # relacionamentos preenchidos para exercitar o plano de carga
+        journal = Journal.objects.create(title=f"Revista {pid_v3}")
+        article = Article.objects.create(
+            pid_v3=pid_v3,
+            pid_v2=pid_v2,
+            journal=journal,
+            issue=Issue.objects.create(journal=journal, year="2023", volume="1"),
+        )
+        article.titles.add(
+            DocumentTitle.objects.create(plain_text=pid_v3, language=self.language)
+        )
+        article.languages.add(self.language)
+        ContribPerson.objects.create(
+            article=article, given_names="Ana", last_name="Silva"
+        )
+        return article
+
+    def test_fields_param_returns_only_requested_fields(self):
+        response = self.client.get("/api/v1/article/", {"fields": "pid_v3,pid_v2"})
+        self.assertEqual(response.status_code, 200)
+        for item in response.json()["results"]:
+            self.assertEqual(set(item.keys()), {"pid_v3", "pid_v2"})
+
+    def test_fields_param_rejects_unknown_field(self):
+        response = self.client.get("/api/v1/article/", {"fields": "pid_v3,unknown"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_pagination_by_default(self):
+        response = self.client.get(
+            "/api/v1/article/", {"fields": "pid_v3", "page_size": 1}
+        )
+        data = response.json()
+        self.assertNotIn("count", data)
+        self.assertEqual(len(data["results"]), 1)
+        next_page = self.client.get(data["next"]).json()
+        self.assertEqual(len(next_page["results"]), 1)
+        self.assertNotEqual(
+            data["results"][0]["pid_v3"], next_page["results"][0]["pid_v3"]
+        )
+
+    def test_page_param_keeps_page_number_pagination(self):
+        response = self.client.get("/api/v1/article/", {"fields": "pid_v3", "page": 1})
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_full_representation_queries_do_not_grow_with_rows(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/article/")
+        self.assertEqual(len(response.json()["results"]), 2)
+
+        for i in range(3, 6):
+            self.create_article(f"pid-api-{i}", f"S0000-0000202300010000{i}")
+        with self.assertNumQueries(len(queries)):
+            response = self.client.get("/api/v1/article/")
+        results = response.json()["results"]
+        self.assertEqual(len(results), 5)
+        for item in results:
+            self.assertEqual(item["journal"]["title"], f"Revista {item['pid_v3']}")
+            self.assertEqual(item["issue"]["volume"], "1")
+            self.assertEqual(item["titles"][0]["plain_text"], item["pid_v3"])
+            self.assertEqual(item["contrib_persons"][0]["last_name"], "Silva")
+
+
+class CompletedKeyTest(SimpleTestCase):
+    def test_xml_url_with_source_date_is_versioned(self):
+        key = _document_key(xml_url="https://x/a.xml", source_date="2024-01-01")
+        self.assertEqual(key, _completed_key(key))
+
+    def test_ids_without_version_are_not_marked(self):
+        # nova versão do XML mantém o id de ArticleSource / PidProviderXML
+        self.assertIsNone(_completed_key(_document_key(article_source_id=1)))
+        self.assertIsNone(_completed_key(_document_key(pp_xml_id=1)))
+        self.assertIsNone(_completed_key(_document_key(xml_url="https://x/a.xml")))
+        self.assertIsNone(_completed_key(None))
+
+
+@override_settings(DOCUMENT_LOCK_RETRY_DELAY=60)
+class PipelineDocumentLockTest(SimpleTestCase):
+    xml_url = "https://x/a.xml"
+
+    def setUp(self):
+        cache.clear()
+
+    def run_pipeline(self, **kwargs):
+        with patch.object(
+            task_process_article_pipeline, "retry", return_value=Retry()
+        ) as retry:
+            try:
+                return task_process_article_pipeline(**kwargs), retry
+            except Retry:
+                return None, retry
+
+    def test_busy_document_is_retried(self):
+        with idempotency.document_lock(_document_key(pp_xml_id=1)):
+            result, retry = self.run_pipeline(pp_xml_id=1)
+        self.assertIsNone(result)
+        self.assertEqual(60, retry.call_args.kwargs["countdown"])
+
+    def test_busy_document_with_same_version_is_skipped(self):
+        kwargs = dict(
+            xml_url=self.xml_url,
+            source_date="2024-01-01",
+            collection_acron="scl",
+            pid="S1",
+        )
+        with idempotency.document_lock(_document_key(**kwargs)):
+            result, retry = self.run_pipeline(**kwargs)
+            self.assertEqual("skipped", result["status"])
+            retry.assert_not_called()
+
+            result, retry = self.run_pipeline(force_update=True, **kwargs)
+            self.assertIsNone(result)
+            retry.assert_called_once()
+
+    def test_time_limit(self):
+        task = MagicMock(time_limit=None, soft_time_limit=None)
+        task.request.timelimit = (900, 600)
+        self.assertEqual(900, _task_time_limit(task))
+        task.request.timelimit = None
+        with override_settings(CELERY_TASK_TIME_LIMIT=300):
+            self.assertEqual(300, _task_time_limit(task))
+
+
+class ArticleEventsPanelTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="events", password="events")
+        self.article = Article.objects.create(pid_v3="pid-events-1")
+        for i in range(3):
+            self.article.add_event(self.user, f"event {i}")
+
+    def render(self, limit):
+        panel = RecentEventsPanel("events", limit=limit).bind_to_model(Article)
+        return panel.get_bound_panel(instance=self.article).content
+
+    def test_renders_only_recent_events(self):
+        with self.assertNumQueries(2):
+            content = self.render(limit=2)
+        self.assertIn("event 2", content)
+        self.assertIn("event 1", content)
+        self.assertNotIn("event 0", content)
+
+    def test_unsaved_article_has_no_events(self):
+        panel = RecentEventsPanel("events").bind_to_model(Article)
+        self.assertEqual("", panel.get_bound_panel(instance=Article()).content)
+
+
+class IterByCollectionTest(SimpleTestCase):
+    def items(self, builder):
+        items = {
+            "a": [{"pp_xml_id": 1}, {"pp_xml_id": 2}],
+            "b": [{"pp_xml_id": 2}, None, {"pp_xml_id": 3}],
+        }
+        return iter(items[builder.collection_acron_list[0]])
+
+    def run_builder(self, collection_acron_list=None):
+        builder = ArticleIteratorBuilder(
+            user=None, collection_acron_list=collection_acron_list
+        )
+        with patch("article.controller.Collection") as collection, patch.object(
+            ArticleIteratorBuilder,
+            "_iter_collection_items",
+            autospec=True,
+            side_effect=self.items,
+        ), patch.object(
+            ArticleIteratorBuilder, "_iter_from_article_source", return_value=iter([])
+        ), patch.object(
+            ArticleIteratorBuilder,
+            "_iter_without_collection",
+            return_value=iter([{"pp_xml_id": i} for i in range(1, 6)]),
+        ):
+            collection.objects.count.return_value = 2
+            collection.get_acronyms.return_value = ["a", "b"]
+            return list(builder.iter_by_collection())
+
+    def test_pp_xml_is_dispatched_once(self):
+        self.assertEqual(
+            [
+                ("a", {"pp_xml_id": 1}),
+                ("b", {"pp_xml_id": 2}),
+                ("b", None),
+                ("b", {"pp_xml_id": 3}),
+            ],
+            self.run_builder(["a", "b"]),
+        )
+
+    def test_items_without_collection_come_last(self):
+        self.assertEqual(
+            [
+                ("a", {"pp_xml_id": 1}),
+                ("b", {"pp_xml_id": 2}),
+                ("b", None),
+                ("b", {"pp_xml_id": 3}),
+                (None, {"pp_xml_id": 4}),
+                (None, {"pp_xml_id": 5}),
+            ],
+            self.run_builder(),
+        )
+
+
+class BulkExportArticlesToArticleMetaTest(SimpleTestCase):
+    def create_issue(self, issue_id):
+        issue = MagicMock(id=issue_id, year="2024")
+        issue.articlemeta_format.side_effect = lambda acron3: {
+            "code": f"issue-{issue_id}",
+            "issue": {"v31": [{"_": str(issue_id)}], "collection": acron3},
+            "code_title": [f"title-{issue_id}", None],
+            "title": {"v100": [{"_": f"Journal {issue_id}"}]},
+        }
+        return issue
+
+    def create_article(self, article_id, issue):
+        article = MagicMock(
+            id=article_id,
+            issue=issue,
+            issue_id=issue.id,
+            is_classic_public=True,
+            pid_v2=f"S{article_id:022d}",
+            article_type="research-article",
+            pub_date="2024-01-01",
+            created=datetime(2024, 1, 1),
+            updated=datetime(2024, 1, 2),
+        )
+        article.new_available.return_value.exists.return_value = False
+        article.get_legacy_keys.return_value = [
+            {"collection": self.collection, "pid": article.pid_v2}
+        ]
+        article.get_text_langs.return_value = {}
+        return article
+
+    def setUp(self):
+        self.collection = MagicMock(acron3="scl")
+        self.issues = [self.create_issue(1), self.create_issue(2)]
+        self.articles = [
+            self.create_article(article_id, self.issues[issue_index])
+            for article_id, issue_index in [(1, 0), (2, 0), (3, 0), (4, 1), (5, 1)]
+        ]
+
+    def test_issue_data_is_built_once_per_issue(self):
+        written = []
+
+        def write_item(collection, data):
+            written.append((data["code"], data["code_issue"], data["issue"]["v31"]))
+            # write_item altera o documento (convert_dates)
+            data["issue"]["v31"] = "changed"
+
+        queryset = MagicMock()
+        queryset.select_related.return_value.order_by.return_value.iterator.return_value = iter(
+            self.articles
+        )
+        with patch("article.controller.Article.select_items", return_value=queryset), patch(
+            "article.controller.am.build", side_effect=lambda xmltree, external_data: {"article": {"v40": "pt"}}
+        ), patch(
+            "article.controller.ArticleExporter.get_demand", return_value=MagicMock()
+        ), patch(
+            "article.controller.write_item", side_effect=write_item
+        ), patch(
+            "article.controller.UnexpectedEvent"
+        ) as unexpected_event:
+            self.assertTrue(bulk_export_articles_to_articlemeta(user=None))
+
+        unexpected_event.create.assert_not_called()
+        for issue in self.issues:
+            issue.articlemeta_format.assert_called_once_with("scl")
+        self.assertEqual(
+            [
+                (article.pid_v2, f"issue-{article.issue.id}", [{"_": str(article.issue.id)}])
+                for article in self.articles
+            ],
+            written,
+        )
@@ -0,0 +1,23 @@
+"""
+Benchmarks do pipeline de artigos
+
+Executa, em um banco de dados PostgreSQL de teste (criado e removido a
+cada execução) e sem acesso à rede, as etapas:
+
+    PidProviderXML.register, load_article, ArticleFormat.generate_formats,
+    export_article_to_articlemeta (mongomock, se instalado, ou MONGODB_URI)
+    e ArticleIndex.prepare
+
+com XMLs sintéticos gerados a partir de fixtures/*.xml, medindo
+documentos/segundo, consultas por documento e pico de memória (RSS).
+
+Uso:
+    python -m benchmarks --docs 50 --output benchmarks/results/$(git rev-parse --short HEAD).json
+
+O resultado é gravado em JSON para comparação entre commits. A execução
+termina com erro quando as consultas por documento excedem o orçamento
+de benchmarks/budgets.json ou quando não há orçamento para o caso
+(--update-budgets, ou make django_benchmark_budgets, regrava o orçamento
+com os valores medidos). Sem benchmarks/budgets.json, a verificação do
+orçamento é ignorada com um aviso.
+"""
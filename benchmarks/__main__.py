@@ -0,0 +1,74 @@
+import argparse
+import os
+import sys
+
+BUDGETS = os.path.join(os.path.dirname(__file__), "budgets.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--docs", type=int, default=50, help="documentos sintéticos")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cases", nargs="*", help="casos medidos (padrão: todos)")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--budgets", default=BUDGETS)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="fração tolerada acima do orçamento de consultas por documento",
+    )
+    parser.add_argument("--update-budgets", action="store_true")
+    parser.add_argument(
+        "--keepdb", action="store_true", help="reutiliza o banco de dados de teste"
+    )
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
+    import django
+
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    from .cases import PipelineBenchmark
+    from .runner import check_budgets, read_budgets, write_budgets, write_results
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, keepdb=args.keepdb)
+    try:
+        results = PipelineBenchmark(args.docs, args.seed, args.cases).run()
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=args.keepdb)
+        teardown_test_environment()
+
+    write_results(args.output, results, args.docs)
+    for result in results:
+        print(
+            f"{result['case']:<20} {result['docs_per_second'] or 0:>8} docs/s "
+            f"{result['queries_per_doc'] or 0:>8} queries/doc "
+            f"{result['peak_rss_mb']:>8} MB  errors: {result['errors']}"
+        )
+
+    if args.update_budgets:
+        write_budgets(args.budgets, results)
+        return 0
+
+    budgets = read_budgets(args.budgets)
+    if not budgets:
+        print(
+            f"WARNING no query budgets in {args.budgets}; budget check skipped "
+            "(run with --update-budgets on the reference commit and commit the file)",
+            file=sys.stderr,
+        )
+        return 0
+    failures = check_budgets(results, budgets, args.tolerance)
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Casos de benchmark: cada etapa usa a saída da anterior
+
+register -> load_article -> generate_formats -> export_articlemeta -> index_prepare
+"""
+
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+
+from article.controller import export_article_to_articlemeta
+from article.models import AMArticle, Article, ArticleAvailability, ArticleFormat
+from article.search_indexes import ArticleIndex
+from article.sources.xmlsps import load_article
+from collection.models import Collection
+from issue.models import Issue
+from journal.models import Journal, OfficialJournal
+from pid_provider.models import PidProviderXML
+
+from .runner import measure
+from .synthetic import synthetic_documents
+
+COLLECTION_ACRON = "scl"
+
+
+def mongodb_client():
+    """
+    mongomock, se instalado; caso contrário, o MongoDB de settings.MONGODB_URI
+    """
+    try:
+        import mongomock
+    except ImportError:
+        return None
+    return mongomock.MongoClient()
+
+
+class PipelineBenchmark:
+    def __init__(self, docs, seed=0, cases=None):
+        self.docs = docs
+        self.seed = seed
+        self.cases = cases
+        self.results = []
+
+    def setup(self):
+        """
+        Dados de apoio (coleção, periódico, fascículo) dos XMLs de fixtures
+        """
+        User = get_user_model()
+        self.user, _ = User.objects.get_or_create(username="benchmark")
+        self.collection = Collection.objects.create(
+            acron3=COLLECTION_ACRON, is_active=True, creator=self.user
+        )
+        official = OfficialJournal.create_or_update(
+            self.user,
+            issn_print="0103-636X",
+            issn_electronic="1980-4415",
+            title="Bolema: Boletim de Educação Matemática",
+        )
+        self.journal = Journal.create_or_update(
+            self.user, official, title="Bolema: Boletim de Educação Matemática"
+        )
+        Issue.create(
+            self.user,
+            self.journal,
+            number="72",
+            volume="36",
+            season="Jan-Apr",
+            year="2022",
+            month=None,
+            supplement=None,
+        )
+
+    def enabled(self, case):
+        return not self.cases or case in self.cases
+
+    def run_case(self, case, items, func):
+        result, outputs = measure(case, items, func)
+        if self.enabled(case):
+            self.results.append(result)
+        return outputs
+
+    def run(self):
+        self.setup()
+        documents = list(synthetic_documents(self.docs, seed=self.seed))
+
+        registered = self.run_case(
+            "register",
+            documents,
+            lambda doc: PidProviderXML.register(
+                xml_with_pre=doc[1], filename=doc[0], user=self.user
+            ),
+        )
+        v3_list = [response.get("v3") for response in registered if response]
+        pp_xmls = list(PidProviderXML.objects.filter(v3__in=v3_list))
+
+        loaded = self.run_case(
+            "load_article",
+            pp_xmls,
+            lambda pp_xml: load_article(self.user, pp_xml=pp_xml),
+        )
+        article_ids = [article.pk for article in loaded if article]
+
+        self.run_case(
+            "generate_formats",
+            list(Article.objects.filter(pk__in=article_ids)),
+            lambda article: ArticleFormat.generate_formats(self.user, article),
+        )
+
+        articles = list(Article.objects.filter(pk__in=article_ids))
+        self.make_exportable(articles)
+        with ExitStack() as stack:
+            client = mongodb_client()
+            if client:
+                stack.enter_context(
+                    patch("core.mongodb.get_client", return_value=client)
+                )
+            self.run_case(
+                "export_articlemeta",
+                articles,
+                lambda article: export_article_to_articlemeta(
+                    self.user,
+                    article,
+                    collection_acron_list=[COLLECTION_ACRON],
+                    force_update=True,
+                ),
+            )
+
+        index = ArticleIndex()
+        self.run_case(
+            "index_prepare",
+            list(Article.objects.filter(pk__in=article_ids)),
+            index.prepare,
+        )
+        return self.results
+
+    def make_exportable(self, articles):
+        """
+        Disponibilidade no site clássico e chaves legadas, exigidas por
+        export_article_to_articlemeta (fora da medição)
+        """
+        ArticleAvailability.objects.bulk_create(
+            [
+                ArticleAvailability(
+                    article=article,
+                    collection=self.collection,
+                    url=(
+                        "https://www.scielo.br/scielo.php?script=sci_arttext"
+                        f"&pid={article.pid_v2}"
+                    ),
+                    available=True,
+                    fmt="html",
+                    creator=self.user,
+                )
+                for article in articles
+            ]
+        )
+        AMArticle.objects.bulk_create(
+            [
+                AMArticle(
+                    pid=article.pid_v2,
+                    collection=self.collection,
+                    new_record=article,
+                    creator=self.user,
+                )
+                for article in articles
+            ]
+        )
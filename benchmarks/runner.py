@@ -0,0 +1,128 @@
+"""
+Medição dos casos de benchmark e comparação com o orçamento de consultas
+"""
+
+import json
+import logging
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from django.db import connection
+
+from core.utils.profiling_tools import QueryStats
+
+
+def peak_rss_mb():
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB; macOS: bytes
+    return usage / (1024 * 1024) if sys.platform == "darwin" else usage / 1024
+
+
+def measure(case, items, func):
+    """
+    Executa func para cada item, contando as consultas com
+    connection.execute_wrapper
+
+    Retorna (resultado da medição, lista de retornos de func; None nos erros)
+    """
+    stats = QueryStats(top_n=0)
+    outputs = []
+    errors = 0
+    start = time.perf_counter()
+    with connection.execute_wrapper(stats):
+        for item in items:
+            try:
+                outputs.append(func(item))
+            except Exception as e:
+                logging.exception(f"benchmark {case}: {e}")
+                outputs.append(None)
+                errors += 1
+    seconds = time.perf_counter() - start
+    docs = len(outputs)
+    return (
+        {
+            "case": case,
+            "docs": docs,
+            "errors": errors,
+            "seconds": round(seconds, 4),
+            "docs_per_second": round(docs / seconds, 2) if seconds else None,
+            "queries": stats.count,
+            "queries_per_doc": round(stats.count / docs, 2) if docs else None,
+            "db_seconds": round(stats.duration, 4),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        },
+        outputs,
+    )
+
+
+def check_budgets(results, budgets, tolerance=0.0):
+    """
+    Retorna a lista de mensagens dos casos que excedem o orçamento de
+    consultas por documento, que não têm orçamento ou que falharam em
+    todos os documentos
+    """
+    failures = []
+    for result in results:
+        if result["docs"] and result["errors"] == result["docs"]:
+            failures.append(f"{result['case']}: all documents failed")
+            continue
+        budget = budgets.get(result["case"])
+        if budget is None:
+            failures.append(f"{result['case']}: no query budget")
+            continue
+        if result["queries_per_doc"] is None:
+            continue
+        limit = budget * (1 + tolerance)
+        if result["queries_per_doc"] > limit:
+            failures.append(
+                f"{result['case']}: {result['queries_per_doc']} queries/doc "
+                f"(budget {budget}, limit {limit:.2f})"
+            )
+    return failures
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path, results, docs):
+    data = {
+        "commit": git_revision(),
+        "date": datetime.now(timezone.utc).isoformat(),
+        "docs": docs,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(data, fp, indent=2)
+    return data
+
+
+def read_budgets(path):
+    try:
+        with open(path, encoding="utf-8") as fp:
+            return json.load(fp)
+    except FileNotFoundError:
+        return {}
+
+
+def write_budgets(path, results):
+    budgets = {
+        result["case"]: result["queries_per_doc"]
+        for result in results
+        if result["queries_per_doc"] is not None
+    }
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(budgets, fp, indent=2, sort_keys=True)
+        fp.write("\n")
+    return budgets
@@ -0,0 +1,61 @@
+"""
+XMLs SciELO sintéticos gerados a partir de fixtures/*.xml
+
+Cada documento recebe PIDs (v3, v2), DOI, paginação e título próprios,
+para que seja registrado como um novo documento.
+"""
+
+import glob
+import random
+import string
+
+from lxml import etree
+from packtools.sps.pid_provider.xml_sps_lib import XMLWithPre
+
+FIXTURES = "fixtures/*.xml"
+
+V3_CHARS = string.ascii_letters + string.digits
+
+
+def _set_text(xmltree, xpath, value):
+    for node in xmltree.xpath(xpath):
+        node.text = value
+
+
+def make_document(template, seq, rng):
+    """
+    Retorna (nome do arquivo, XMLWithPre) do documento seq
+    """
+    xmltree = etree.fromstring(etree.tostring(template))
+    meta = ".//article-meta"
+    v3 = "".join(rng.choice(V3_CHARS) for _ in range(23))
+    _set_text(xmltree, f"{meta}/article-id[@specific-use='scielo-v3']", v3)
+    for node in xmltree.xpath(f"{meta}/article-id[@specific-use='scielo-v2']"):
+        node.text = f"{(node.text or 'S0000-00002000000100001')[:18]}{seq:05d}"
+    _set_text(
+        xmltree,
+        f"{meta}/article-id[@pub-id-type='publisher-id' and not(@specific-use)]",
+        f"bench-{seq:05d}",
+    )
+    _set_text(xmltree, f"{meta}/article-id[@pub-id-type='doi']", f"10.1590/bench.{seq:05d}")
+    _set_text(xmltree, f"{meta}/article-id[@pub-id-type='other']", f"{seq:05d}")
+    _set_text(xmltree, f"{meta}/fpage", str(seq))
+    _set_text(xmltree, f"{meta}/lpage", str(seq))
+    for node in xmltree.xpath(f"{meta}/title-group/article-title"):
+        node.text = f"{(node.text or '').strip()} {seq} "
+    return f"bench-{seq:05d}.xml", XMLWithPre("", xmltree)
+
+
+def synthetic_documents(total, pattern=FIXTURES, seed=0):
+    """
+    Gera total documentos, alternando entre os arquivos de pattern
+    """
+    templates = [
+        etree.parse(path, etree.XMLParser(remove_blank_text=True)).getroot()
+        for path in sorted(glob.glob(pattern))
+    ]
+    if not templates:
+        raise FileNotFoundError(f"No XML fixtures found: {pattern}")
+    rng = random.Random(seed)
+    for seq in range(1, total + 1):
+        yield make_document(templates[seq % len(templates)], seq, rng)
@@ -0,0 +1,54 @@
+from django.test import SimpleTestCase
+
+from .runner import check_budgets
+from .synthetic import synthetic_documents
+
+
+def result(case, queries_per_doc, docs=10, errors=0):
+    return {
+        "case": case,
+        "docs": docs,
+        "errors": errors,
+        "queries_per_doc": queries_per_doc,
+    }
+
+
+class CheckBudgetsTest(SimpleTestCase):
+    def test_within_budget(self):
+        results = [result("register", 10.5)]
+        self.assertEqual([], check_budgets(results, {"register": 10}, tolerance=0.1))
+
+    def test_over_budget(self):
+        results = [result("register", 12)]
+        failures = check_budgets(results, {"register": 10}, tolerance=0.1)
+        self.assertEqual(1, len(failures))
+        self.assertIn("register", failures[0])
+
+    def test_all_documents_failed(self):
+        results = [result("load_article", 1, docs=5, errors=5)]
+        self.assertEqual(
+            ["load_article: all documents failed"], check_budgets(results, {})
+        )
+
+    def test_case_without_budget(self):
+        self.assertEqual(
+            ["index_prepare: no query budget"],
+            check_budgets([result("index_prepare", 100)], {"register": 10}),
+        )
+
+
+class SyntheticDocumentsTest(SimpleTestCase):
+    def test_documents_have_distinct_pids(self):
+        documents = list(synthetic_documents(3))
+        ids = set()
+        for filename, xml_with_pre in documents:
+            xmltree = xml_with_pre.xmltree
+            v3 = xmltree.findtext(".//article-id[@specific-use='scielo-v3']")
+            v2 = xmltree.findtext(".//article-id[@specific-use='scielo-v2']")
+            doi = xmltree.findtext(".//article-id[@pub-id-type='doi']")
+            self.assertEqual(23, len(v3))
+            self.assertEqual(23, len(v2))
+            ids.add((v3, v2, doi, filename))
+        self.assertEqual(3, len({item[0] for item in ids}))
+        self.assertEqual(3, len({item[1] for item in ids}))
+        self.assertEqual(3, len({item[2] for item in ids}))
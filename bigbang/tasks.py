@@ -3,6 +3,7 @@ import sys
 
 from django.contrib.auth import get_user_model
 
+from article.models import AMArticle
 from bigbang.tasks_scheduler import schedule_tasks, delete_outdated_tasks
 from bigbang.utils.scheduler import schedule_task
 from collection.models import Collection
@@ -10,7 +11,9 @@ from config import celery_app
 from core.models import Gender, Language, License
 from editorialboard.models import RoleModel
 from institution.models import Institution, InstitutionType
+from issue.models import AMIssue
 from journal.models import (
+    AMJournal,
     DigitalPreservationAgency,
     IndexedAt,
     Standard,
@@ -96,3 +99,25 @@ def task_create_tasks(self, user_id=None, username=None, tasks_data=None):
 @celery_app.task(bind=True)
 def task_delete_outdated_tasks(self, user_id=None, username=None, task_list=None):
     return delete_outdated_tasks(task_list)
+
+
+@celery_app.task(bind=True)
+def task_delete_orphan_legacy_records(self, user_id=None, username=None):
+    """
+    Apaga AMJournal, AMIssue e AMArticle sem url e sem data
+    """
+    deleted = {}
+    for model in (AMJournal, AMIssue, AMArticle):
+        try:
+            deleted[model.__name__] = model.delete_orphans()
+        except Exception as e:
+            exc_type, exc_value, exc_traceback = sys.exc_info()
+            UnexpectedEvent.create(
+                exception=e,
+                exc_traceback=exc_traceback,
+                detail={
+                    "task": "bigbang.tasks.task_delete_orphan_legacy_records",
+                    "model": model.__name__,
+                },
+            )
+    return deleted
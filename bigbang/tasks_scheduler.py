@@ -109,6 +109,8 @@ def schedule_tasks(username):
 
     # Tarefas de bigbang
     schedule_bigbang_start(username, enabled)
+    schedule_delete_orphan_legacy_records(username, enabled)
+    schedule_maintain_event_partitions(username, enabled)
 
 
 # ==============================================================================
@@ -263,6 +265,51 @@ def schedule_bigbang_delete_outdated_tasks(username, enabled=False):
     )
 
 
+def schedule_delete_orphan_legacy_records(username, enabled=False):
+    """
+    Agenda a tarefa de limpeza dos registros legados (AMJournal, AMIssue,
+    AMArticle) sem url e sem data
+    """
+    schedule_task(
+        task="bigbang.tasks.task_delete_orphan_legacy_records",
+        name="bigbang.tasks.task_delete_orphan_legacy_records",
+        kwargs=dict(
+            username=username,
+            user_id=None,
+        ),
+        description=_("Delete orphan legacy records"),
+        priority=10,
+        enabled=enabled,
+        run_once=False,
+        day_of_week="*",
+        hour="4",
+        minute="0",
+    )
+
+
+def schedule_maintain_event_partitions(username, enabled=False):
+    """
+    Agenda a manutenção das partições mensais das tabelas de eventos
+    (UnexpectedEvent, Hello, ArticleEvent): cria as dos próximos meses e
+    remove as que saíram do prazo de retenção
+    """
+    schedule_task(
+        task="tracker.tasks.task_maintain_event_partitions",
+        name="tracker.tasks.task_maintain_event_partitions",
+        kwargs=dict(
+            username=username,
+            user_id=None,
+        ),
+        description=_("Maintain event table partitions"),
+        priority=10,
+        enabled=enabled,
+        run_once=False,
+        day_of_week="*",
+        hour="4",
+        minute="30",
+    )
+
+
 # ==============================================================================
 # TAREFAS DE JOURNAL
 # ==============================================================================
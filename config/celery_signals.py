@@ -1,8 +1,28 @@
 # myproject/celery_signals.py (ou myproject/utils/celery_signals.py)
 
-from celery.signals import worker_process_init, task_prerun, task_postrun
-from django.db import close_old_connections
+from celery.signals import (
+    before_task_publish,
+    task_failure,
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+)
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.db.backends.signals import connection_created
 import logging
+import os
+import time
+
+from core.utils import db_connections, fair_share, tracing
+from core.utils.metrics import (
+    CELERY_TASK_SECONDS,
+    CELERY_TASKS_IN_PROGRESS,
+    mark_process_dead,
+    start_worker_metrics_server,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +39,134 @@ def close_connections(**kwargs):
     """Fecha conexões quando o worker é iniciado"""
     _close_old_connections()
 
+
+connection_created.connect(db_connections.connection_opened)
+
+
 @task_prerun.connect
 def close_connections_task_prerun(**kwargs):
-    """Fecha conexões antes de cada task"""
-    _close_old_connections()
+    """
+    Fecha conexões antes de cada task ou, no modo "persistent", fecha
+    apenas as que não passarem no teste (core.utils.db_connections)
+    """
+    try:
+        db_connections.before_task()
+    except Exception as e:
+        logger.error(f"Erro ao verificar conexões de banco de dados antes da tarefa Celery: {e}")
+
 
 @task_postrun.connect
-def close_connections_task_postrun(**kwargs):
-    _close_old_connections()
+def flush_unexpected_events(**kwargs):
+    """Grava os UnexpectedEvent acumulados pela task"""
+    from tracker.models import unexpected_event_recorder
+
+    unexpected_event_recorder.flush()
+
+
+@task_postrun.connect
+def close_connections_task_postrun(state=None, **kwargs):
+    try:
+        db_connections.after_task(failed=state != "SUCCESS")
+    except Exception as e:
+        logger.error(f"Erro ao fechar conexões de banco de dados após a tarefa Celery: {e}")
+
+
+# métricas Prometheus (core.utils.metrics)
+_task_started = {}
+
+
+@task_prerun.connect
+def track_task_prerun(task_id=None, task=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+    CELERY_TASKS_IN_PROGRESS.labels(task.name).inc()
+    # espera na fila por coleção (core.utils.fair_share); tarefas com vaga
+    # por coleção registram o início ao obter a vaga
+    if not getattr(task, "fair_share_slot", False):
+        fair_share.record_task_start(task.request)
+
+
+@task_postrun.connect
+def track_task_postrun(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    CELERY_TASKS_IN_PROGRESS.labels(task.name).dec()
+    if started is not None:
+        CELERY_TASK_SECONDS.labels(task.name, state or "UNKNOWN").observe(
+            time.perf_counter() - started
+        )
+
+
+@worker_init.connect
+def start_metrics_server(sender=None, **kwargs):
+    """Servidor de métricas do worker, na porta CELERY_METRICS_PORT"""
+    port = os.environ.get("CELERY_METRICS_PORT")
+    if port:
+        start_worker_metrics_server(sender.app, int(port))
+
+
+@worker_process_shutdown.connect
+def mark_worker_process_dead(pid=None, **kwargs):
+    mark_process_dead(pid or os.getpid())
+
+
+# tracing (core.utils.tracing): o contexto segue no cabeçalho traceparent
+_task_spans = {}
+
+
+def _task_traceparent(task):
+    request = task.request
+    return getattr(request, tracing.TRACEPARENT_HEADER, None) or (
+        getattr(request, "headers", None) or {}
+    ).get(tracing.TRACEPARENT_HEADER)
+
+
+@before_task_publish.connect
+def inject_trace_context(headers=None, **kwargs):
+    traceparent = tracing.current_traceparent()
+    if traceparent and headers is not None:
+        headers.setdefault(tracing.TRACEPARENT_HEADER, traceparent)
+
+
+@task_prerun.connect
+def start_task_span(task_id=None, task=None, **kwargs):
+    if not tracing.is_enabled():
+        return
+    item = tracing.start_span(
+        f"celery.task {task.name}",
+        {"celery.task_id": task_id, "celery.task_name": task.name},
+        parent=_task_traceparent(task),
+    )
+    token = tracing.activate(item)
+    trace_queries = getattr(settings, "TRACING_DB_QUERIES", True)
+    if trace_queries:
+        connection.execute_wrappers.append(tracing.trace_query)
+    _task_spans[task_id] = (item, token, trace_queries)
+
+
+@task_failure.connect
+def record_task_exception(task_id=None, exception=None, **kwargs):
+    entry = _task_spans.get(task_id)
+    if entry and exception is not None:
+        entry[0].record_exception(exception)
+
+
+@task_postrun.connect
+def end_task_span(task_id=None, state=None, **kwargs):
+    entry = _task_spans.pop(task_id, None)
+    if not entry:
+        return
+    item, token, trace_queries = entry
+    if trace_queries and tracing.trace_query in connection.execute_wrappers:
+        connection.execute_wrappers.remove(tracing.trace_query)
+    item.set_attribute("celery.state", state)
+    try:
+        tracing.deactivate(token)
+    except ValueError:
+        pass
+    # exportado em lote (TRACING_BATCH_SIZE / TRACING_FLUSH_INTERVAL)
+    item.end()
+
+
+@worker_process_shutdown.connect
+def flush_trace_spans(**kwargs):
+    """Grava os spans pendentes: atexit não é executado nos processos filhos"""
+    tracing.flush()
@@ -379,10 +379,27 @@ CELERY_TASK_TIME_LIMIT = 5 * 60
 # http://docs.celeryproject.org/en/latest/userguide/configuration.html#task-soft-time-limit
 # TODO: set to whatever value is adequate in your circumstances
 CELERY_TASK_SOFT_TIME_LIMIT = 36000
+# filas por família de tarefas (core.utils.fair_share); os workers consomem
+# CELERY_WORKER_QUEUES (compose/*/django/celery/worker/start)
+CELERY_TASK_ROUTES = {
+    "pid_provider.tasks.task_provide_pid_for_xml_zip": {"queue": "pid_provider"},
+    "article.tasks.task_export_article_to_articlemeta": {"queue": "export"},
+    "article.tasks.task_export_articles_to_articlemeta": {"queue": "export"},
+    "task_export_issue_to_articlemeta": {"queue": "export"},
+    "task_export_issues_to_articlemeta": {"queue": "export"},
+    "task_export_journal_to_articlemeta": {"queue": "export"},
+    "task_export_journals_to_articlemeta": {"queue": "export"},
+    "article.tasks.task_process_article_pipeline": {"queue": "pipeline"},
+}
 # http://docs.celeryproject.org/en/latest/userguide/configuration.html#beat-scheduler
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 # http://docs.celeryproject.org/en/latest/userguide/configuration.html
 DJANGO_CELERY_BEAT_TZ_AWARE = False
+# intervalo mínimo (segundos) entre as consultas do beat por mudanças nas
+# tarefas periódicas (django_celery_beat.schedulers.DatabaseScheduler)
+DJANGO_CELERY_BEAT_CHANGE_CHECK_INTERVAL = env.float(
+    "DJANGO_CELERY_BEAT_CHANGE_CHECK_INTERVAL", default=5
+)
 #CELERY PROMETHEUS DASHBOARD
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-send-task-events
 CELERY_WORKER_SEND_TASK_EVENTS = True
@@ -500,7 +517,7 @@ HAYSTACK_ROUTERS = [
 USE_SOLR = env.bool("USE_SOLR", default=False)
 
 if USE_SOLR:
-    HAYSTACK_SIGNAL_PROCESSOR = "haystack.signals.RealtimeSignalProcessor"
+    HAYSTACK_SIGNAL_PROCESSOR = "core.search_signals.MeasuredRealtimeSignalProcessor"
 
 SEARCH_PAGINATION_ITEMS_PER_PAGE = 10
 
@@ -579,7 +596,91 @@ PROFILING_ENABLED = env.bool('DJANGO_PROFILING_ENABLED', default=False)
 PROFILING_LOG_SLOW_REQUESTS = env.float('DJANGO_PROFILING_LOG_SLOW_REQUESTS', default=0.2)
 PROFILING_LOG_HIGH_MEMORY = env.int('DJANGO_PROFILING_LOG_HIGH_MEMORY', default=20)
 PROFILING_LOG_ALL = env.bool('DJANGO_PROFILING_LOG_ALL', default=True)
+# fração das chamadas medidas; consultas contadas via connection.execute_wrapper
+PROFILING_SAMPLE_RATE = env.float('DJANGO_PROFILING_SAMPLE_RATE', default=1.0)
+PROFILING_TOP_QUERIES = env.int('DJANGO_PROFILING_TOP_QUERIES', default=3)
+PROFILING_TRACK_MEMORY = env.bool('DJANGO_PROFILING_TRACK_MEMORY', default=False)
+
+# UNEXPECTED EVENTS (tracker.models.UnexpectedEventRecorder)
+# eventos repetidos são agregados e gravados em lote; desativado por padrão
+# até que as chamadas de UnexpectedEvent.create informem action / item
+UNEXPECTED_EVENT_BUFFERED = env.bool("UNEXPECTED_EVENT_BUFFERED", default=False)
+UNEXPECTED_EVENT_BATCH_SIZE = env.int("UNEXPECTED_EVENT_BATCH_SIZE", default=100)
+UNEXPECTED_EVENT_FLUSH_INTERVAL = env.int("UNEXPECTED_EVENT_FLUSH_INTERVAL", default=10)
+# segundos em que repetições são somadas ao mesmo registro
+UNEXPECTED_EVENT_AGGREGATION_WINDOW = env.int(
+    "UNEXPECTED_EVENT_AGGREGATION_WINDOW", default=3600
+)
+UNEXPECTED_EVENT_MAX_DETAIL_SIZE = env.int(
+    "UNEXPECTED_EVENT_MAX_DETAIL_SIZE", default=20000
+)
+
+# IDEMPOTÊNCIA (core.utils.idempotency): lock por documento no cache e
+# marcação dos documentos processados recentemente (0 desativa)
+DOCUMENT_LOCK_TTL = env.int("DOCUMENT_LOCK_TTL", default=600)
+DOCUMENT_LOCK_RETRY_DELAY = env.int("DOCUMENT_LOCK_RETRY_DELAY", default=60)
+DOCUMENT_COMPLETED_TTL = env.int("DOCUMENT_COMPLETED_TTL", default=600)
+
+# FAIR SHARE (core.utils.fair_share): rodízio ponderado entre coleções no
+# despacho do pipeline e limite de tarefas simultâneas por coleção (0: sem
+# limite); ex.: PIPELINE_COLLECTION_WEIGHTS=scl=1,arg=2
+PIPELINE_COLLECTION_WEIGHTS = env.dict(
+    "PIPELINE_COLLECTION_WEIGHTS", cast={"value": int}, default={}
+)
+PIPELINE_COLLECTION_CONCURRENCY = env.int("PIPELINE_COLLECTION_CONCURRENCY", default=0)
+PIPELINE_COLLECTION_CONCURRENCY_LIMITS = env.dict(
+    "PIPELINE_COLLECTION_CONCURRENCY_LIMITS", cast={"value": int}, default={}
+)
+PIPELINE_COLLECTION_RETRY_DELAY = env.int("PIPELINE_COLLECTION_RETRY_DELAY", default=30)
+
+# EVENT TABLES (core.utils.partitioning): partições mensais; as que saem
+# do prazo de retenção são removidas inteiras (0 mantém tudo)
+EVENT_RETENTION_MONTHS = {
+    "tracker.UnexpectedEvent": env.int("UNEXPECTED_EVENT_RETENTION_MONTHS", default=6),
+    "tracker.Hello": env.int("HELLO_RETENTION_MONTHS", default=1),
+    "article.ArticleEvent": env.int("ARTICLE_EVENT_RETENTION_MONTHS", default=12),
+}
+EVENT_PARTITION_MONTHS_AHEAD = env.int("EVENT_PARTITION_MONTHS_AHEAD", default=3)
+# dias listados por padrão no admin dos eventos
+EVENT_ADMIN_RECENT_DAYS = env.int("EVENT_ADMIN_RECENT_DAYS", default=30)
+# eventos exibidos no formulário de edição (core.panels.RecentEventsPanel)
+EVENTS_PANEL_LIMIT = env.int("EVENTS_PANEL_LIMIT", default=20)
+
+# TRACING (core.utils.tracing): spans em JSON OTLP, em arquivo ou coletor
+TRACING_ENABLED = env.bool("TRACING_ENABLED", default=False)
+TRACING_SAMPLE_RATE = env.float("TRACING_SAMPLE_RATE", default=1.0)
+# "file" ou "otlp"
+TRACING_EXPORTER = env.str("TRACING_EXPORTER", default="file")
+TRACING_FILE = env.str("TRACING_FILE", default=str(ROOT_DIR / "traces.jsonl"))
+TRACING_OTLP_ENDPOINT = env.str(
+    "TRACING_OTLP_ENDPOINT", default="http://localhost:4318/v1/traces"
+)
+TRACING_DB_QUERIES = env.bool("TRACING_DB_QUERIES", default=True)
+TRACING_SERVICE_NAME = env.str("TRACING_SERVICE_NAME", default="scielo-core")
 
 
 # LINK TO OLD SCIELO
-SCIELO_OLD_URL = env.str("SCIELO_OLD_URL", default="http://old.scielo.org/")
\ No newline at end of file
+SCIELO_OLD_URL = env.str("SCIELO_OLD_URL", default="http://old.scielo.org/")
+# GAZETTEER (índice em memória de City, State, Country e Location)
+LOCATION_GAZETTEER_ENABLED = env.bool("LOCATION_GAZETTEER_ENABLED", default=True)
+# segundos até recarregar o índice (alterações feitas por outros processos)
+LOCATION_GAZETTEER_TTL = env.int("LOCATION_GAZETTEER_TTL", default=600)
+# VALIDAÇÃO DE CSV (core.utils.csv_validator)
+# número máximo de erros reportados antes de interromper a validação
+CSV_VALIDATION_MAX_ERRORS = env.int("CSV_VALIDATION_MAX_ERRORS", default=20)
+# processos para validar arquivos grandes (0 ou 1 desativa)
+CSV_VALIDATION_PROCESSES = env.int("CSV_VALIDATION_PROCESSES", default=0)
+CSV_VALIDATION_PARALLEL_MIN_SIZE = env.int(
+    "CSV_VALIDATION_PARALLEL_MIN_SIZE", default=20 * 1024 * 1024
+)
+CSV_VALIDATION_CHUNK_SIZE = env.int("CSV_VALIDATION_CHUNK_SIZE", default=5000)
+# IMPORTAÇÃO DE CSV (core_settings): linhas por subtarefa
+CSV_IMPORT_CHUNK_SIZE = env.int("CSV_IMPORT_CHUNK_SIZE", default=1000)
+# CONEXÕES DOS WORKERS CELERY (core.utils.db_connections)
+# "close" (fecha as conexões a cada tarefa) ou "persistent"
+WORKER_DB_CONNECTION_MODE = env.str("WORKER_DB_CONNECTION_MODE", default="close")
+# segundos de ociosidade a partir dos quais a conexão é testada antes da tarefa
+WORKER_DB_HEALTH_CHECK_IDLE = env.int("WORKER_DB_HEALTH_CHECK_IDLE", default=30)
+# tarefas / segundos até a conexão ser reaberta (0 desativa)
+WORKER_DB_RECYCLE_TASKS = env.int("WORKER_DB_RECYCLE_TASKS", default=1000)
+WORKER_DB_MAX_AGE = env.int("WORKER_DB_MAX_AGE", default=3600)
@@ -17,6 +17,11 @@ DATABASES["default"]["ATOMIC_REQUESTS"] = True  # noqa F405
 DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=0) or env.int("DJANGO_CONN_MAX_AGE", default=60)  # noqa F405
 DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool('DJANGO_CONN_HEALTH_CHECKS', True)
 DATABASES["default"]["ENGINE"] = 'django_prometheus.db.backends.postgresql'
+# com pooler em modo transaction (CELERY_DATABASE_URL no worker), cursores
+# do lado do servidor não funcionam
+DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = env.bool(  # noqa F405
+    "DJANGO_DISABLE_SERVER_SIDE_CURSORS", default=False
+)
 # Melhoria: Usando variáveis de ambiente para OPTIONS e POOL_OPTIONS com defaults
 DATABASES["default"]["OPTIONS"] = {
     "connect_timeout": env.int("DB_CONNECT_TIMEOUT", default=10),
@@ -28,6 +33,8 @@ DATABASES["default"]["POOL_OPTIONS"] = {
     'RECYCLE': env.int("DB_RECYCLE", default=300),
     # Adicione outras opções do pool aqui se necessário
 }
+# conexões mantidas entre as tarefas dos workers Celery (core.utils.db_connections)
+WORKER_DB_CONNECTION_MODE = env.str("WORKER_DB_CONNECTION_MODE", default="persistent")
 # CACHES
 # ------------------------------------------------------------------------------
 CACHES = {
@@ -28,3 +28,8 @@ EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
 # Your stuff...
 # ------------------------------------------------------------------------------
+# o índice em memória construído dentro da transação de um teste guardaria
+# registros desfeitos no rollback; location.tests.GazetteerTest o habilita
+LOCATION_GAZETTEER_ENABLED = False
+# os testes consultam os UnexpectedEvent logo após o registro
+UNEXPECTED_EVENT_BUFFERED = False
@@ -33,3 +33,20 @@ class LicenseSerializer(serializers.ModelSerializer):
             "license_type",
             "version",
         ]
+
+
+class SparseFieldsetsMixin:
+    """
+    Permite que o cliente restrinja os campos serializados.
+
+    Os campos desejados são informados no contexto do serializer
+    (``context["fields"]``); os demais são removidos antes da serialização,
+    evitando acessar relacionamentos que o cliente não pediu.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.context.get("fields")
+        if requested:
+            for name in set(self.fields) - set(requested):
+                self.fields.pop(name)
@@ -1,11 +1,12 @@
 import csv
+import hashlib
 import json
 import os
 import logging
 from datetime import datetime
 
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError, models
+from django.db import IntegrityError, models, transaction
 from django.db.models import Case, IntegerField, Value, When
 from django.utils.html import strip_tags
 from django.utils.translation import gettext_lazy as _
@@ -18,6 +19,7 @@ from wagtailautocomplete.edit_handlers import AutocompletePanel
 
 from core import choices
 from core.forms import CoreAdminModelForm
+from core.utils.bulk_loader import bulk_load
 from core.utils.utils import language_iso
 
 User = get_user_model()
@@ -65,6 +67,30 @@ class CommonControlField(models.Model):
         abstract = True
 
 
+class DeferredPayloadQuerySet(models.QuerySet):
+    def with_payload(self):
+        """Inclui na consulta os campos que são adiados por padrão"""
+        return self.defer(None)
+
+
+class DeferredPayloadManager(models.Manager.from_queryset(DeferredPayloadQuerySet)):
+    """
+    Adia a leitura de campos JSON volumosos (ex.: data, detail)
+
+    Listagens e iterações não trazem estes campos do banco; o valor é
+    obtido somente quando o atributo é acessado. Use
+    ``Model.objects.with_payload()`` nos laços que leem estes campos.
+    No banco, as colunas usam compressão lz4 (ver migrações).
+    """
+
+    def __init__(self, *payload_fields):
+        super().__init__()
+        self.payload_fields = payload_fields
+
+    def get_queryset(self):
+        return super().get_queryset().defer(*self.payload_fields)
+
+
 class Gender(CommonControlField):
     """
     Class of gender
@@ -98,9 +124,12 @@ class Gender(CommonControlField):
 
     @classmethod
     def load(cls, user):
-        for item in choices.GENDER_CHOICES:
-            code, value = item
-            cls.create_or_update(user, code=code, gender=value)
+        bulk_load(
+            cls,
+            ({"code": code, "gender": value} for code, value in choices.GENDER_CHOICES),
+            user,
+            key_fields=["code", "gender"],
+        )
 
     @classmethod
     def _get(cls, code=None, gender=None):
@@ -175,8 +204,15 @@ class Language(CommonControlField):
     @classmethod
     def load(cls, user):
         if cls.objects.count() == 0:
-            for k, v in choices.LANGUAGE:
-                cls.get_or_create(name=v, code2=k, creator=user)
+            bulk_load(
+                cls,
+                (
+                    {"name": v, "code2": language_iso(k) or ""}
+                    for k, v in choices.LANGUAGE
+                ),
+                user,
+                key_fields=["code2", "name"],
+            )
 
     @staticmethod
     def get_instance(language):
@@ -612,8 +648,16 @@ class License(CommonControlField):
 
     @classmethod
     def load(cls, user):
-        for license_type, text in choices.LICENSE_TYPES:
-            cls.create_or_update(user, license_type, None)
+        bulk_load(
+            cls,
+            (
+                {"license_type": license_type, "version": None}
+                for license_type, text in choices.LICENSE_TYPES
+            ),
+            user,
+            key_fields=["license_type", "version"],
+            normalize=str.casefold,
+        )
 
     @classmethod
     def get(cls, license_type, version=None):
@@ -1055,6 +1099,12 @@ class BaseExporter(CommonControlField, ClusterableModel):
     detail = models.JSONField(null=True, blank=True)
     # se preencher, vai gerar histórico, se nunca preencher não mantém histórico
     version = models.CharField(_("Version"), max_length=26, null=True, blank=True)
+    # hash do último documento exportado com sucesso
+    content_hash = models.CharField(
+        _("Content hash"), max_length=64, null=True, blank=True
+    )
+
+    objects = DeferredPayloadManager("detail")
 
     def __str__(self):
         return f"{self.parent} {self.destination} {self.updated.isoformat()}"
@@ -1080,6 +1130,7 @@ class BaseExporter(CommonControlField, ClusterableModel):
 
         panels_events = [
             FieldPanel("status", read_only=True),
+            FieldPanel("content_hash", read_only=True),
             FieldPanel("detail", read_only=True),
         ]
 
@@ -1123,7 +1174,14 @@ class BaseExporter(CommonControlField, ClusterableModel):
         return obj
 
     def finish(
-        self, user, completed, events, response=None, errors=None, exceptions=None
+        self,
+        user,
+        completed,
+        events,
+        response=None,
+        errors=None,
+        exceptions=None,
+        content_hash=None,
     ):
         """Finaliza uma exportação com status e detalhes"""
         if errors or exceptions:
@@ -1132,6 +1190,7 @@ class BaseExporter(CommonControlField, ClusterableModel):
             completed = True
         if completed:
             self.status = choices.EXPORTATION_STATUS_DONE
+            self.content_hash = content_hash
         else:
             self.status = choices.EXPORTATION_STATUS_PENDING
 
@@ -1154,8 +1213,15 @@ class BaseExporter(CommonControlField, ClusterableModel):
     def response(self):
         return (self.detail or {}).get("response")
 
+    @staticmethod
+    def generate_content_hash(data):
+        """Hash do conteúdo do documento a ser exportado"""
+        return hashlib.sha256(
+            json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
     @classmethod
-    def is_exported(cls, parent, pid, destination, collection):
+    def is_exported(cls, parent, pid, destination, collection, content_hash=None):
         """
         Verifica se um objeto já foi exportado
 
@@ -1164,6 +1230,8 @@ class BaseExporter(CommonControlField, ClusterableModel):
             pid: Identificador único do objeto pai
             destination: Destino da exportação
             collection: Coleção
+            content_hash: se informado, considera exportado somente se o
+                último documento exportado tem o mesmo hash
         """
         filter_kwargs = {
             "pid": pid,
@@ -1172,11 +1240,23 @@ class BaseExporter(CommonControlField, ClusterableModel):
         }
 
         last_export = cls.objects.filter(**filter_kwargs).order_by("-updated").first()
-        return last_export and last_export.status == choices.EXPORTATION_STATUS_DONE
+        if not last_export or last_export.status != choices.EXPORTATION_STATUS_DONE:
+            return False
+        if content_hash:
+            return last_export.content_hash == content_hash
+        return True
 
     @classmethod
     def get_demand(
-        cls, user, parent, destination, pid, collection, version=None, force_update=None
+        cls,
+        user,
+        parent,
+        destination,
+        pid,
+        collection,
+        version=None,
+        force_update=None,
+        content_hash=None,
     ):
         """
         Exporta um objeto para uma única coleção.
@@ -1189,6 +1269,9 @@ class BaseExporter(CommonControlField, ClusterableModel):
             collection: Coleção
             version: Versão, somente se quiser manter histórico
             force_update: Forçar atualização mesmo se já exportado
+            content_hash: hash do documento a exportar; se informado, a
+                exportação só é demandada quando o conteúdo mudou desde a
+                última exportação (inclusive com force_update)
         """
         if not parent or not destination or not pid or not collection or not user:
             raise ValueError(
@@ -1196,6 +1279,10 @@ class BaseExporter(CommonControlField, ClusterableModel):
             )
         if isinstance(destination, str):
             destination = ExportDestination.get_or_create(destination, user)
+        if content_hash:
+            if cls.is_exported(parent, pid, destination, collection, content_hash):
+                return None
+            return cls.start(user, parent, pid, destination, collection, version)
         if force_update:
             # version = datetime.utcnow().isoformat()
             return cls.start(user, parent, pid, destination, collection, version)
@@ -1204,6 +1291,89 @@ class BaseExporter(CommonControlField, ClusterableModel):
             return cls.start(user, parent, pid, destination, collection, version)
 
 
+class BaseArticleMetaFormat(CommonControlField):
+    """
+    Classe base abstrata para o documento no formato ArticleMeta materializado
+    por coleção.
+
+    O documento é regenerado somente quando ``source_hash`` (calculado a partir
+    do estado do objeto de origem) muda ou quando o registro é invalidado
+    (apagado) por alteração em algum objeto relacionado.
+    """
+
+    collection = models.ForeignKey(
+        "collection.Collection",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name=_("Collection"),
+    )
+    source_hash = models.CharField(_("Source hash"), max_length=64)
+    data = models.JSONField(null=True, blank=True)
+
+    panels = [
+        FieldPanel("collection", read_only=True),
+        FieldPanel("source_hash", read_only=True),
+        FieldPanel("data", read_only=True),
+    ]
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return f"{self.parent} {self.collection}"
+
+    @staticmethod
+    def generate_source_hash(*items):
+        return hashlib.sha256(
+            "|".join(str(item) for item in items).encode("utf-8")
+        ).hexdigest()
+
+    @classmethod
+    def get_or_build(cls, parent, collection_acron3, source_hash, build, user=None):
+        """
+        Retorna o registro materializado de parent para a coleção,
+        regerando o documento com build() se source_hash mudou.
+        """
+        try:
+            obj = cls.objects.get(parent=parent, collection__acron3=collection_acron3)
+        except cls.DoesNotExist:
+            obj = None
+        except cls.MultipleObjectsReturned:
+            cls.objects.filter(
+                parent=parent, collection__acron3=collection_acron3
+            ).delete()
+            obj = None
+
+        if obj and obj.source_hash == source_hash:
+            return obj
+
+        if not obj:
+            from collection.models import Collection
+
+            obj = cls()
+            obj.parent = parent
+            obj.collection = Collection.get(collection_acron3)
+            obj.creator = user
+        else:
+            obj.updated_by = user
+
+        obj.data = build()
+        obj.source_hash = source_hash
+        try:
+            with transaction.atomic():
+                obj.save()
+        except IntegrityError:
+            # outro processo materializou o mesmo documento ao mesmo tempo
+            pass
+        return obj
+
+    @classmethod
+    def invalidate(cls, **filters):
+        """Apaga os documentos materializados, forçando a regeração"""
+        cls.objects.filter(**filters).delete()
+
+
 class BaseLegacyRecord(CommonControlField):
     """
     Modelo que representa a coleta de dados de genérica (para journal, issue e article) na API Article Meta.
@@ -1248,6 +1418,9 @@ class BaseLegacyRecord(CommonControlField):
         null=True,
         blank=True,
     )
+
+    objects = DeferredPayloadManager("data")
+
     base_form_class = CoreAdminModelForm
 
     panels = [
@@ -1272,14 +1445,22 @@ class BaseLegacyRecord(CommonControlField):
     def __str__(self):
         return f"{self.pid} | {self.collection}"
 
+    @classmethod
+    def delete_orphans(cls):
+        """
+        Apaga os registros sem url e sem data
+
+        Executado periodicamente (bigbang.tasks.task_delete_orphan_legacy_records)
+        """
+        deleted, _details = cls.objects.filter(
+            url__isnull=True, data__isnull=True
+        ).delete()
+        return deleted
+
     @classmethod
     def get(cls, pid, collection):
         if not pid and not collection:
             raise ValueError("Param pid and collection_acron3 is required")
-        try:
-            cls.objects.filter(url__isnull=True, data__isnull=True).delete()
-        except Exception:
-            pass
         try:
             return cls.objects.get(pid=pid, collection=collection)
         except cls.MultipleObjectsReturned:
@@ -1334,6 +1515,83 @@ class BaseLegacyRecord(CommonControlField):
         obj.save()
         return obj
 
+    @classmethod
+    def bulk_upsert(cls, records, user, force_update=None):
+        """
+        Cria ou atualiza vários registros com INSERT ... ON CONFLICT (pid, collection)
+
+        records: lista de dict com pid, collection e, opcionalmente,
+        data, url, status, processing_date e new_record, com o mesmo
+        significado dos parâmetros de create_or_update.
+
+        Mantém o comportamento de create_or_update: o registro existente
+        com o mesmo processing_date só é atualizado se force_update;
+        campos ausentes / vazios não sobrescrevem os valores existentes.
+        """
+        if not user:
+            raise ValueError(f"{cls.__name__}.bulk_upsert requires user")
+
+        items = {}
+        for record in records:
+            pid = record.get("pid")
+            collection = record.get("collection")
+            if not pid or not collection:
+                raise ValueError(
+                    f"{cls.__name__}.bulk_upsert requires pid {pid}, collection {collection}"
+                )
+            # o mesmo registro não pode ser afetado duas vezes pelo mesmo comando
+            items[(pid, collection.pk)] = record
+        if not items:
+            return []
+
+        if not force_update:
+            registered = cls.objects.filter(
+                pid__in={pid for pid, collection_id in items},
+                collection_id__in={collection_id for pid, collection_id in items},
+            ).values_list("pid", "collection_id", "processing_date")
+            for pid, collection_id, processing_date in registered.iterator():
+                record = items.get((pid, collection_id))
+                if (
+                    record
+                    and record.get("processing_date")
+                    and record["processing_date"] == processing_date
+                ):
+                    del items[(pid, collection_id)]
+
+        # agrupa pelos campos informados para não sobrescrever com nulo
+        groups = {}
+        for record in items.values():
+            fields = tuple(
+                name
+                for name in ("url", "data", "status", "processing_date")
+                if record.get(name)
+            )
+            if record.get("new_record") is not None:
+                fields += ("new_record",)
+            groups.setdefault(fields, []).append(record)
+
+        upserted = []
+        for fields, group in groups.items():
+            objs = [
+                cls(
+                    pid=record["pid"],
+                    collection=record["collection"],
+                    creator=user,
+                    updated_by=user,
+                    **{name: record[name] for name in fields},
+                )
+                for record in group
+            ]
+            upserted.extend(
+                cls.objects.bulk_create(
+                    objs,
+                    update_conflicts=True,
+                    unique_fields=["pid", "collection"],
+                    update_fields=list(fields) + ["updated", "updated_by"],
+                )
+            )
+        return upserted
+
     @property
     def legacy_keys(self):
         return {
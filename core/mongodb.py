@@ -4,6 +4,8 @@ import logging
 from django.conf import settings
 from pymongo import MongoClient
 
+from core.utils.tracing import span
+
 
 MONGODB_DATABASE = settings.MONGODB_DATABASE
 MONGODB_URI = settings.MONGODB_URI
@@ -48,7 +50,10 @@ def write_item(mongodb_collection_name, data, filter_query=None):
         update_data = {
             "$set": data,
         }
-        result = mongodb_collection.update_one(filter_query, update_data, upsert=True)
+        with span("mongodb.update_one", {"db.collection": mongodb_collection_name}):
+            result = mongodb_collection.update_one(
+                filter_query, update_data, upsert=True
+            )
         # O objeto UpdateResult contém:
         # result.matched_count      # Número de documentos que corresponderam ao filtro
         # result.modified_count      # Número de documentos que foram modificados
@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.utils.html import format_html, format_html_join
+from django.utils.translation import gettext as _
+from wagtail.admin.panels import HelpPanel
+
+
+class RecentEventsPanel(HelpPanel):
+    """
+    Lista, somente leitura, os eventos mais recentes de uma relação
+    (ex.: Article.events); ao contrário de InlinePanel, não carrega no
+    formulário todos os eventos guardados no prazo de retenção
+
+    RecentEventsPanel("events", limit=20)
+    limit: padrão settings.EVENTS_PANEL_LIMIT
+    """
+
+    def __init__(self, relation_name, limit=None, **kwargs):
+        super().__init__(**kwargs)
+        self.relation_name = relation_name
+        self.limit = limit
+
+    def clone_kwargs(self):
+        kwargs = super().clone_kwargs()
+        kwargs.update(relation_name=self.relation_name, limit=self.limit)
+        return kwargs
+
+    @property
+    def clean_name(self):
+        return self.relation_name
+
+    class BoundPanel(HelpPanel.BoundPanel):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.content = self.render_events()
+
+        def render_events(self):
+            if not getattr(self.instance, "pk", None):
+                return ""
+            limit = self.panel.limit or getattr(settings, "EVENTS_PANEL_LIMIT", 20)
+            events = getattr(self.instance, self.panel.relation_name).order_by(
+                "-created", "-id"
+            )
+            total = events.count()
+            if not total:
+                return format_html("<p>{}</p>", _("No events"))
+            rows = format_html_join(
+                "",
+                "<tr><td>{}</td><td>{}</td><td>{}</td></tr>",
+                (
+                    (event.created.strftime("%Y-%m-%d %H:%M:%S"), event.name, event.completed)
+                    for event in events.defer("detail")[:limit]
+                ),
+            )
+            return format_html(
+                "<p>{}</p><table class='listing'><thead><tr>"
+                "<th>{}</th><th>{}</th><th>{}</th></tr></thead><tbody>{}</tbody></table>",
+                _("Showing the %(shown)s most recent of %(total)s events")
+                % {"shown": min(limit, total), "total": total},
+                _("Creation date"),
+                _("Name"),
+                _("Completed"),
+                rows,
+            )
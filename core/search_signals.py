@@ -0,0 +1,28 @@
+from haystack.signals import RealtimeSignalProcessor
+
+from core.utils.metrics import track_stage
+
+
+class MeasuredRealtimeSignalProcessor(RealtimeSignalProcessor):
+    """
+    RealtimeSignalProcessor que registra a duração da indexação no Solr
+    (etapas solr_index / solr_delete de core.utils.metrics)
+    """
+
+    def is_indexed(self, sender):
+        return any(
+            sender in self.connections[using].get_unified_index().get_indexed_models()
+            for using in self.connection_router.for_write()
+        )
+
+    def handle_save(self, sender, instance, **kwargs):
+        if not self.is_indexed(sender):
+            return
+        with track_stage("solr_index"):
+            super().handle_save(sender, instance, **kwargs)
+
+    def handle_delete(self, sender, instance, **kwargs):
+        if not self.is_indexed(sender):
+            return
+        with track_stage("solr_delete"):
+            super().handle_delete(sender, instance, **kwargs)
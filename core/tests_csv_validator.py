@@ -0,0 +1,83 @@
+import os
+import tempfile
+from configparser import ConfigParser
+
+from django.test import SimpleTestCase
+
+from core.libs.chkcsv import CsvChecker
+from core.utils.csv_validator import compile_format_specs, validate_csv_file
+
+FMT = """[Name]
+data_required=True
+type=string
+maxlen=10
+
+[Year]
+type=integer
+"""
+
+
+class ValidateCsvFileTest(SimpleTestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.fmt_file = os.path.join(self.dir.name, "test.fmt")
+        with open(self.fmt_file, "w") as fp:
+            fp.write(FMT)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write_csv(self, content):
+        csv_file = os.path.join(self.dir.name, "test.csv")
+        with open(csv_file, "w") as fp:
+            fp.write(content)
+        return csv_file
+
+    def test_valid_file_returns_line_count(self):
+        csv_file = self.write_csv("Name;Year\nABC;2020\nDEF;2021\n")
+        result = validate_csv_file(csv_file, self.fmt_file)
+        self.assertTrue(result.is_valid)
+        self.assertEqual(3, result.line_count)
+
+    def test_errors_have_chkcsv_format(self):
+        csv_file = self.write_csv("Name;Year\n;2020\nABC;abc\n")
+        result = validate_csv_file(csv_file, self.fmt_file)
+        self.assertEqual(
+            [
+                ("Dado faltando", csv_file, 2, "Name"),
+                ("Não é um inteiro", csv_file, 3, "Year"),
+            ],
+            result.errors,
+        )
+
+    def test_stops_at_max_errors(self):
+        csv_file = self.write_csv("Name;Year\n" + ";x\n" * 100)
+        result = validate_csv_file(csv_file, self.fmt_file, max_errors=3)
+        self.assertEqual(3, len(result.errors))
+
+    def test_missing_required_column(self):
+        csv_file = self.write_csv("Name\nABC\n")
+        result = validate_csv_file(csv_file, self.fmt_file)
+        self.assertEqual(1, len(result.errors))
+        self.assertIn("Year", result.errors[0][0])
+
+    def test_column_rules_match_chkcsv(self):
+        fmt = (
+            "[Upper]\ntype=String\nmaxlen=2\n\n"
+            "[Bool]\ntype=bool\n\n"
+            "[Untyped]\ndata_required=True\nminlen=3\npattern=^x\n\n"
+            "[Date]\ntype=date\npattern=^2\n"
+        )
+        with open(self.fmt_file, "w") as fp:
+            fp.write(fmt)
+        parser = ConfigParser()
+        parser.read_string(fmt)
+        rules = compile_format_specs(self.fmt_file)
+
+        for column in parser.sections():
+            checker = CsvChecker(parser, column, True, False)
+            for data in ("", "x", "xyz", "abcd", "maybe", "2020-01-01", "1999"):
+                with self.subTest(column=column, data=data):
+                    self.assertEqual(
+                        checker.check(data), list(rules[column].check(data))
+                    )
@@ -0,0 +1,115 @@
+import time
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+from prometheus_client import REGISTRY
+
+from core.utils import db_connections
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class FakeConnection:
+    def __init__(self, alias="fake", usable=True):
+        self.alias = alias
+        self.connection = object()
+        self.usable = usable
+        self.errors_occurred = False
+        self.in_atomic_block = False
+        self.autocommit = True
+        self.settings_dict = {"AUTOCOMMIT": True}
+        self.closed = False
+
+    def is_usable(self):
+        return self.usable
+
+    def get_autocommit(self):
+        return self.autocommit
+
+    def close(self):
+        self.closed = True
+        self.connection = None
+
+
+@override_settings(
+    WORKER_DB_CONNECTION_MODE="persistent",
+    WORKER_DB_HEALTH_CHECK_IDLE=30,
+    WORKER_DB_RECYCLE_TASKS=3,
+    WORKER_DB_MAX_AGE=0,
+)
+class PersistentConnectionTest(SimpleTestCase):
+    def setUp(self):
+        db_connections._state.clear()
+        self.conn = FakeConnection()
+        db_connections.connection_opened(connection=self.conn)
+        patcher = patch.object(
+            db_connections.connections, "all", return_value=[self.conn]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def closed(self, reason):
+        return sample(
+            "scielo_db_connections_closed_total",
+            worker=db_connections.WORKER,
+            alias="fake",
+            reason=reason,
+        )
+
+    def test_keeps_connection_between_tasks(self):
+        db_connections.before_task()
+        db_connections.after_task()
+        self.assertFalse(self.conn.closed)
+
+    def test_recycles_after_max_tasks(self):
+        before = self.closed("tasks")
+        for i in range(3):
+            self.assertFalse(self.conn.closed)
+            db_connections.before_task()
+            db_connections.after_task()
+        self.assertTrue(self.conn.closed)
+        self.assertEqual(before + 1, self.closed("tasks"))
+
+    def test_closes_unusable_idle_connection(self):
+        self.conn.usable = False
+        db_connections.before_task()
+        self.assertFalse(self.conn.closed)
+
+        db_connections._state["fake"]["used"] = time.monotonic() - 60
+        db_connections.before_task()
+        self.assertTrue(self.conn.closed)
+
+    def test_closes_on_error(self):
+        self.conn.errors_occurred = True
+        db_connections.after_task(failed=True)
+        self.assertTrue(self.conn.closed)
+
+    def test_closes_open_transaction(self):
+        self.conn.autocommit = False
+        db_connections.after_task()
+        self.assertTrue(self.conn.closed)
+
+    def test_counts_opened_connections(self):
+        before = sample(
+            "scielo_db_connections_opened_total",
+            worker=db_connections.WORKER,
+            alias="fake",
+        )
+        db_connections.connection_opened(connection=FakeConnection())
+        self.assertEqual(
+            before + 1,
+            sample(
+                "scielo_db_connections_opened_total",
+                worker=db_connections.WORKER,
+                alias="fake",
+            ),
+        )
+
+    @override_settings(WORKER_DB_CONNECTION_MODE="close")
+    def test_close_mode(self):
+        with patch.object(db_connections, "close_old_connections") as mocked:
+            db_connections.before_task()
+            db_connections.after_task()
+        self.assertEqual(2, mocked.call_count)
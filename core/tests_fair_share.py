@@ -0,0 +1,91 @@
+import time
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from prometheus_client import REGISTRY
+
+from core.utils import fair_share
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class WeightedRoundRobinTest(SimpleTestCase):
+    def test_interleaves_groups(self):
+        result = list(
+            fair_share.weighted_round_robin({"scl": range(4), "arg": range(2)})
+        )
+        self.assertEqual(
+            [("scl", 0), ("arg", 0), ("scl", 1), ("arg", 1), ("scl", 2), ("scl", 3)],
+            result,
+        )
+
+    def test_weights(self):
+        result = list(
+            fair_share.weighted_round_robin(
+                {"scl": "abc", "arg": "xyz"}, weights={"arg": 2}
+            )
+        )
+        self.assertEqual(
+            ["scl", "arg", "arg", "scl", "arg", "scl"], [key for key, item in result]
+        )
+
+
+class CollectionSlotTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    @override_settings(
+        PIPELINE_COLLECTION_CONCURRENCY=1,
+        PIPELINE_COLLECTION_CONCURRENCY_LIMITS={"scl": 2},
+    )
+    def test_concurrency_limit(self):
+        first = fair_share.acquire_slot("scl")
+        second = fair_share.acquire_slot("scl")
+        self.assertTrue(first[0])
+        self.assertTrue(second[0])
+        self.assertEqual((False, None), fair_share.acquire_slot("scl"))
+        self.assertTrue(fair_share.acquire_slot("arg")[0])
+
+        fair_share.release_slot(first[1])
+        self.assertTrue(fair_share.acquire_slot("scl")[0])
+
+    @override_settings(PIPELINE_COLLECTION_CONCURRENCY=0)
+    def test_without_limit(self):
+        self.assertEqual((True, None), fair_share.acquire_slot("scl"))
+        self.assertEqual((True, None), fair_share.acquire_slot(None))
+
+
+class RecordTaskStartTest(SimpleTestCase):
+    def test_wait_time(self):
+        headers = fair_share.dispatch_headers("tst")
+        headers[fair_share.DISPATCHED_AT_HEADER] = time.time() - 10
+        labels = {"collection": "tst", "family": "pipeline"}
+        started = sample("scielo_fair_share_started_total", **labels)
+        waited = sample("scielo_fair_share_wait_seconds_sum", **labels)
+
+        fair_share.record_task_start(SimpleNamespace(headers=headers))
+
+        self.assertEqual(
+            started + 1, sample("scielo_fair_share_started_total", **labels)
+        )
+        self.assertGreaterEqual(
+            sample("scielo_fair_share_wait_seconds_sum", **labels) - waited, 10
+        )
+
+    def test_task_without_headers(self):
+        fair_share.record_task_start(SimpleNamespace(headers=None))
+
+    def test_retry_keeps_dispatch_headers(self):
+        headers = fair_share.dispatch_headers("scl")
+        # cabeçalhos da mensagem aparecem como atributos do request
+        request = SimpleNamespace(headers=None, retries=0, **headers)
+
+        retried = SimpleNamespace(headers=fair_share.retry_headers(request))
+
+        self.assertEqual(
+            "scl", fair_share.request_header(retried, fair_share.COLLECTION_HEADER)
+        )
+        self.assertEqual(headers, fair_share.retry_headers(retried))
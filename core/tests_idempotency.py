@@ -0,0 +1,51 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from core.utils import idempotency
+
+
+class DocumentLockTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_concurrent_lock_is_not_acquired(self):
+        key = ("pid_v3", "S0001")
+        with idempotency.document_lock(key) as acquired:
+            self.assertTrue(acquired)
+            with idempotency.document_lock(key) as other:
+                self.assertFalse(other)
+        with idempotency.document_lock(key) as acquired:
+            self.assertTrue(acquired)
+
+    def test_lock_is_released_on_error(self):
+        key = ("pp_xml", 1)
+        with self.assertRaises(ValueError):
+            with idempotency.document_lock(key):
+                raise ValueError("error")
+        with idempotency.document_lock(key) as acquired:
+            self.assertTrue(acquired)
+
+    def test_without_key(self):
+        with idempotency.document_lock(None) as acquired:
+            self.assertTrue(acquired)
+        self.assertFalse(idempotency.recently_completed(None))
+
+    def test_recently_completed(self):
+        key = ("pp_xml", 2)
+        self.assertFalse(idempotency.recently_completed(key))
+        idempotency.mark_completed(key)
+        self.assertTrue(idempotency.recently_completed(key))
+
+    @override_settings(DOCUMENT_COMPLETED_TTL=0)
+    def test_recently_completed_disabled(self):
+        key = ("pp_xml", 3)
+        idempotency.mark_completed(key)
+        self.assertFalse(idempotency.recently_completed(key))
+
+    @override_settings(DOCUMENT_LOCK_TTL=600)
+    def test_lock_ttl_covers_task_time_limit(self):
+        self.assertEqual(600, idempotency.lock_ttl(None))
+        self.assertEqual(600, idempotency.lock_ttl(300))
+        self.assertEqual(
+            3600 + idempotency.LOCK_TTL_MARGIN, idempotency.lock_ttl(3600)
+        )
@@ -0,0 +1,50 @@
+import time
+
+from django.test import SimpleTestCase
+from prometheus_client import REGISTRY
+
+from core.utils.metrics import observe_http_fetch, timed_stage, track_stage
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TrackStageTest(SimpleTestCase):
+    def test_track_stage_success_and_error(self):
+        name = "scielo_pipeline_stage_seconds_count"
+        success = sample(name, stage="test_stage", outcome="success")
+        error = sample(name, stage="test_stage", outcome="error")
+
+        with track_stage("test_stage"):
+            pass
+        with self.assertRaises(ValueError):
+            with track_stage("test_stage"):
+                raise ValueError("x")
+
+        self.assertEqual(success + 1, sample(name, stage="test_stage", outcome="success"))
+        self.assertEqual(error + 1, sample(name, stage="test_stage", outcome="error"))
+
+    def test_timed_stage(self):
+        name = "scielo_pipeline_stage_seconds_count"
+        before = sample(name, stage="test_timed", outcome="success")
+
+        @timed_stage("test_timed")
+        def func(value):
+            return value * 2
+
+        self.assertEqual(4, func(2))
+        self.assertEqual(before + 1, sample(name, stage="test_timed", outcome="success"))
+
+
+class ObserveHttpFetchTest(SimpleTestCase):
+    def test_observe_http_fetch_by_host(self):
+        name = "scielo_http_fetch_seconds_count"
+        ok = sample(name, host="example.org", outcome="2xx")
+        failed = sample(name, host="example.org", outcome="error")
+
+        observe_http_fetch("https://example.org/a?b=1", time.perf_counter(), 200)
+        observe_http_fetch("https://example.org/c", time.perf_counter())
+
+        self.assertEqual(ok + 1, sample(name, host="example.org", outcome="2xx"))
+        self.assertEqual(failed + 1, sample(name, host="example.org", outcome="error"))
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest import mock, skipUnless
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from core.utils import partitioning
+from tracker.models import Hello
+
+
+class PartitionBoundTest(SimpleTestCase):
+    def test_month_start_and_add_months(self):
+        value = datetime(2026, 11, 19, 15, 30, tzinfo=dt_timezone.utc)
+        start = partitioning.month_start(value)
+        self.assertEqual(datetime(2026, 11, 1, tzinfo=dt_timezone.utc), start)
+        self.assertEqual(2027, partitioning.add_months(start, 2).year)
+        self.assertEqual(1, partitioning.add_months(start, 2).month)
+        self.assertEqual(11, partitioning.add_months(start, -12).month)
+
+    def test_partition_name(self):
+        month = datetime(2026, 3, 1, tzinfo=dt_timezone.utc)
+        self.assertEqual(
+            "tracker_hello_p202603", partitioning.partition_name("tracker_hello", month)
+        )
+
+    def test_parse_partition_bound(self):
+        start, end = partitioning.parse_partition_bound(
+            "FOR VALUES FROM (MINVALUE) TO ('2026-11-01 00:00:00+00')"
+        )
+        self.assertIsNone(start)
+        self.assertEqual(datetime(2026, 11, 1, tzinfo=dt_timezone.utc), end)
+        self.assertEqual((None, None), partitioning.parse_partition_bound("DEFAULT"))
+
+
+@skipUnless(connection.vendor == "postgresql", "PostgreSQL partitioning")
+class EventPartitionMaintenanceTest(TestCase):
+    table = Hello._meta.db_table
+
+    def test_table_is_partitioned(self):
+        self.assertTrue(partitioning.is_partitioned(self.table))
+
+    def test_ensure_partitions_covers_next_months(self):
+        partitioning.ensure_partitions(self.table, months_ahead=4)
+        self.assertEqual([], partitioning.ensure_partitions(self.table, months_ahead=4))
+        with connection.cursor() as cursor:
+            partitions = partitioning.get_partitions(cursor, self.table)
+        month = partitioning.add_months(partitioning.month_start(timezone.now()), 4)
+        self.assertTrue(partitioning._covered(partitions, month))
+
+    def test_drop_expired_partitions(self):
+        old = Hello.create()
+        future = timezone.now() + timedelta(days=900)
+        with mock.patch("django.utils.timezone.now", return_value=future):
+            partitioning.ensure_partitions(self.table)
+            recent = Hello.create()
+            dropped = partitioning.drop_expired_partitions(
+                self.table, retention_months=24
+            )
+        self.assertIn(f"{self.table}_legacy", dropped)
+        self.assertFalse(Hello.objects.filter(pk=old.pk).exists())
+        self.assertEqual([recent.pk], list(Hello.objects.values_list("pk", flat=True)))
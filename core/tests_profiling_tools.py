@@ -0,0 +1,34 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from core.utils.profiling_tools import Profile, QueryStats, is_sampled
+
+
+class ProfileTest(TestCase):
+    def test_counts_queries_without_debug(self):
+        User = get_user_model()
+        with self.settings(DEBUG=False):
+            with Profile(track_memory=False, top_n=2) as profile:
+                User.objects.count()
+                User.objects.filter(username="x").exists()
+                list(User.objects.all())
+
+        self.assertEqual(3, profile.queries.count)
+        self.assertEqual(2, len(profile.queries.slowest))
+        self.assertGreaterEqual(profile.duration, profile.queries.duration)
+        self.assertIsNone(profile.memory_used)
+        self.assertIn("queries: 3", profile.metrics())
+
+    def test_keeps_top_n_slowest(self):
+        stats = QueryStats(top_n=2)
+        for seconds, sql in ((0.01, "a"), (0.03, "b"), (0.02, "c")):
+            stats(lambda *args: time.sleep(seconds), sql, None, False, {})
+
+        self.assertEqual(3, stats.count)
+        self.assertEqual(["b", "c"], [sql for _, sql in stats.slowest])
+
+    def test_is_sampled(self):
+        self.assertTrue(is_sampled(1.0))
+        self.assertFalse(is_sampled(0.0))
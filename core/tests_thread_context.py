@@ -0,0 +1,33 @@
+from django.test import SimpleTestCase
+
+from core.utils.thread_context import memoize, run_memo
+
+
+class MemoizeTest(SimpleTestCase):
+    def setUp(self):
+        self.calls = []
+
+    def resolve(self, value):
+        self.calls.append(value)
+        return value.upper()
+
+    def test_memoize_without_run_memo_always_calls(self):
+        self.assertEqual(memoize("ns", "a", lambda: self.resolve("a")), "A")
+        self.assertEqual(memoize("ns", "a", lambda: self.resolve("a")), "A")
+        self.assertEqual(self.calls, ["a", "a"])
+
+    def test_memoize_inside_run_memo_calls_once_per_key(self):
+        with run_memo():
+            for value in ("a", "b", "a", "b"):
+                self.assertEqual(
+                    memoize("ns", value, lambda: self.resolve(value)), value.upper()
+                )
+            memoize("other", "a", lambda: self.resolve("a"))
+        self.assertEqual(self.calls, ["a", "b", "a"])
+
+    def test_run_memo_is_discarded_on_exit(self):
+        with run_memo():
+            memoize("ns", "a", lambda: self.resolve("a"))
+        with run_memo():
+            memoize("ns", "a", lambda: self.resolve("a"))
+        self.assertEqual(self.calls, ["a", "a"])
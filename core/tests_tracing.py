@@ -0,0 +1,115 @@
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from core.utils import tracing
+
+
+class MemoryExporter(tracing.SpanExporter):
+    def __init__(self):
+        super().__init__()
+        self.spans = []
+
+    def export(self, item):
+        self.spans.append(item)
+
+    def write(self, payload):
+        pass
+
+
+@override_settings(TRACING_ENABLED=True, TRACING_SAMPLE_RATE=1.0)
+class SpanTest(SimpleTestCase):
+    def setUp(self):
+        self.exporter = MemoryExporter()
+        patcher = patch.object(tracing, "get_exporter", return_value=self.exporter)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_nested_spans_share_trace(self):
+        with tracing.span("parent") as parent:
+            with tracing.span("child") as child:
+                self.assertIs(child, tracing.current_span())
+        self.assertIsNone(tracing.current_span())
+
+        self.assertEqual(parent.trace_id, child.trace_id)
+        self.assertEqual(parent.span_id, child.parent_id)
+        self.assertEqual(["child", "parent"], [s.name for s in self.exporter.spans])
+
+    def test_continues_trace_from_traceparent(self):
+        with tracing.span("publisher") as publisher:
+            traceparent = tracing.current_traceparent()
+        with tracing.span("worker", parent=traceparent) as worker:
+            pass
+        self.assertEqual(publisher.trace_id, worker.trace_id)
+        self.assertEqual(publisher.span_id, worker.parent_id)
+
+    def test_new_trace(self):
+        with tracing.span("dispatch") as dispatch:
+            with tracing.span("article", new_trace=True) as article:
+                pass
+        self.assertNotEqual(dispatch.trace_id, article.trace_id)
+        self.assertIsNone(article.parent_id)
+
+    def test_records_exception(self):
+        with self.assertRaises(ValueError):
+            with tracing.span("failing"):
+                raise ValueError("x")
+        self.assertEqual(2, self.exporter.spans[0].to_otlp()["status"]["code"])
+
+    @override_settings(TRACING_ENABLED=False)
+    def test_disabled(self):
+        with tracing.span("ignored") as item:
+            self.assertIsNone(item)
+        self.assertEqual([], self.exporter.spans)
+
+
+class TraceparentTest(SimpleTestCase):
+    def test_parse_traceparent(self):
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        span_id = "00f067aa0ba902b7"
+        self.assertEqual(
+            (trace_id, span_id, True),
+            tracing.parse_traceparent(f"00-{trace_id}-{span_id}-01"),
+        )
+        self.assertIsNone(tracing.parse_traceparent("invalid"))
+        self.assertIsNone(tracing.parse_traceparent(None))
+
+
+class FileSpanExporterTest(SimpleTestCase):
+    def test_writes_otlp_json(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "traces.jsonl")
+            exporter = tracing.FileSpanExporter(path)
+            item = tracing.start_span("stage", {"pid": "abc"}, new_trace=True)
+            item.end_ns = item.start_ns + 1000
+            exporter.export(item)
+            exporter.flush()
+
+            with open(path) as fp:
+                payload = json.loads(fp.readline())
+
+        spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual("stage", spans[0]["name"])
+        self.assertEqual(item.trace_id, spans[0]["traceId"])
+        self.assertEqual(
+            [{"key": "pid", "value": {"stringValue": "abc"}}], spans[0]["attributes"]
+        )
+
+    @override_settings(TRACING_BATCH_SIZE=2, TRACING_FLUSH_INTERVAL=3600)
+    def test_exports_in_batches(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "traces.jsonl")
+            exporter = tracing.FileSpanExporter(path)
+            exporter.export(tracing.start_span("first", new_trace=True))
+            self.assertFalse(os.path.exists(path))
+
+            exporter.export(tracing.start_span("second", new_trace=True))
+            with open(path) as fp:
+                lines = fp.readlines()
+
+        self.assertEqual(1, len(lines))
+        spans = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual(["first", "second"], [item["name"] for item in spans])
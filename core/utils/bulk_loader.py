@@ -0,0 +1,138 @@
+"""
+Carga em lote de tabelas de apoio (fixtures CSV e listas de choices)
+
+Substitui o padrão get_or_create / create_or_update por linha: as chaves
+existentes são pré-carregadas em memória, os registros novos são gravados
+com bulk_create(ignore_conflicts=True) e os alterados com bulk_update,
+tudo em uma única transação.
+
+bulk_create / bulk_update não emitem post_save; quem depende dos sinais
+(ex.: location.gazetteer) deve ser atualizado por quem chama.
+"""
+
+import csv
+import logging
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+
+BULK_LOAD_CHUNK_SIZE = 1000
+
+
+def chunks(items, size=BULK_LOAD_CHUNK_SIZE):
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_csv(file_path, fieldnames=None, delimiter=";", skip_header=False):
+    """
+    Lê o CSV linha a linha (gerador de dicts), sem carregar o arquivo inteiro
+    """
+    with open(file_path, "r", newline="") as csvfile:
+        rows = csv.DictReader(csvfile, fieldnames=fieldnames, delimiter=delimiter)
+        if skip_header:
+            next(rows, None)
+        for row in rows:
+            yield row
+
+
+def _make_key(values, normalize=None):
+    return tuple(
+        normalize(value) if normalize and isinstance(value, str) else value
+        for value in values
+    )
+
+
+def load_existing(model, key_fields, normalize=None, queryset=None):
+    """
+    Retorna dict {chave: objeto} com os registros existentes do modelo
+    """
+    queryset = queryset if queryset is not None else model.objects.all()
+    existing = {}
+    for obj in queryset.iterator():
+        key = _make_key((getattr(obj, name) for name in key_fields), normalize)
+        existing.setdefault(key, obj)
+    return existing
+
+
+def bulk_load(
+    model,
+    rows,
+    user,
+    key_fields,
+    update_fields=None,
+    normalize=None,
+    chunk_size=BULK_LOAD_CHUNK_SIZE,
+):
+    """
+    Cria / atualiza registros de model a partir de rows
+
+    rows: iterável de dicts {campo: valor}
+    key_fields: campos que identificam o registro (equivale ao get usado
+        em create_or_update); valores de FK devem ser objetos
+    update_fields: campos atualizados nos registros existentes quando o
+        valor informado não é vazio e difere do gravado
+    normalize: função aplicada aos valores str da chave (ex.: str.casefold
+        quando o get do modelo compara com iexact)
+
+    Retorna dict {chave: objeto} de todos os registros do modelo, útil
+    para resolver FKs da próxima carga sem novas consultas
+    """
+    update_fields = list(update_fields or [])
+    created = 0
+    updated = 0
+    with transaction.atomic():
+        existing = load_existing(model, key_fields, normalize)
+        for chunk in chunks(rows, chunk_size):
+            to_create = {}
+            to_update = {}
+            for row in chunk:
+                key = _make_key((row.get(name) for name in key_fields), normalize)
+                if not any(key):
+                    continue
+                obj = existing.get(key) or to_create.get(key)
+                if obj is None:
+                    obj = model(**row)
+                    obj.creator = user
+                    to_create[key] = obj
+                    continue
+                if obj.pk is None:
+                    continue
+                changed = False
+                for name in update_fields:
+                    value = row.get(name)
+                    if value not in (None, "") and getattr(obj, name) != value:
+                        setattr(obj, name, value)
+                        changed = True
+                if changed:
+                    obj.updated_by = user
+                    obj.updated = timezone.now()
+                    to_update[obj.pk] = obj
+
+            if to_create:
+                model.objects.bulk_create(
+                    to_create.values(), batch_size=chunk_size, ignore_conflicts=True
+                )
+                existing.update(to_create)
+                created += len(to_create)
+            if to_update:
+                model.objects.bulk_update(
+                    to_update.values(),
+                    update_fields + ["updated_by", "updated"],
+                    batch_size=chunk_size,
+                )
+                updated += len(to_update)
+
+        if created:
+            # com ignore_conflicts os objetos criados não recebem pk
+            existing = load_existing(model, key_fields, normalize)
+
+    logging.info(
+        f"bulk_load {model.__name__}: created={created} updated={updated}"
+    )
+    return existing
@@ -0,0 +1,339 @@
+"""
+Validação de CSV em uma única passagem (substitui core.libs.chkcsv nas views)
+
+Usa o mesmo arquivo .fmt (INI: uma seção por coluna com column_required,
+data_required, type, minlen, maxlen, pattern) e as mesmas mensagens de
+chkcsv, mas:
+
+- a especificação é compilada uma única vez por processo (cache por arquivo);
+- as linhas são lidas em streaming e a contagem de linhas é feita na mesma
+  passagem (dispensa reabrir o arquivo com readlines);
+- a validação termina ao atingir max_errors;
+- arquivos grandes podem ser validados em blocos por um pool de processos.
+"""
+
+import csv
+import datetime
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from configparser import ConfigParser, Error as ConfigParserError
+from functools import lru_cache
+from itertools import islice
+
+from django.conf import settings
+
+from core.libs.chkcsv import ChkCsvError, CsvChecker
+
+OPTIONS_SECTION = "chkcsvoptions"
+
+
+class CsvValidationResult:
+    def __init__(self, errors, line_count):
+        self.errors = errors
+        self.line_count = line_count
+
+    @property
+    def is_valid(self):
+        return not self.errors
+
+
+def _strptime_check(formats, message):
+    def check(data):
+        for fmt in formats:
+            try:
+                datetime.datetime.strptime(data, fmt)
+                return None
+            except ValueError:
+                continue
+        return message
+
+    return check
+
+
+def _number_check(cast, message):
+    def check(data):
+        try:
+            cast(data)
+            return None
+        except ValueError:
+            return message
+
+    return check
+
+
+class ColumnRule:
+    """
+    Regras de uma coluna do .fmt compiladas em uma tupla de funções
+    (data -> mensagem de erro ou None)
+    """
+
+    def __init__(self, name, column_required, data_required, specs):
+        self.name = name
+        self.column_required = specs.get("column_required", column_required)
+        self.data_required = specs.get("data_required", data_required)
+
+        # como em chkcsv: type diferencia maiúsculas de minúsculas e um tipo
+        # desconhecido (ex.: "String") não tem verificações além de data_required
+        col_type = specs.get("type")
+        minlen = specs.get("minlen")
+        maxlen = specs.get("maxlen")
+        rx = specs.get("rx")
+
+        # verificações aplicadas apenas a valores não vazios
+        checks = []
+        use_length = col_type in (None, "string")
+        if use_length and minlen is not None:
+            checks.append(lambda data: None if len(data) >= minlen else "data too short")
+        if use_length and maxlen is not None:
+            checks.append(lambda data: None if len(data) <= maxlen else "data too long")
+        if col_type == "integer":
+            checks.append(_number_check(int, "Não é um inteiro"))
+        elif col_type == "float":
+            checks.append(
+                _number_check(float, "Não é um número com separado de casa decimal")
+            )
+        elif col_type == "date":
+            checks.append(_strptime_check(CsvChecker.date_fmts, "invalid date"))
+        elif col_type == "datetime":
+            checks.append(
+                _strptime_check(CsvChecker.datetime_fmts, "invalid date/time")
+            )
+        if rx and col_type in (None, "string", "date", "datetime"):
+            checks.append(lambda data: None if rx.match(data) else "Padrão incompatível")
+        self.checks = tuple(checks)
+        # chkcsv aplica minlen também a valores vazios quando data_required
+        self.check_empty_minlen = use_length and minlen and self.data_required
+
+    def check(self, data):
+        if not data:
+            if self.data_required:
+                errors = ["Dado faltando"]
+                if self.check_empty_minlen:
+                    errors.append("data too short")
+                return errors
+            return ()
+        return [error for error in (check(data) for check in self.checks) if error]
+
+
+@lru_cache(maxsize=32)
+def compile_format_specs(fmt_file, column_required=True, data_required=False):
+    """
+    Lê e compila o arquivo .fmt; retorna dict {nome da coluna: ColumnRule}
+    """
+    parser = ConfigParser()
+    try:
+        files_read = parser.read([fmt_file])
+    except ConfigParserError:
+        raise ChkCsvError("Error reading format specification file.", fmt_file)
+    if not files_read:
+        raise ChkCsvError("Error reading format specification file.", fmt_file)
+
+    rules = {}
+    for section in parser.sections():
+        if section == OPTIONS_SECTION:
+            continue
+        specs = {}
+        for option in parser.options(section):
+            if option in ("column_required", "data_required"):
+                specs[option] = parser.getboolean(section, option)
+            elif option in ("minlen", "maxlen"):
+                specs[option] = parser.getint(section, option)
+            elif option in ("type", "pattern"):
+                specs[option] = parser.get(section, option)
+            else:
+                raise ChkCsvError(
+                    "Unrecognized format specification (%s)" % option, column=section
+                )
+        if "pattern" in specs:
+            try:
+                specs["rx"] = re.compile(specs["pattern"])
+            except re.error:
+                raise ChkCsvError(
+                    "Invalid regular expression pattern: %s" % specs["pattern"],
+                    column=section,
+                )
+        rules[section] = ColumnRule(section, column_required, data_required, specs)
+    return rules
+
+
+def _check_rows(
+    rules, columns, n_headers, max_index, numbered_rows, csv_fname, linelength, max_errors
+):
+    errors = []
+    for row_no, row in numbered_rows:
+        size = len(row)
+        if size and size < n_headers and linelength:
+            errors.append(("fewer data values than column headers", csv_fname, row_no))
+        if size > n_headers:
+            errors.append(("more data values than column headers", csv_fname, row_no))
+        if size < max_index + 1:
+            if size:
+                errors.append(
+                    (
+                        "fewer data values than columns in the format specification",
+                        csv_fname,
+                        row_no,
+                    )
+                )
+        else:
+            for name, index in columns:
+                for error in rules[name].check(row[index]):
+                    errors.append((error, csv_fname, row_no, name))
+        if len(errors) >= max_errors:
+            return errors[:max_errors]
+    return errors
+
+
+def _check_chunk(spec_args, columns, n_headers, max_index, numbered_rows, csv_fname, linelength, max_errors):
+    # executado nos processos do pool: a especificação é compilada
+    # uma vez por processo (lru_cache)
+    rules = compile_format_specs(*spec_args)
+    return _check_rows(
+        rules, columns, n_headers, max_index, numbered_rows, csv_fname, linelength, max_errors
+    )
+
+
+def _numbered(reader):
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _chunks(items, size):
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_csv_file(
+    csv_fname,
+    fmt_file,
+    column_required=True,
+    data_required=False,
+    columnexit=True,
+    linelength=True,
+    caseinsensitive=False,
+    encoding="utf-8",
+    max_errors=None,
+    processes=None,
+    chunk_size=None,
+):
+    """
+    Valida csv_fname conforme fmt_file em uma única passagem
+
+    Os parâmetros column_required, data_required, columnexit, linelength e
+    caseinsensitive têm o mesmo significado que em chkcsv.read_format_specs /
+    chkcsv.check_csv_file. Os erros têm o mesmo formato de chkcsv:
+    (mensagem, arquivo, linha[, coluna]).
+
+    max_errors: interrompe a validação ao atingir este número de erros
+        (padrão settings.CSV_VALIDATION_MAX_ERRORS)
+    processes: número de processos para validar arquivos com mais de
+        settings.CSV_VALIDATION_PARALLEL_MIN_SIZE bytes
+        (padrão settings.CSV_VALIDATION_PROCESSES; 0 ou 1 desativa)
+
+    Retorna CsvValidationResult(errors, line_count), sendo line_count o
+    número de linhas lidas, incluindo o cabeçalho (total do arquivo quando
+    não há erros)
+    """
+    max_errors = max_errors or getattr(settings, "CSV_VALIDATION_MAX_ERRORS", 20)
+    if processes is None:
+        processes = getattr(settings, "CSV_VALIDATION_PROCESSES", 0)
+    chunk_size = chunk_size or getattr(settings, "CSV_VALIDATION_CHUNK_SIZE", 5000)
+    if processes > 1:
+        min_size = getattr(settings, "CSV_VALIDATION_PARALLEL_MIN_SIZE", 20 * 1024 * 1024)
+        if os.path.getsize(csv_fname) < min_size:
+            processes = 0
+
+    spec_args = (fmt_file, column_required, data_required)
+    rules = compile_format_specs(*spec_args)
+
+    with open(csv_fname, mode="rt", encoding=encoding, newline="") as fp:
+        dialect = csv.Sniffer().sniff(fp.readline())
+        fp.seek(0)
+        reader = csv.reader(fp, dialect=dialect)
+        colnames = next(reader, [])
+
+        def normalize(name):
+            return name.lower() if caseinsensitive else name
+
+        positions = {}
+        for index, colname in enumerate(colnames):
+            positions.setdefault(normalize(colname), index)
+
+        req_missing = [
+            name
+            for name, rule in rules.items()
+            if rule.column_required and normalize(name) not in positions
+        ]
+        if req_missing:
+            error = (
+                "The following columns are required, but are not present in the CSV file: %s."
+                % ", ".join(req_missing),
+                csv_fname,
+                1,
+            )
+            return CsvValidationResult([error], reader.line_num)
+
+        if columnexit:
+            spec_names = {normalize(name) for name in rules}
+            extra = [name for name in colnames if normalize(name) not in spec_names]
+            if extra:
+                error = (
+                    "The following columns have no format specifications but are in the CSV file: %s."
+                    % ", ".join(extra),
+                    csv_fname,
+                    1,
+                )
+                return CsvValidationResult([error], reader.line_num)
+
+        columns = tuple(
+            (name, positions[normalize(name)])
+            for name in rules
+            if normalize(name) in positions
+        )
+        max_index = max((index for name, index in columns), default=0)
+        n_headers = len(colnames)
+        rows = _numbered(reader)
+
+        if processes > 1:
+            errors = _validate_in_processes(
+                processes, chunk_size, spec_args, columns, n_headers, max_index,
+                rows, csv_fname, linelength, max_errors,
+            )
+        else:
+            errors = _check_rows(
+                rules, columns, n_headers, max_index, rows, csv_fname, linelength, max_errors
+            )
+        return CsvValidationResult(errors, reader.line_num)
+
+
+def _validate_in_processes(
+    processes, chunk_size, spec_args, columns, n_headers, max_index, rows, csv_fname, linelength, max_errors
+):
+    errors = []
+    pending = deque()
+    chunks = _chunks(rows, chunk_size)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        # mantém no máximo 2 blocos por processo em memória; os resultados
+        # são consumidos em ordem para que os erros sigam a ordem das linhas
+        for chunk in chunks:
+            pending.append(
+                executor.submit(
+                    _check_chunk, spec_args, columns, n_headers, max_index,
+                    chunk, csv_fname, linelength, max_errors,
+                )
+            )
+            if len(pending) < processes * 2:
+                continue
+            errors.extend(pending.popleft().result())
+            if len(errors) >= max_errors:
+                break
+        while pending and len(errors) < max_errors:
+            errors.extend(pending.popleft().result())
+        for future in pending:
+            future.cancel()
+    return errors[:max_errors]
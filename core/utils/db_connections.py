@@ -0,0 +1,119 @@
+"""
+Conexões com o banco de dados nos workers Celery
+
+WORKER_DB_CONNECTION_MODE:
+    "close": close_old_connections antes e depois de cada tarefa, como nas
+    requisições (CONN_MAX_AGE / CONN_HEALTH_CHECKS)
+    "persistent": as conexões continuam abertas entre as tarefas. Antes da
+    tarefa, as conexões com erro ou ociosas há WORKER_DB_HEALTH_CHECK_IDLE
+    segundos são testadas (is_usable) e fechadas se estiverem quebradas;
+    depois da tarefa, são fechadas as que tiveram erro ou ficaram com
+    transação aberta e as que já atenderam WORKER_DB_RECYCLE_TASKS tarefas
+    ou estão abertas há WORKER_DB_MAX_AGE segundos
+
+Pooler local (pgbouncer, por exemplo): com CELERY_DATABASE_URL definida, o
+script de início do worker usa essa URL no lugar de DATABASE_URL
+(compose/production/django/celery/worker/start).
+
+As conexões abertas e fechadas são contadas por worker (hostname) nas
+métricas scielo_db_connections_opened / scielo_db_connections_closed.
+"""
+
+import logging
+import socket
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+from core.utils.metrics import DB_CONNECTIONS_CLOSED, DB_CONNECTIONS_OPENED
+
+PERSISTENT = "persistent"
+WORKER = socket.gethostname()
+
+# alias -> {"opened": monotonic, "used": monotonic, "tasks": int}
+_state = {}
+
+
+def is_persistent():
+    return getattr(settings, "WORKER_DB_CONNECTION_MODE", "close") == PERSISTENT
+
+
+def connection_opened(sender=None, connection=None, **kwargs):
+    """
+    Receptor de django.db.backends.signals.connection_created
+    """
+    now = time.monotonic()
+    _state[connection.alias] = {"opened": now, "used": now, "tasks": 0}
+    DB_CONNECTIONS_OPENED.labels(WORKER, connection.alias).inc()
+
+
+def close_connection(connection, reason):
+    try:
+        connection.close()
+    except Exception as e:
+        logging.error(f"Unable to close database connection {connection.alias}: {e}")
+    _state.pop(connection.alias, None)
+    DB_CONNECTIONS_CLOSED.labels(WORKER, connection.alias, reason).inc()
+
+
+def _open_connections():
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is not None:
+            yield connection
+
+
+def _entry(connection):
+    now = time.monotonic()
+    return _state.setdefault(connection.alias, {"opened": now, "used": now, "tasks": 0})
+
+
+def before_task():
+    if not is_persistent():
+        close_old_connections()
+        return
+    idle_limit = getattr(settings, "WORKER_DB_HEALTH_CHECK_IDLE", 30)
+    for connection in _open_connections():
+        idle = time.monotonic() - _entry(connection)["used"]
+        if not connection.errors_occurred and idle < idle_limit:
+            continue
+        if connection.is_usable():
+            connection.errors_occurred = False
+        else:
+            close_connection(connection, "unusable")
+
+
+def recycle_reason(connection, entry, failed=False):
+    """
+    Motivo para fechar a conexão depois da tarefa ou None
+    """
+    if connection.in_atomic_block or (
+        connection.get_autocommit() != connection.settings_dict["AUTOCOMMIT"]
+    ):
+        return "transaction"
+    if connection.errors_occurred or (failed and not connection.is_usable()):
+        return "error"
+    max_tasks = getattr(settings, "WORKER_DB_RECYCLE_TASKS", 1000)
+    if max_tasks and entry["tasks"] >= max_tasks:
+        return "tasks"
+    max_age = getattr(settings, "WORKER_DB_MAX_AGE", 3600)
+    if max_age and time.monotonic() - entry["opened"] >= max_age:
+        return "age"
+    return None
+
+
+def after_task(failed=False):
+    if not is_persistent():
+        close_old_connections()
+        return
+    for connection in _open_connections():
+        entry = _entry(connection)
+        entry["tasks"] += 1
+        entry["used"] = time.monotonic()
+        try:
+            reason = recycle_reason(connection, entry, failed)
+        except Exception as e:
+            logging.error(f"Unable to check database connection {connection.alias}: {e}")
+            reason = "error"
+        if reason:
+            close_connection(connection, reason)
@@ -0,0 +1,149 @@
+"""
+Divisão justa (fair share) do trabalho do pipeline entre coleções
+
+- Famílias de tarefas: CELERY_TASK_ROUTES envia os envios de XML ao PID
+  provider, as exportações e o pipeline de artigos para filas próprias
+  ("pid_provider", "export", "pipeline"). O worker consome as filas em
+  rodízio, então o trabalho sensível à latência não espera o
+  reprocessamento em massa; CELERY_WORKER_QUEUES permite ainda um worker
+  dedicado à fila "pid_provider".
+- Rodízio ponderado: task_dispatch_articles intercala os itens das
+  coleções (weighted_round_robin, pesos em PIPELINE_COLLECTION_WEIGHTS).
+- Limite de concorrência: acima de PIPELINE_COLLECTION_CONCURRENCY tarefas
+  simultâneas da mesma coleção (acquire_slot), a tarefa volta para a
+  fila após PIPELINE_COLLECTION_RETRY_DELAY segundos, com os mesmos
+  cabeçalhos (retry_headers).
+- Métricas (core.utils.metrics): tarefas despachadas, iniciadas e
+  devolvidas e o tempo de espera na fila, por coleção e família.
+
+A coleção, a família e o instante do despacho seguem nos cabeçalhos da
+mensagem (dispatch_headers).
+"""
+
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.utils import metrics
+
+COLLECTION_HEADER = "fair_share_collection"
+FAMILY_HEADER = "fair_share_family"
+DISPATCHED_AT_HEADER = "fair_share_dispatched_at"
+
+PIPELINE = "pipeline"
+SLOT_PREFIX = "fair_share:slot"
+# coleção desconhecida (ex.: itens de ArticleSource)
+NO_COLLECTION = "-"
+
+
+def weighted_round_robin(groups, weights=None):
+    """
+    groups: {chave: iterável}; weights: {chave: peso}, padrão 1
+
+    Retorna (chave, item) intercalando os grupos: a cada rodada, até
+    "peso" itens de cada grupo
+    """
+    iterators = {key: iter(items) for key, items in groups.items()}
+    weights = weights or {}
+    while iterators:
+        for key in list(iterators):
+            for _ in range(max(1, int(weights.get(key, 1)))):
+                try:
+                    item = next(iterators[key])
+                except StopIteration:
+                    del iterators[key]
+                    break
+                yield key, item
+
+
+def dispatch_headers(collection, family=PIPELINE):
+    collection = collection or NO_COLLECTION
+    metrics.FAIR_SHARE_DISPATCHED.labels(collection, family).inc()
+    return {
+        COLLECTION_HEADER: collection,
+        FAMILY_HEADER: family,
+        DISPATCHED_AT_HEADER: time.time(),
+    }
+
+
+def request_header(request, name):
+    return getattr(request, name, None) or (
+        getattr(request, "headers", None) or {}
+    ).get(name)
+
+
+def retry_headers(request):
+    """
+    Cabeçalhos de dispatch_headers da tarefa em execução, repassados a
+    self.retry para que a nova tentativa continue sujeita ao limite da
+    coleção
+    """
+    headers = {}
+    for name in (COLLECTION_HEADER, FAMILY_HEADER, DISPATCHED_AT_HEADER):
+        value = request_header(request, name)
+        if value is not None:
+            headers[name] = value
+    return headers
+
+
+def record_task_start(request):
+    """
+    Registra o início e o tempo de espera de uma tarefa despachada com
+    dispatch_headers
+
+    Tarefas com limite de concorrência (fair_share_slot=True) só são
+    contadas depois de obter a vaga (acquire_slot): as devolvidas à fila
+    não contam como iniciadas
+    """
+    family = request_header(request, FAMILY_HEADER)
+    if not family:
+        return
+    collection = request_header(request, COLLECTION_HEADER) or NO_COLLECTION
+    metrics.FAIR_SHARE_STARTED.labels(collection, family).inc()
+    dispatched_at = request_header(request, DISPATCHED_AT_HEADER)
+    if dispatched_at:
+        metrics.FAIR_SHARE_WAIT_SECONDS.labels(collection, family).observe(
+            max(0, time.time() - float(dispatched_at))
+        )
+
+
+def get_concurrency_limit(collection):
+    limits = getattr(settings, "PIPELINE_COLLECTION_CONCURRENCY_LIMITS", {})
+    if collection in limits:
+        return limits[collection]
+    return getattr(settings, "PIPELINE_COLLECTION_CONCURRENCY", 0)
+
+
+def acquire_slot(collection, family=PIPELINE, ttl=None):
+    """
+    Ocupa uma das vagas de execução da coleção (chaves no cache com TTL,
+    liberadas por release_slot ou ao expirar)
+
+    Retorna (True, vaga) ou (False, None) se todas as vagas estão
+    ocupadas; vaga é None quando a coleção não tem limite ou o cache
+    está indisponível. ttl: padrão settings.DOCUMENT_LOCK_TTL
+    """
+    limit = get_concurrency_limit(collection)
+    if not collection or collection == NO_COLLECTION or not limit:
+        return True, None
+    token = uuid.uuid4().hex
+    ttl = ttl or getattr(settings, "DOCUMENT_LOCK_TTL", 600)
+    for i in range(limit):
+        name = f"{SLOT_PREFIX}:{family}:{collection}:{i}"
+        acquired = cache.add(name, token, ttl)
+        if acquired is None:
+            return True, None
+        if acquired:
+            return True, (name, token)
+    metrics.FAIR_SHARE_DEFERRED.labels(collection, family).inc()
+    return False, None
+
+
+def release_slot(slot):
+    if not slot:
+        return
+    name, token = slot
+    if cache.get(name) == token:
+        cache.delete(name)
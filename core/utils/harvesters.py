@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Any, Dict, Generator, Optional
 from urllib.parse import urlencode
 
+from core.utils.metrics import track_stage
 from core.utils.utils import fetch_data
 
 
@@ -73,7 +74,10 @@ class AMHarvester:
                 logging.info(f"Fetching AM documents from: {url}")
 
                 # Faz requisição
-                response = fetch_data(url, json=True, timeout=self.timeout, verify=False)
+                with track_stage("harvest_page"):
+                    response = fetch_data(
+                        url, json=True, timeout=self.timeout, verify=False
+                    )
 
                 # Processa objetos retornados
                 objects = response.get("objects", [])
@@ -199,7 +203,10 @@ class OPACHarvester:
 
                 # Faz requisição
                 # verify=False é necessário para evitar erros de SSL em ambientes onde o certificado do OPAC não é reconhecido
-                response = fetch_data(url, json=True, timeout=self.timeout, verify=False)
+                with track_stage("harvest_page"):
+                    response = fetch_data(
+                        url, json=True, timeout=self.timeout, verify=False
+                    )
 
                 # Define total de páginas na primeira iteração
                 if total_pages is None:
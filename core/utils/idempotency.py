@@ -0,0 +1,91 @@
+"""
+Controle de idempotência do processamento de documentos
+
+document_lock impede que duas tarefas processem o mesmo documento ao mesmo
+tempo (chave no cache, Redis em produção, com TTL), e mark_completed /
+recently_completed permitem ignorar rapidamente os despachos repetidos de
+um documento processado há pouco.
+
+A chave de um documento é uma tupla, por exemplo ("pid_v3", v3) ou
+("pp_xml", pp_xml_id); com chave None as funções não fazem nada.
+
+Configuração (settings):
+    DOCUMENT_LOCK_TTL: segundos até o lock expirar (tarefa interrompida);
+    lock_ttl o estende até o tempo limite da tarefa
+    DOCUMENT_LOCK_RETRY_DELAY: segundos até a nova tentativa de uma tarefa
+    que encontrou o documento em processamento
+    DOCUMENT_COMPLETED_TTL: segundos em que o documento é considerado
+    recém-processado (0 desativa)
+"""
+
+import hashlib
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+
+LOCK_PREFIX = "document:lock"
+COMPLETED_PREFIX = "document:completed"
+# segundos além do tempo limite da tarefa
+LOCK_TTL_MARGIN = 60
+
+
+def cache_key(prefix, key):
+    value = ":".join(str(item) for item in key)
+    return f"{prefix}:{hashlib.sha1(value.encode('utf-8')).hexdigest()}"
+
+
+def lock_ttl(time_limit=None):
+    """
+    TTL do lock de uma tarefa com tempo limite time_limit (segundos): o
+    lock não expira enquanto a tarefa pode estar em execução
+    """
+    ttl = getattr(settings, "DOCUMENT_LOCK_TTL", 600)
+    if time_limit:
+        ttl = max(ttl, int(time_limit) + LOCK_TTL_MARGIN)
+    return ttl
+
+
+@contextmanager
+def document_lock(key, ttl=None):
+    """
+    with document_lock(("pid_v3", v3)) as acquired:
+        if not acquired:
+            return  # já está em processamento
+
+    Com o cache indisponível (django_redis com IGNORE_EXCEPTIONS retorna
+    None), o processamento segue sem lock
+    """
+    if key is None:
+        yield True
+        return
+    name = cache_key(LOCK_PREFIX, key)
+    token = uuid.uuid4().hex
+    acquired = cache.add(
+        name, token, ttl or getattr(settings, "DOCUMENT_LOCK_TTL", 600)
+    )
+    if acquired is None:
+        logging.warning(f"document_lock: cache unavailable, {key} not locked")
+        yield True
+        return
+    try:
+        yield acquired
+    finally:
+        # não remove o lock obtido por outra tarefa depois de expirado
+        if acquired and cache.get(name) == token:
+            cache.delete(name)
+
+
+def mark_completed(key):
+    ttl = getattr(settings, "DOCUMENT_COMPLETED_TTL", 600)
+    if key is not None and ttl:
+        cache.set(cache_key(COMPLETED_PREFIX, key), time.time(), ttl)
+
+
+def recently_completed(key):
+    if key is None or not getattr(settings, "DOCUMENT_COMPLETED_TTL", 600):
+        return False
+    return cache.get(cache_key(COMPLETED_PREFIX, key)) is not None
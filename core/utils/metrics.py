@@ -0,0 +1,189 @@
+"""
+Métricas Prometheus do pipeline (coleta, registro de PID, carga de artigos,
+disponibilidade, exportação para ArticleMeta, indexação no Solr), das
+requisições HTTP feitas por fetch_data e das tarefas Celery
+
+Modo multiprocesso: com a variável de ambiente PROMETHEUS_MULTIPROC_DIR
+definida (e o diretório limpo) antes de iniciar gunicorn / celery, cada
+processo grava suas métricas em arquivos nesse diretório. O endpoint
+/metrics (django_prometheus) agrega os arquivos dos workers do gunicorn e
+start_worker_metrics_server, os dos processos filhos do worker Celery.
+"""
+
+import functools
+import logging
+import os
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    multiprocess,
+    start_http_server,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from core.utils import tracing
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+FETCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+PIPELINE_STAGE_SECONDS = Histogram(
+    "scielo_pipeline_stage_seconds",
+    "Duração das etapas do pipeline",
+    ["stage", "outcome"],
+    buckets=STAGE_BUCKETS,
+)
+HTTP_FETCH_SECONDS = Histogram(
+    "scielo_http_fetch_seconds",
+    "Duração das requisições HTTP de fetch_data, por host",
+    ["host", "outcome"],
+    buckets=FETCH_BUCKETS,
+)
+CELERY_TASK_SECONDS = Histogram(
+    "scielo_celery_task_seconds",
+    "Duração das tarefas Celery",
+    ["task", "state"],
+    buckets=STAGE_BUCKETS,
+)
+# fair share (core.utils.fair_share); tarefas na fila por coleção:
+# despachadas - iniciadas
+FAIR_SHARE_DISPATCHED = Counter(
+    "scielo_fair_share_dispatched",
+    "Tarefas despachadas, por coleção e família",
+    ["collection", "family"],
+)
+FAIR_SHARE_STARTED = Counter(
+    "scielo_fair_share_started",
+    "Tarefas iniciadas, por coleção e família",
+    ["collection", "family"],
+)
+FAIR_SHARE_DEFERRED = Counter(
+    "scielo_fair_share_deferred",
+    "Tarefas devolvidas à fila pelo limite de concorrência da coleção",
+    ["collection", "family"],
+)
+FAIR_SHARE_WAIT_SECONDS = Histogram(
+    "scielo_fair_share_wait_seconds",
+    "Tempo entre o despacho e o início da tarefa, por coleção e família",
+    ["collection", "family"],
+    buckets=STAGE_BUCKETS + (1800, 3600, 7200, 14400),
+)
+CELERY_TASKS_IN_PROGRESS = Gauge(
+    "scielo_celery_tasks_in_progress",
+    "Tarefas Celery em execução",
+    ["task"],
+    multiprocess_mode="livesum",
+)
+# conexões com o banco de dados (core.utils.db_connections)
+DB_CONNECTIONS_OPENED = Counter(
+    "scielo_db_connections_opened",
+    "Conexões com o banco de dados abertas, por worker",
+    ["worker", "alias"],
+)
+DB_CONNECTIONS_CLOSED = Counter(
+    "scielo_db_connections_closed",
+    "Conexões com o banco de dados fechadas pelo worker, por motivo",
+    ["worker", "alias", "reason"],
+)
+
+
+@contextmanager
+def track_stage(stage):
+    """
+    with track_stage("load_article"):
+        ...
+
+    A etapa também é registrada como span (core.utils.tracing)
+    """
+    start = time.perf_counter()
+    outcome = "success"
+    try:
+        with tracing.span(stage):
+            yield
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        PIPELINE_STAGE_SECONDS.labels(stage, outcome).observe(
+            time.perf_counter() - start
+        )
+
+
+def timed_stage(stage):
+    """
+    Decorador equivalente a track_stage
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with track_stage(stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def observe_http_fetch(url, started, status_code=None):
+    """
+    Registra a duração de uma requisição iniciada em started
+    (time.perf_counter()); sem status_code, a requisição falhou
+    """
+    host = urlparse(url).hostname or "unknown"
+    outcome = f"{status_code // 100}xx" if status_code else "error"
+    HTTP_FETCH_SECONDS.labels(host, outcome).observe(time.perf_counter() - started)
+
+
+class CeleryQueueDepthCollector:
+    """
+    Número de mensagens em cada fila do broker, obtido a cada coleta
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def collect(self):
+        metric = GaugeMetricFamily(
+            "scielo_celery_queue_depth",
+            "Mensagens aguardando nas filas do broker Celery",
+            labels=["queue"],
+        )
+        queues = list(self.app.amqp.queues) or [self.app.conf.task_default_queue]
+        try:
+            with self.app.connection_for_read() as conn:
+                channel = conn.default_channel
+                for queue in queues:
+                    ok = channel.queue_declare(queue=queue, passive=True)
+                    metric.add_metric([queue], ok.message_count)
+        except Exception as e:
+            logging.warning(f"CeleryQueueDepthCollector: {e}")
+        yield metric
+
+
+def start_worker_metrics_server(app, port):
+    """
+    Expõe, no processo principal do worker Celery, as métricas dos
+    processos filhos (modo multiprocesso) e a profundidade das filas
+    """
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    registry.register(CeleryQueueDepthCollector(app))
+    start_http_server(port, registry=registry)
+    logging.info(f"Celery metrics server listening on port {port}")
+
+
+def mark_process_dead(pid):
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,294 @@
+"""
+Particionamento mensal (PostgreSQL, PARTITION BY RANGE) das tabelas de
+eventos, que crescem sem limite: UnexpectedEvent, Hello e ArticleEvent
+
+A migração que converte a tabela (convert_to_partitioned) mantém os
+registros existentes numa partição "<tabela>_legacy", que vai do início
+até o fim do mês corrente, e cria uma partição "<tabela>_default" para
+registros fora das partições mensais "<tabela>_pAAAAMM".
+
+maintain_partitions (tarefa tracker.tasks.task_maintain_event_partitions)
+cria as partições dos próximos meses e remove com DROP TABLE as que
+ficaram fora do prazo de retenção, em vez de DELETEs custosos.
+
+Configuração (settings):
+    EVENT_RETENTION_MONTHS: {"app_label.Model": meses} (0 mantém tudo)
+    EVENT_PARTITION_MONTHS_AHEAD
+"""
+
+import logging
+import re
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+PARTITION_COLUMN = "created"
+LIKE_OPTIONS = (
+    "INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE INCLUDING COMPRESSION"
+)
+BOUND_PATTERN = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+def month_start(value):
+    value = value.astimezone(dt_timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value, months):
+    month = value.month - 1 + months
+    return value.replace(year=value.year + month // 12, month=month % 12 + 1)
+
+
+def partition_name(table, month):
+    return f"{table}_p{month:%Y%m}"
+
+
+def _bound(value):
+    """
+    "'2026-11-01 00:00:00+00'" -> datetime; MINVALUE / MAXVALUE -> None
+    """
+    value = value.strip("'")
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(value)
+
+
+def parse_partition_bound(expression):
+    """
+    Expressão de pg_get_expr(relpartbound) -> (início, fim);
+    None nos limites abertos; (None, None) para a partição DEFAULT
+    """
+    match = BOUND_PATTERN.search(expression or "")
+    if not match:
+        return None, None
+    return _bound(match.group(1)), _bound(match.group(2))
+
+
+def _literal(value):
+    return f"'{value.isoformat()}'"
+
+
+def is_partitioned(table):
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [table])
+        row = cursor.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def get_partitions(cursor, table):
+    """
+    Retorna [(nome, início, fim, is_default)]
+    """
+    cursor.execute(
+        """
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = %s::regclass
+        """,
+        [table],
+    )
+    items = []
+    for name, expression in cursor.fetchall():
+        start, end = parse_partition_bound(expression)
+        items.append((name, start, end, expression == "DEFAULT"))
+    return items
+
+
+def _covered(partitions, month):
+    for name, start, end, is_default in partitions:
+        if is_default:
+            continue
+        if (start is None or start <= month) and (end is None or month < end):
+            return True
+    return False
+
+
+def _copy_indexes_and_foreign_keys(cursor, source, target):
+    qn = connection.ops.quote_name
+    cursor.execute(
+        """
+        SELECT i.relname, pg_get_indexdef(i.oid)
+        FROM pg_index x JOIN pg_class i ON i.oid = x.indexrelid
+        WHERE x.indrelid = %s::regclass
+        AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.oid)
+        """,
+        [source],
+    )
+    for name, definition in cursor.fetchall():
+        # os nomes dos índices são únicos no schema: os do Django passam
+        # para a tabela particionada e os da tabela antiga são renomeados
+        cursor.execute(
+            f"ALTER INDEX {qn(name)} RENAME TO {qn(name[:55] + '_legacy')}"
+        )
+        cursor.execute(
+            re.sub(r" ON (ONLY )?\S+ USING ", f" ON {qn(target)} USING ", definition, 1)
+        )
+
+    cursor.execute(
+        """
+        SELECT conname, pg_get_constraintdef(oid)
+        FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'
+        """,
+        [source],
+    )
+    for name, definition in cursor.fetchall():
+        cursor.execute(f"ALTER TABLE {qn(target)} ADD CONSTRAINT {qn(name)} {definition}")
+
+
+def _move_id_sequence(cursor, source, target):
+    """
+    Colunas identity não são aceitas em tabelas particionadas (PostgreSQL
+    < 17): id passa a usar uma sequência comum, que continua a numeração
+    """
+    qn = connection.ops.quote_name
+    cursor.execute(
+        """
+        SELECT attidentity, pg_get_serial_sequence(%s, 'id'),
+            format_type(atttypid, atttypmod)
+        FROM pg_attribute WHERE attrelid = %s::regclass AND attname = 'id'
+        """,
+        [source, source],
+    )
+    identity, sequence, column_type = cursor.fetchone()
+    if not sequence or column_type not in ("integer", "bigint"):
+        # chave primária UUID
+        return
+    if identity:
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {qn(source)}")
+        last_id = cursor.fetchone()[0]
+        cursor.execute(f"ALTER TABLE {qn(source)} ALTER COLUMN id DROP IDENTITY")
+        sequence = f"{target}_id_seq"
+        cursor.execute(f"CREATE SEQUENCE {qn(sequence)} AS {column_type}")
+        if last_id:
+            cursor.execute("SELECT setval(%s, %s)", [sequence, last_id])
+        sequence = qn(sequence)
+    cursor.execute(
+        f"ALTER TABLE {qn(target)} ALTER COLUMN id SET DEFAULT nextval('{sequence}')"
+    )
+    cursor.execute(f"ALTER TABLE {qn(source)} ALTER COLUMN id DROP DEFAULT")
+    cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {qn(target)}.id")
+
+
+def convert_to_partitioned(schema_editor, table, months_ahead=None):
+    """
+    Converte table em tabela particionada por mês (coluna created),
+    sem copiar os registros existentes
+    """
+    if schema_editor.connection.vendor != "postgresql" or is_partitioned(table):
+        return
+    qn = schema_editor.quote_name
+    legacy = f"{table}_legacy"
+    bound = add_months(month_start(timezone.now()), 1)
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(legacy)}")
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} (LIKE {qn(legacy)} {LIKE_OPTIONS}) "
+            f"PARTITION BY RANGE ({qn(PARTITION_COLUMN)})"
+        )
+        _move_id_sequence(cursor, legacy, table)
+        # a chave primária precisa incluir a coluna de particionamento
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(table + '_pk')} "
+            f"PRIMARY KEY (id, {qn(PARTITION_COLUMN)})"
+        )
+        _copy_indexes_and_foreign_keys(cursor, legacy, table)
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(legacy)} "
+            f"FOR VALUES FROM (MINVALUE) TO ({_literal(bound)})"
+        )
+        cursor.execute(
+            f"CREATE TABLE {qn(table + '_default')} PARTITION OF {qn(table)} DEFAULT"
+        )
+    ensure_partitions(table, months_ahead)
+
+
+def create_partition(cursor, table, month):
+    """
+    Cria a partição do mês, movendo para ela os registros do mês que
+    estiverem na partição DEFAULT
+    """
+    qn = connection.ops.quote_name
+    name = partition_name(table, month)
+    end = add_months(month, 1)
+    cursor.execute(f"CREATE TABLE {qn(name)} (LIKE {qn(table)} {LIKE_OPTIONS})")
+    cursor.execute(
+        f"WITH moved AS (DELETE FROM {qn(table + '_default')} "
+        f"WHERE {qn(PARTITION_COLUMN)} >= %s AND {qn(PARTITION_COLUMN)} < %s "
+        f"RETURNING *) INSERT INTO {qn(name)} SELECT * FROM moved",
+        [month, end],
+    )
+    cursor.execute(
+        f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(name)} "
+        f"FOR VALUES FROM ({_literal(month)}) TO ({_literal(end)})"
+    )
+    return name
+
+
+def ensure_partitions(table, months_ahead=None):
+    """
+    Garante as partições do mês corrente e dos months_ahead meses seguintes
+    """
+    if months_ahead is None:
+        months_ahead = getattr(settings, "EVENT_PARTITION_MONTHS_AHEAD", 3)
+    if not is_partitioned(table):
+        return []
+    current = month_start(timezone.now())
+    created = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        partitions = get_partitions(cursor, table)
+        for i in range(months_ahead + 1):
+            month = add_months(current, i)
+            if not _covered(partitions, month):
+                created.append(create_partition(cursor, table, month))
+    return created
+
+
+def drop_expired_partitions(table, retention_months):
+    """
+    Remove as partições cujos registros são todos anteriores ao início
+    do prazo de retenção e os registros antigos da partição DEFAULT
+    """
+    if not retention_months or not is_partitioned(table):
+        return []
+    qn = connection.ops.quote_name
+    cutoff = add_months(month_start(timezone.now()), -retention_months)
+    dropped = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        for name, start, end, is_default in get_partitions(cursor, table):
+            if is_default:
+                cursor.execute(
+                    f"DELETE FROM {qn(name)} WHERE {qn(PARTITION_COLUMN)} < %s",
+                    [cutoff],
+                )
+            elif end is not None and end <= cutoff:
+                cursor.execute(f"DROP TABLE {qn(name)}")
+                dropped.append(name)
+    return dropped
+
+
+def maintain_partitions():
+    """
+    Cria as próximas partições e aplica a retenção de cada tabela de
+    EVENT_RETENTION_MONTHS
+    """
+    result = {}
+    for label, retention_months in getattr(
+        settings, "EVENT_RETENTION_MONTHS", {}
+    ).items():
+        table = apps.get_model(label)._meta.db_table
+        try:
+            result[label] = {
+                "created": ensure_partitions(table),
+                "dropped": drop_expired_partitions(table, retention_months),
+            }
+        except Exception as e:
+            logging.exception(f"Unable to maintain partitions of {table}: {e}")
+            result[label] = {"error": str(e)}
+    return result
@@ -1,7 +1,16 @@
 # profiling_tools.py - Versão expandida com suporte a métodos e properties
+#
+# As consultas são medidas com connection.execute_wrapper (número de
+# consultas, tempo no banco e as N mais lentas), sem depender de DEBUG=True
+# (connection.queries). Com amostragem (PROFILING_SAMPLE_RATE) e sem
+# psutil a cada chamada (PROFILING_TRACK_MEMORY), o profiling pode ficar
+# ativo em produção.
 
 import functools
+import heapq
+import itertools
 import logging
+import random
 import time
 
 import psutil
@@ -15,12 +24,123 @@ PROFILING_LOG_SLOW_REQUESTS = getattr(
     settings, "PROFILING_LOG_SLOW_REQUESTS", 0.4
 )  # segundos
 PROFILING_LOG_HIGH_MEMORY = getattr(settings, "PROFILING_LOG_HIGH_MEMORY", 40)  # MB
+# fração das chamadas medidas (1.0 = todas)
+PROFILING_SAMPLE_RATE = getattr(settings, "PROFILING_SAMPLE_RATE", 1.0)
+# número de consultas mais lentas registradas por chamada
+PROFILING_TOP_QUERIES = getattr(settings, "PROFILING_TOP_QUERIES", 3)
+# mede a memória (rss) antes e depois de cada chamada
+PROFILING_TRACK_MEMORY = getattr(settings, "PROFILING_TRACK_MEMORY", False)
 
 profiling_logger = logging.getLogger("profiling")
 profiling_logger.warning(f"PROFILING_ENABLED={PROFILING_ENABLED}")
 profiling_logger.warning(f"PROFILING_LOG_ALL={PROFILING_LOG_ALL}")
 profiling_logger.warning(f"PROFILING_LOG_SLOW_REQUESTS={PROFILING_LOG_SLOW_REQUESTS}")
 profiling_logger.warning(f"PROFILING_LOG_HIGH_MEMORY={PROFILING_LOG_HIGH_MEMORY}")
+profiling_logger.warning(f"PROFILING_SAMPLE_RATE={PROFILING_SAMPLE_RATE}")
+
+_process = None
+
+
+def _rss_mb():
+    global _process
+    if _process is None:
+        _process = psutil.Process()
+    return _process.memory_info().rss / 1024 / 1024
+
+
+def is_sampled(sample_rate=None):
+    sample_rate = PROFILING_SAMPLE_RATE if sample_rate is None else sample_rate
+    return sample_rate >= 1 or random.random() < sample_rate
+
+
+class QueryStats:
+    """
+    Callable para connection.execute_wrapper: conta as consultas, soma o
+    tempo no banco e mantém as top_n consultas mais lentas
+    """
+
+    def __init__(self, top_n=None):
+        self.top_n = PROFILING_TOP_QUERIES if top_n is None else top_n
+        self.count = 0
+        self.duration = 0.0
+        self._slowest = []
+        self._seq = itertools.count()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.duration += elapsed
+            if self.top_n:
+                item = (elapsed, next(self._seq), sql)
+                if len(self._slowest) < self.top_n:
+                    heapq.heappush(self._slowest, item)
+                else:
+                    heapq.heappushpop(self._slowest, item)
+
+    @property
+    def slowest(self):
+        """
+        Lista de (segundos, sql) da consulta mais lenta para a mais rápida
+        """
+        return [(elapsed, sql) for elapsed, _, sql in sorted(self._slowest, reverse=True)]
+
+
+class Profile:
+    """
+    Mede duração, consultas (QueryStats) e, opcionalmente, memória
+    do bloco de código
+
+    with Profile() as profile:
+        ...
+    profile.duration, profile.queries.count, profile.queries.slowest
+    """
+
+    def __init__(self, track_memory=None, top_n=None):
+        self.track_memory = (
+            PROFILING_TRACK_MEMORY if track_memory is None else track_memory
+        )
+        self.queries = QueryStats(top_n)
+        self.duration = None
+        self.memory_used = None
+        self._start_memory = None
+
+    def __enter__(self):
+        if self.track_memory:
+            self._start_memory = _rss_mb()
+        self._wrapper = connection.execute_wrapper(self.queries)
+        self._wrapper.__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.duration = time.perf_counter() - self._start
+        self._wrapper.__exit__(exc_type, exc_value, traceback)
+        if self.track_memory:
+            self.memory_used = _rss_mb() - self._start_memory
+        return False
+
+    @property
+    def is_slow(self):
+        return self.duration > PROFILING_LOG_SLOW_REQUESTS or (
+            self.memory_used is not None
+            and self.memory_used > PROFILING_LOG_HIGH_MEMORY
+        )
+
+    def metrics(self, precision=2):
+        msg = f"duration: {self.duration:.{precision}f}s | "
+        if self.memory_used is not None:
+            msg += f"memory: +{self.memory_used:.1f}MB | "
+        return msg + (
+            f"queries: {self.queries.count} | db: {self.queries.duration:.{precision}f}s"
+        )
+
+    def log_slow_queries(self, label="Query"):
+        for i, (elapsed, sql) in enumerate(self.queries.slowest, 1):
+            profiling_logger.warning(f"  {label} #{i}: {elapsed:.3f}s - {sql[:100]}...")
 
 
 def profile_endpoint(func):
@@ -33,73 +153,48 @@ def profile_endpoint(func):
 
     @functools.wraps(func)
     def wrapper(self, request, *args, **kwargs):
-        # Dados iniciais
-        process = psutil.Process()
-        start_time = time.time()
-        start_memory = process.memory_info().rss / 1024 / 1024  # MB
-        start_queries = len(connection.queries)
+        if not is_sampled():
+            return func(self, request, *args, **kwargs)
 
         try:
             # Executa função original
-            response = func(self, request, *args, **kwargs)
-
-            # Coleta métricas finais
-            end_time = time.time()
-            end_memory = process.memory_info().rss / 1024 / 1024
-            end_queries = len(connection.queries)
-
-            # Calcula diferenças
-            duration = end_time - start_time
-            memory_used = end_memory - start_memory
-            queries_count = end_queries - start_queries
-
-            msg = (
-                f"request detected | "
-                f"endpoint: {request.path} | "
-                f"duration: {duration:.2f}s | "
-                f"memory: +{memory_used:.1f}MB | "
-                f"queries: {queries_count} | "
-                f"user: {getattr(request.user, 'username', 'anonymous')}"
-            )
-
-            #  Log apenas se for relevante
-            if (duration > PROFILING_LOG_SLOW_REQUESTS) or (
-                memory_used > PROFILING_LOG_HIGH_MEMORY
-            ):
-                profiling_logger.warning(f"Slow {msg}")
-                # Se muito lento, log das queries mais demoradas
-                if duration > PROFILING_LOG_SLOW_REQUESTS * 2:
-                    slow_queries = sorted(
-                        connection.queries[start_queries:end_queries],
-                        key=lambda x: float(x.get("time", 0)),
-                        reverse=True,
-                    )[:3]
-
-                    for i, query in enumerate(slow_queries, 1):
-                        profiling_logger.warning(
-                            f"  Slow query #{i}: {query['time']}s - {query['sql'][:100]}..."
-                        )
-            elif PROFILING_LOG_ALL:
-                profiling_logger.warning(msg)
-
-            # Adiciona headers opcionais
-            if hasattr(response, "headers"):
-                response["X-Response-Time"] = f"{duration:.3f}"
-                if settings.DEBUG:
-                    response["X-DB-Queries"] = str(queries_count)
-                    response["X-Memory-Used"] = f"{memory_used:.1f}"
-
-            return response
-
+            with Profile() as profile:
+                response = func(self, request, *args, **kwargs)
         except Exception as e:
             # Log erro mas não interfere
-            duration = time.time() - start_time
             profiling_logger.error(
                 f"Request failed | endpoint: {request.path} | "
-                f"duration: {duration:.2f}s | error: {str(e)}"
+                f"{profile.metrics()} | error: {str(e)}"
             )
             raise
 
+        msg = (
+            f"request detected | "
+            f"endpoint: {request.path} | "
+            f"{profile.metrics()} | "
+            f"user: {getattr(request.user, 'username', 'anonymous')}"
+        )
+
+        #  Log apenas se for relevante
+        if profile.is_slow:
+            profiling_logger.warning(f"Slow {msg}")
+            # Se muito lento, log das queries mais demoradas
+            if profile.duration > PROFILING_LOG_SLOW_REQUESTS * 2:
+                profile.log_slow_queries("Slow query")
+        elif PROFILING_LOG_ALL:
+            profiling_logger.warning(msg)
+
+        # Adiciona headers opcionais
+        if hasattr(response, "headers"):
+            response["X-Response-Time"] = f"{profile.duration:.3f}"
+            if settings.DEBUG:
+                response["X-DB-Queries"] = str(profile.queries.count)
+                response["X-DB-Time"] = f"{profile.queries.duration:.3f}"
+                if profile.memory_used is not None:
+                    response["X-Memory-Used"] = f"{profile.memory_used:.1f}"
+
+        return response
+
     return wrapper
 
 
@@ -112,6 +207,9 @@ def profile_classmethod(func):
 
     @functools.wraps(func)
     def wrapper(cls, *args, **kwargs):
+        if not is_sampled():
+            return func(cls, *args, **kwargs)
+
         # Extrai informações específicas para PidProviderXML.register
         method_info = {
             "class": cls.__name__,
@@ -134,49 +232,35 @@ def profile_classmethod(func):
         )
         method_info["filename"] = kwargs.get("filename", method_info["filename"])
 
-        # Profiling
-        process = psutil.Process()
-        start_time = time.time()
-        start_memory = process.memory_info().rss / 1024 / 1024
-        start_queries = len(connection.queries)
-
         try:
-            result = func(cls, *args, **kwargs)
-
-            # Métricas
-            duration = time.time() - start_time
-            memory_used = process.memory_info().rss / 1024 / 1024 - start_memory
-            queries_count = len(connection.queries) - start_queries
-
-            # Log
-            msg = (
-                f"classmethod | "
-                f"{method_info['class']}.{method_info['method']} | "
-                f"duration: {duration:.2f}s | "
-                f"memory: +{memory_used:.1f}MB | "
-                f"queries: {queries_count} | "
-                f"user: {method_info['user']} | "
-                f"file: {method_info['filename']}"
-            )
-            if (duration > PROFILING_LOG_SLOW_REQUESTS) or (
-                memory_used > PROFILING_LOG_HIGH_MEMORY
-            ):
-                profiling_logger.warning(f"Slow {msg}")
-            elif PROFILING_LOG_ALL:
-                profiling_logger.warning(msg)
-            return result
-
+            with Profile() as profile:
+                result = func(cls, *args, **kwargs)
         except Exception as e:
-            duration = time.time() - start_time
             profiling_logger.error(
                 f"Classmethod failed | "
                 f"{method_info['class']}.{method_info['method']} | "
-                f"duration: {duration:.2f}s | "
+                f"{profile.metrics()} | "
                 f"error: {str(e)} | "
                 f"user: {method_info['user']}"
             )
             raise
 
+        # Log
+        msg = (
+            f"classmethod | "
+            f"{method_info['class']}.{method_info['method']} | "
+            f"{profile.metrics()} | "
+            f"user: {method_info['user']} | "
+            f"file: {method_info['filename']}"
+        )
+        if profile.is_slow:
+            profiling_logger.warning(f"Slow {msg}")
+            if profile.duration > PROFILING_LOG_SLOW_REQUESTS * 2:
+                profile.log_slow_queries()
+        elif PROFILING_LOG_ALL:
+            profiling_logger.warning(msg)
+        return result
+
     return wrapper
 
 
@@ -190,6 +274,9 @@ def profile_method(func):
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
+        if not is_sampled():
+            return func(self, *args, **kwargs)
+
         # Informações do método
         method_info = {
             "class": self.__class__.__name__,
@@ -197,64 +284,37 @@ def profile_method(func):
             "instance_id": getattr(self, "id", getattr(self, "pk", "no_id")),
         }
 
-        # Profiling
-        process = psutil.Process()
-        start_time = time.time()
-        start_memory = process.memory_info().rss / 1024 / 1024
-        start_queries = len(connection.queries)
-
         try:
-            result = func(self, *args, **kwargs)
-
-            # Métricas
-            duration = time.time() - start_time
-            memory_used = process.memory_info().rss / 1024 / 1024 - start_memory
-            queries_count = len(connection.queries) - start_queries
-
-            # Log
-            msg = (
-                f"method | "
-                f"{method_info['class']}.{method_info['method']} | "
-                f"instance: {method_info['instance_id']} | "
-                f"duration: {duration:.2f}s | "
-                f"memory: +{memory_used:.1f}MB | "
-                f"queries: {queries_count}"
-            )
-
-            if (duration > PROFILING_LOG_SLOW_REQUESTS) or (
-                memory_used > PROFILING_LOG_HIGH_MEMORY
-            ):
-                profiling_logger.warning(f"Slow {msg}")
-
-                # Log queries lentas se muito devagar
-                if duration > PROFILING_LOG_SLOW_REQUESTS * 2 and queries_count > 0:
-                    slow_queries = sorted(
-                        connection.queries[
-                            start_queries : start_queries + queries_count
-                        ],
-                        key=lambda x: float(x.get("time", 0)),
-                        reverse=True,
-                    )[:3]
-
-                    for i, query in enumerate(slow_queries, 1):
-                        profiling_logger.warning(
-                            f"  Query #{i}: {query['time']}s - {query['sql'][:100]}..."
-                        )
-            elif PROFILING_LOG_ALL:
-                profiling_logger.info(msg)
-
-            return result
-
+            with Profile() as profile:
+                result = func(self, *args, **kwargs)
         except Exception as e:
-            duration = time.time() - start_time
             profiling_logger.error(
                 f"Method failed | "
                 f"{method_info['class']}.{method_info['method']} | "
-                f"duration: {duration:.2f}s | "
+                f"{profile.metrics()} | "
                 f"error: {str(e)}"
             )
             raise
 
+        # Log
+        msg = (
+            f"method | "
+            f"{method_info['class']}.{method_info['method']} | "
+            f"instance: {method_info['instance_id']} | "
+            f"{profile.metrics()}"
+        )
+
+        if profile.is_slow:
+            profiling_logger.warning(f"Slow {msg}")
+
+            # Log queries lentas se muito devagar
+            if profile.duration > PROFILING_LOG_SLOW_REQUESTS * 2:
+                profile.log_slow_queries()
+        elif PROFILING_LOG_ALL:
+            profiling_logger.info(msg)
+
+        return result
+
     return wrapper
 
 
@@ -272,6 +332,9 @@ def profile_property(func):
 
     @functools.wraps(func)
     def wrapper(self):
+        if not is_sampled():
+            return func(self)
+
         # Informações da property
         prop_info = {
             "class": self.__class__.__name__,
@@ -279,47 +342,38 @@ def profile_property(func):
             "instance_id": getattr(self, "id", getattr(self, "pk", "no_id")),
         }
 
-        # Profiling leve para properties (sem psutil a cada chamada)
-        start_time = time.time()
-        start_queries = len(connection.queries)
-
+        # Profiling leve para properties (sem medir memória)
         try:
-            result = func(self)
-
-            # Métricas
-            duration = time.time() - start_time
-            queries_count = len(connection.queries) - start_queries
-
-            # Log apenas se lento (properties devem ser rápidas)
-            if (
-                duration > PROFILING_LOG_SLOW_REQUESTS / 2
-            ):  # Threshold menor para properties
-                msg = (
-                    f"property | "
-                    f"{prop_info['class']}.{prop_info['property']} | "
-                    f"instance: {prop_info['instance_id']} | "
-                    f"duration: {duration:.3f}s | "
-                    f"queries: {queries_count}"
-                )
-                profiling_logger.warning(f"Slow {msg}")
-            elif PROFILING_LOG_ALL and duration > 0.01:  # Log apenas se > 10ms
-                profiling_logger.info(
-                    f"property | {prop_info['class']}.{prop_info['property']} | "
-                    f"duration: {duration:.3f}s"
-                )
-
-            return result
-
+            with Profile(track_memory=False) as profile:
+                result = func(self)
         except Exception as e:
-            duration = time.time() - start_time
             profiling_logger.error(
                 f"Property failed | "
                 f"{prop_info['class']}.{prop_info['property']} | "
-                f"duration: {duration:.3f}s | "
+                f"duration: {profile.duration:.3f}s | "
                 f"error: {str(e)}"
             )
             raise
 
+        # Log apenas se lento (properties devem ser rápidas)
+        if (
+            profile.duration > PROFILING_LOG_SLOW_REQUESTS / 2
+        ):  # Threshold menor para properties
+            msg = (
+                f"property | "
+                f"{prop_info['class']}.{prop_info['property']} | "
+                f"instance: {prop_info['instance_id']} | "
+                f"{profile.metrics(precision=3)}"
+            )
+            profiling_logger.warning(f"Slow {msg}")
+        elif PROFILING_LOG_ALL and profile.duration > 0.01:  # Log apenas se > 10ms
+            profiling_logger.info(
+                f"property | {prop_info['class']}.{prop_info['property']} | "
+                f"duration: {profile.duration:.3f}s"
+            )
+
+        return result
+
     return wrapper
 
 
@@ -343,52 +397,42 @@ def profile_cached_property(func):
         cache_attr = f"_{func.__name__}"
         is_cached = hasattr(self, cache_attr)
 
+        if is_cached or not is_sampled():
+            # Só o primeiro cálculo é medido
+            return func(self)
+
         prop_info = {
             "class": self.__class__.__name__,
             "property": func.__name__,
             "instance_id": getattr(self, "id", getattr(self, "pk", "no_id")),
-            "cached": is_cached,
         }
 
-        if is_cached and not PROFILING_LOG_ALL:
-            # Se já está em cache e não estamos logando tudo, retorna direto
-            return func(self)
-
-        start_time = time.time()
-        start_queries = len(connection.queries) if not is_cached else 0
-
         try:
-            result = func(self)
-
-            if not is_cached:  # Log apenas no primeiro cálculo
-                duration = time.time() - start_time
-                queries_count = len(connection.queries) - start_queries
-
-                msg = (
-                    f"cached_property (first call) | "
-                    f"{prop_info['class']}.{prop_info['property']} | "
-                    f"instance: {prop_info['instance_id']} | "
-                    f"duration: {duration:.3f}s | "
-                    f"queries: {queries_count}"
-                )
-
-                if duration > PROFILING_LOG_SLOW_REQUESTS:
-                    profiling_logger.warning(f"Slow {msg}")
-                elif PROFILING_LOG_ALL:
-                    profiling_logger.info(msg)
-
-            return result
-
+            with Profile(track_memory=False) as profile:
+                result = func(self)
         except Exception as e:
-            duration = time.time() - start_time
             profiling_logger.error(
                 f"Cached property failed | "
                 f"{prop_info['class']}.{prop_info['property']} | "
-                f"duration: {duration:.3f}s | "
+                f"duration: {profile.duration:.3f}s | "
                 f"error: {str(e)}"
             )
             raise
 
+        msg = (
+            f"cached_property (first call) | "
+            f"{prop_info['class']}.{prop_info['property']} | "
+            f"instance: {prop_info['instance_id']} | "
+            f"{profile.metrics(precision=3)}"
+        )
+
+        if profile.duration > PROFILING_LOG_SLOW_REQUESTS:
+            profiling_logger.warning(f"Slow {msg}")
+        elif PROFILING_LOG_ALL:
+            profiling_logger.info(msg)
+
+        return result
+
     return wrapper
 
 
@@ -405,6 +449,9 @@ def profile_function(func):
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        if not is_sampled():
+            return func(*args, **kwargs)
+
         # Informações da função
         func_info = {
             "function": func.__name__,
@@ -424,80 +471,52 @@ def profile_function(func):
             else:
                 func_info["first_arg"] = arg_class
 
-        process = psutil.Process()
-        start_time = time.time()
-        start_memory = process.memory_info().rss / 1024 / 1024
-        start_queries = len(connection.queries)
-
         try:
-            result = func(*args, **kwargs)
-
-            # Métricas
-            duration = time.time() - start_time
-            memory_used = process.memory_info().rss / 1024 / 1024 - start_memory
-            queries_count = len(connection.queries) - start_queries
-
-            # Informações adicionais sobre o resultado
-            result_info = ""
-            if result is not None:
-                if hasattr(result, "__len__"):
-                    result_info = f" | result_len: {len(result)}"
-                elif hasattr(result, "count"):
-                    try:
-                        result_info = f" | result_count: {result.count()}"
-                    except:
-                        pass
-
-            msg = (
-                f"function | "
-                f"{func_info['module']}.{func_info['function']} | "
-                f"args: {func_info['args_count']}, kwargs: {func_info['kwargs_count']} | "
-                f"duration: {duration:.2f}s | "
-                f"memory: +{memory_used:.1f}MB | "
-                f"queries: {queries_count}"
-                f"{result_info}"
-            )
-
-            # Adiciona info do primeiro argumento se disponível
-            if "first_arg" in func_info:
-                msg = msg.replace(
-                    " | args:", f" | first_arg: {func_info['first_arg']} | args:"
-                )
-
-            if (duration > PROFILING_LOG_SLOW_REQUESTS) or (
-                memory_used > PROFILING_LOG_HIGH_MEMORY
-            ):
-                profiling_logger.warning(f"Slow {msg}")
-
-                # Log queries lentas
-                if duration > PROFILING_LOG_SLOW_REQUESTS * 2 and queries_count > 0:
-                    slow_queries = sorted(
-                        connection.queries[
-                            start_queries : start_queries + queries_count
-                        ],
-                        key=lambda x: float(x.get("time", 0)),
-                        reverse=True,
-                    )[:3]
-
-                    for i, query in enumerate(slow_queries, 1):
-                        profiling_logger.warning(
-                            f"  Query #{i}: {query['time']}s - {query['sql'][:100]}..."
-                        )
-            elif PROFILING_LOG_ALL:
-                profiling_logger.info(msg)
-
-            return result
-
+            with Profile() as profile:
+                result = func(*args, **kwargs)
         except Exception as e:
-            duration = time.time() - start_time
             profiling_logger.error(
                 f"Function failed | "
                 f"{func_info['module']}.{func_info['function']} | "
-                f"duration: {duration:.2f}s | "
+                f"{profile.metrics()} | "
                 f"error: {str(e)}"
             )
             raise
 
+        # Informações adicionais sobre o resultado
+        # (sem result.count(), que faria uma consulta extra)
+        result_info = ""
+        if result is not None and hasattr(result, "__len__"):
+            try:
+                result_info = f" | result_len: {len(result)}"
+            except TypeError:
+                pass
+
+        msg = (
+            f"function | "
+            f"{func_info['module']}.{func_info['function']} | "
+            f"args: {func_info['args_count']}, kwargs: {func_info['kwargs_count']} | "
+            f"{profile.metrics()}"
+            f"{result_info}"
+        )
+
+        # Adiciona info do primeiro argumento se disponível
+        if "first_arg" in func_info:
+            msg = msg.replace(
+                " | args:", f" | first_arg: {func_info['first_arg']} | args:"
+            )
+
+        if profile.is_slow:
+            profiling_logger.warning(f"Slow {msg}")
+
+            # Log queries lentas
+            if profile.duration > PROFILING_LOG_SLOW_REQUESTS * 2:
+                profile.log_slow_queries()
+        elif PROFILING_LOG_ALL:
+            profiling_logger.info(msg)
+
+        return result
+
     return wrapper
 
 
@@ -516,48 +535,39 @@ def profile_staticmethod(func):
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        if not is_sampled():
+            return func(*args, **kwargs)
+
         # Para staticmethod, não temos self/cls
         method_info = {"function": func.__name__, "module": func.__module__}
 
-        process = psutil.Process()
-        start_time = time.time()
-        start_memory = process.memory_info().rss / 1024 / 1024
-        start_queries = len(connection.queries)
-
         try:
-            result = func(*args, **kwargs)
-
-            duration = time.time() - start_time
-            memory_used = process.memory_info().rss / 1024 / 1024 - start_memory
-            queries_count = len(connection.queries) - start_queries
-
-            msg = (
-                f"staticmethod | "
-                f"{method_info['module']}.{method_info['function']} | "
-                f"duration: {duration:.2f}s | "
-                f"memory: +{memory_used:.1f}MB | "
-                f"queries: {queries_count}"
-            )
-
-            if (duration > PROFILING_LOG_SLOW_REQUESTS) or (
-                memory_used > PROFILING_LOG_HIGH_MEMORY
-            ):
-                profiling_logger.warning(f"Slow {msg}")
-            elif PROFILING_LOG_ALL:
-                profiling_logger.info(msg)
-
-            return result
-
+            with Profile() as profile:
+                result = func(*args, **kwargs)
         except Exception as e:
-            duration = time.time() - start_time
             profiling_logger.error(
                 f"Staticmethod failed | "
                 f"{method_info['module']}.{method_info['function']} | "
-                f"duration: {duration:.2f}s | "
+                f"{profile.metrics()} | "
                 f"error: {str(e)}"
             )
             raise
 
+        msg = (
+            f"staticmethod | "
+            f"{method_info['module']}.{method_info['function']} | "
+            f"{profile.metrics()}"
+        )
+
+        if profile.is_slow:
+            profiling_logger.warning(f"Slow {msg}")
+            if profile.duration > PROFILING_LOG_SLOW_REQUESTS * 2:
+                profile.log_slow_queries()
+        elif PROFILING_LOG_ALL:
+            profiling_logger.info(msg)
+
+        return result
+
     return wrapper
 
 
@@ -565,35 +575,30 @@ def profile_staticmethod(func):
 class LightweightProfilingMiddleware:
     """
     Middleware minimalista de profiling
-    Monitora TODAS as requisições automaticamente
+    Monitora as requisições automaticamente (conforme PROFILING_SAMPLE_RATE)
     """
 
     def __init__(self, get_response):
         self.get_response = get_response
-        self.process = psutil.Process()
 
     def __call__(self, request):
-        if not PROFILING_ENABLED:
+        if not PROFILING_ENABLED or not is_sampled():
             return self.get_response(request)
 
         # Pula arquivos estáticos
         if request.path.startswith("/static/") or request.path.startswith("/media/"):
             return self.get_response(request)
 
-        start_time = time.time()
-        start_memory = self.process.memory_info().rss / 1024 / 1024
-
-        response = self.get_response(request)
-
-        duration = time.time() - start_time
-        memory_delta = self.process.memory_info().rss / 1024 / 1024 - start_memory
+        with Profile() as profile:
+            response = self.get_response(request)
 
         # Log apenas requisições problemáticas
-        if duration > PROFILING_LOG_SLOW_REQUESTS:
+        if profile.is_slow:
             profiling_logger.warning(
-                f"Slow: {request.method} {request.path} - "
-                f"{duration:.2f}s - {memory_delta:+.1f}MB"
+                f"Slow: {request.method} {request.path} - {profile.metrics()}"
             )
+            if profile.duration > PROFILING_LOG_SLOW_REQUESTS * 2:
+                profile.log_slow_queries()
 
         return response
 
@@ -1,4 +1,5 @@
 import logging
+import unicodedata
 
 ITEMS_SEP_FOR_LOCATION = [";", ", ", "|", "/"]
 PARTS_SEP_FOR_LOCATION = [" - ", "- ", " -", ", ", "(", "/"]
@@ -13,6 +14,20 @@ def remove_extra_spaces(text):
     # Padroniza a quantidade de espaços
     return " ".join(text.split())
 
+def fold_text(text):
+    """
+    Normaliza o texto para comparação: sem acentos, sem diferença entre
+    maiúsculas e minúsculas e com espaços padronizados
+    Ex.: "  São   Paulo " -> "sao paulo"
+    """
+    text = remove_extra_spaces(text)
+    if not text:
+        return text
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return text.casefold().strip(" .")
+
+
 def remove_html_tags(text):
     if not text:
         return text
@@ -1,4 +1,5 @@
 import threading
+from contextlib import contextmanager
 
 _thread_locals = threading.local()
 
@@ -27,3 +28,35 @@ def set_current_user(user):
 def get_current_user():
     """Retorna o usuário atual da thread"""
     return getattr(_thread_locals, "user", None)
+
+
+@contextmanager
+def run_memo():
+    """
+    Ativa, na thread atual, a memoização de objetos resolvidos durante uma
+    execução (ex.: carga de todos os periódicos de uma coleção).
+    Ao sair do bloco, os valores memorizados são descartados.
+    """
+    if getattr(_thread_locals, "memo", None) is not None:
+        # execução aninhada usa a memória da execução externa
+        yield _thread_locals.memo
+        return
+    _thread_locals.memo = {}
+    try:
+        yield _thread_locals.memo
+    finally:
+        _thread_locals.memo = None
+
+
+def memoize(namespace, key, func):
+    """
+    Retorna o valor memorizado para (namespace, key) ou executa func.
+    Sem run_memo ativo, apenas executa func.
+    """
+    memo = getattr(_thread_locals, "memo", None)
+    if memo is None:
+        return func()
+    values = memo.setdefault(namespace, {})
+    if key not in values:
+        values[key] = func()
+    return values[key]
@@ -0,0 +1,326 @@
+"""
+Rastreamento (tracing) de ponta a ponta no formato do OpenTelemetry
+
+Cada span tem trace_id / span_id no formato W3C (traceparent) e é exportado
+em JSON OTLP, para um arquivo local (uma linha por lote de spans) ou para
+um coletor OpenTelemetry (OTLP/HTTP).
+
+O contexto é propagado entre tarefas Celery pelo cabeçalho "traceparent"
+da mensagem (ver config.celery_signals): uma tarefa publicada dentro de
+um span continua o mesmo trace no worker.
+
+Configuração (settings):
+    TRACING_ENABLED, TRACING_SAMPLE_RATE, TRACING_EXPORTER ("file" ou "otlp"),
+    TRACING_FILE, TRACING_OTLP_ENDPOINT, TRACING_DB_QUERIES,
+    TRACING_SERVICE_NAME
+"""
+
+import abc
+import atexit
+import contextvars
+import functools
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from django.conf import settings
+
+TRACEPARENT_HEADER = "traceparent"
+
+_current_span = contextvars.ContextVar("tracing_current_span", default=None)
+
+
+def is_enabled():
+    return getattr(settings, "TRACING_ENABLED", False)
+
+
+def _new_id(bits):
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def parse_traceparent(value):
+    """
+    "00-<trace_id>-<span_id>-<flags>" -> (trace_id, span_id, sampled) ou None
+    """
+    try:
+        version, trace_id, span_id, flags = value.split("-")
+        int(trace_id, 16)
+        int(span_id, 16)
+        return trace_id, span_id, bool(int(flags, 16) & 1)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _attribute_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    def __init__(self, name, trace_id, parent_id=None, sampled=True, attributes=None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.attributes = {
+            key: value for key, value in (attributes or {}).items() if value is not None
+        }
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.error = None
+
+    @property
+    def traceparent(self):
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    @property
+    def duration(self):
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def set_attribute(self, key, value):
+        if value is not None:
+            self.attributes[key] = value
+
+    def record_exception(self, exception):
+        self.error = f"{type(exception).__name__}: {exception}"
+
+    def end(self):
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.sampled:
+            get_exporter().export(self)
+
+    def to_otlp(self):
+        data = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _attribute_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            # 1: OK, 2: ERROR
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            data["parentSpanId"] = self.parent_id
+        return data
+
+
+def start_span(name, attributes=None, parent=None, new_trace=False):
+    """
+    Cria um span (sem ativá-lo)
+
+    parent: Span ou traceparent; se não informado, usa o span ativo
+    new_trace: inicia um novo trace, ignorando o span ativo
+    """
+    if parent is None and not new_trace:
+        parent = _current_span.get()
+    if isinstance(parent, str):
+        parsed = parse_traceparent(parent)
+        if parsed:
+            trace_id, parent_id, sampled = parsed
+            return Span(name, trace_id, parent_id, sampled, attributes)
+    elif parent is not None:
+        return Span(name, parent.trace_id, parent.span_id, parent.sampled, attributes)
+
+    sample_rate = getattr(settings, "TRACING_SAMPLE_RATE", 1.0)
+    sampled = sample_rate >= 1 or random.random() < sample_rate
+    return Span(name, _new_id(128), None, sampled, attributes)
+
+
+def activate(span):
+    return _current_span.set(span)
+
+
+def deactivate(token):
+    _current_span.reset(token)
+
+
+def current_span():
+    return _current_span.get()
+
+
+def current_traceparent():
+    span = _current_span.get()
+    return span.traceparent if span else None
+
+
+@contextmanager
+def span(name, attributes=None, parent=None, new_trace=False):
+    """
+    with span("load_article", {"pid_v3": v3}) as s:
+        ...
+
+    Retorna None quando o rastreamento está desativado
+    """
+    if not is_enabled():
+        yield None
+        return
+    item = start_span(name, attributes, parent, new_trace)
+    token = activate(item)
+    try:
+        yield item
+    except BaseException as e:
+        item.record_exception(e)
+        raise
+    finally:
+        deactivate(token)
+        item.end()
+
+
+def traced(name):
+    """
+    Decorador equivalente a span(name)
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_query(execute, sql, params, many, context):
+    """
+    Callable para connection.execute_wrapper: um span por consulta,
+    apenas quando há um span ativo e amostrado
+    """
+    parent = _current_span.get()
+    if parent is None or not parent.sampled:
+        return execute(sql, params, many, context)
+    with span("db.query", {"db.statement": sql[:500], "db.executemany": many}):
+        return execute(sql, params, many, context)
+
+
+class SpanExporter(abc.ABC):
+    """
+    Acumula os spans encerrados e os grava em lotes de TRACING_BATCH_SIZE
+    ou a cada TRACING_FLUSH_INTERVAL segundos; os restantes são gravados ao
+    encerrar o processo (atexit, worker_process_shutdown)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans = []
+        self._flushed_at = time.monotonic()
+
+    def export(self, item):
+        with self._lock:
+            self._spans.append(item)
+            if len(self._spans) < getattr(
+                settings, "TRACING_BATCH_SIZE", 100
+            ) and time.monotonic() - self._flushed_at < getattr(
+                settings, "TRACING_FLUSH_INTERVAL", 5
+            ):
+                return
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            spans, self._spans = self._spans, []
+            self._flushed_at = time.monotonic()
+        if not spans:
+            return
+        try:
+            self.write(self.payload(spans))
+        except Exception as e:
+            logging.warning(f"{type(self).__name__}: unable to export spans: {e}")
+
+    @staticmethod
+    def payload(spans):
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": _attribute_value(
+                                    getattr(settings, "TRACING_SERVICE_NAME", "core")
+                                ),
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [item.to_otlp() for item in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    @abc.abstractmethod
+    def write(self, payload):
+        """Grava o lote (payload OTLP JSON)"""
+
+
+class FileSpanExporter(SpanExporter):
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def write(self, payload):
+        with open(self.path, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(payload) + "\n")
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    def __init__(self, endpoint, timeout=5):
+        super().__init__()
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def write(self, payload):
+        response = requests.post(self.endpoint, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+
+
+_exporter = None
+_exporter_lock = threading.Lock()
+
+
+def get_exporter():
+    global _exporter
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                if getattr(settings, "TRACING_EXPORTER", "file") == "otlp":
+                    _exporter = OtlpHttpSpanExporter(
+                        getattr(
+                            settings,
+                            "TRACING_OTLP_ENDPOINT",
+                            "http://localhost:4318/v1/traces",
+                        )
+                    )
+                else:
+                    _exporter = FileSpanExporter(
+                        getattr(settings, "TRACING_FILE", "traces.jsonl")
+                    )
+                atexit.register(_exporter.flush)
+    return _exporter
+
+
+def flush():
+    if _exporter is not None:
+        _exporter.flush()
@@ -1,5 +1,6 @@
 import logging
 import re
+import time
 
 import requests
 from django.contrib.auth import get_user_model
@@ -13,6 +14,8 @@ from tenacity import (
 from urllib3.util import Retry
 
 from config.settings.base import FETCH_DATA_TIMEOUT
+from core.utils.metrics import observe_http_fetch
+from core.utils.tracing import span
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -58,9 +61,16 @@ def fetch_data(url, headers=None, json=False, timeout=FETCH_DATA_TIMEOUT, verify
         Raise a RetryableError to retry.
     """
 
+    started = time.perf_counter()
     try:
-        response = requests.get(url, headers=headers, timeout=timeout, verify=verify)
+        with span("http.get", {"http.url": url}) as http_span:
+            response = requests.get(
+                url, headers=headers, timeout=timeout, verify=verify
+            )
+            if http_span:
+                http_span.set_attribute("http.status_code", response.status_code)
     except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+        observe_http_fetch(url, started)
         logger.error("Erro fetching the content: %s, retry..., erro: %s" % (url, exc))
         raise RetryableError(exc) from exc
     except (
@@ -68,10 +78,12 @@ def fetch_data(url, headers=None, json=False, timeout=FETCH_DATA_TIMEOUT, verify
         requests.exceptions.MissingSchema,
         requests.exceptions.InvalidURL,
     ) as exc:
+        observe_http_fetch(url, started)
         logger.error(
             "Erro fetching the content: %s, not retryable..., erro: %s" % (url, exc)
         )
         raise NonRetryableError(exc) from exc
+    observe_http_fetch(url, started, response.status_code)
     try:
         response.raise_for_status()
     except requests.HTTPError as exc:
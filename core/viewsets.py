@@ -1,4 +1,8 @@
+from datetime import timedelta
+
+from django.conf import settings
 from django.http import HttpResponseRedirect
+from django.utils import timezone
 from wagtail.snippets.views.snippets import SnippetViewSet
 
 
@@ -8,4 +12,23 @@ class CommonControlFieldViewSet(SnippetViewSet):
     def save_instance(self, instance, form, is_new):
         if hasattr(form, 'save_all'):
             return form.save_all(self.request.user)
-        return super().save_instance(instance, form, is_new)
\ No newline at end of file
+        return super().save_instance(instance, form, is_new)
+
+
+class RecentEventsViewSetMixin:
+    """
+    Lista apenas os eventos dos últimos EVENT_ADMIN_RECENT_DAYS dias, o que
+    restringe a consulta às partições mais recentes (core.utils.partitioning),
+    a menos que a listagem seja filtrada pela data de criação
+    """
+
+    recent_field = "created"
+
+    def get_queryset(self, request):
+        queryset = self.model._default_manager.all()
+        if any(key.startswith(self.recent_field) for key in request.GET):
+            return queryset
+        days = getattr(settings, "EVENT_ADMIN_RECENT_DAYS", 30)
+        return queryset.filter(
+            **{f"{self.recent_field}__gte": timezone.now() - timedelta(days=days)}
+        )
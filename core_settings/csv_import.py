@@ -0,0 +1,495 @@
+"""
+Importação em blocos dos CSV enviados por core_settings.views.import_csv
+
+O arquivo é dividido em blocos (settings.CSV_IMPORT_CHUNK_SIZE linhas),
+processados por subtarefas Celery em paralelo. Em cada bloco, os valores
+distintos de localização, organização, gênero e ORCID são resolvidos uma
+única vez e pesquisadores / identificadores são gravados com bulk_create.
+
+Linhas com o mesmo pesquisador são mantidas no mesmo bloco, para que
+blocos paralelos não criem o mesmo NewResearcher.
+"""
+
+import csv
+import logging
+import sys
+import zlib
+from datetime import date
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+from core.models import Gender
+from core.utils.extracts_normalized_email import extracts_normalized_email
+from editorialboard.models import EditorialBoardMember
+from journal.models import Journal
+from location.models import Location
+from organization.models import Organization
+from researcher.models import NewResearcher, ResearcherIds, ResearcherOrcid
+from researcher.resolvers import BlockingKeyResolver
+from researcher.utils import name_blocking_key
+from tracker.models import UnexpectedEvent
+
+
+def get_chunk_size():
+    return getattr(settings, "CSV_IMPORT_CHUNK_SIZE", 1000)
+
+
+def import_summary(type_csv, lines, chunks, chunk_summaries=None):
+    """
+    Resumo da importação do arquivo, o mesmo com um único bloco (processado
+    na própria tarefa) ou com blocos em subtarefas: sem chunk_summaries, os
+    blocos foram despachados e imported / errors ainda não são conhecidos
+    """
+    done = chunk_summaries is not None
+    return {
+        "type_csv": type_csv,
+        "status": "done" if done else "dispatched",
+        "lines": lines,
+        "chunks": chunks,
+        "imported": sum(item["imported"] for item in chunk_summaries) if done else None,
+        "errors": sum(item["errors"] for item in chunk_summaries) if done else None,
+    }
+
+
+def clean_row(row):
+    return {
+        k.strip().lower(): (v.strip() if isinstance(v, str) else v)
+        for k, v in row.items()
+        if k
+    }
+
+
+def read_rows(tmp_path, delimiter=";"):
+    """
+    Retorna lista de [número da linha de dados, row normalizada]
+    """
+    with open(tmp_path, "r", newline="", encoding="utf-8") as f:
+        return [
+            [line, clean_row(row)]
+            for line, row in enumerate(csv.DictReader(f, delimiter=delimiter))
+        ]
+
+
+def researcher_partition_key(row):
+    # mesma chave de bloqueio de BlockingKeyResolver: variações do nome de
+    # um pesquisador ficam no mesmo bloco
+    return name_blocking_key(row.get("given_names"), row.get("last_name")) or ""
+
+
+def split_in_chunks(numbered_rows, chunk_size, key=None):
+    """
+    Divide as linhas em blocos de aproximadamente chunk_size linhas.
+    Se key é informada, linhas com a mesma chave ficam no mesmo bloco.
+    """
+    if not numbered_rows:
+        return []
+    total = -(-len(numbered_rows) // chunk_size)
+    if not key or total == 1:
+        return [
+            numbered_rows[i:i + chunk_size]
+            for i in range(0, len(numbered_rows), chunk_size)
+        ]
+    chunks = [[] for _ in range(total)]
+    for item in numbered_rows:
+        index = zlib.crc32(key(item[1]).encode("utf-8")) % total
+        chunks[index].append(item)
+    return [chunk for chunk in chunks if chunk]
+
+
+class ChunkImporter:
+    """
+    Processa um bloco de linhas; mantém os valores já resolvidos no bloco
+    e o resumo (linhas importadas / com erro)
+    """
+
+    def __init__(self, user, action, task, chunk_index=0):
+        self.user = user
+        self.action = action
+        self.task = task
+        self.chunk_index = chunk_index
+        self.imported = 0
+        self.errors = 0
+        self._resolved = {}
+
+    def register_error(self, e, line, row):
+        self.errors += 1
+        logging.exception(f"Linhs {line} com error: {e}")
+        exc_type, exc_value, exc_traceback = sys.exc_info()
+        UnexpectedEvent.create(
+            exception=e,
+            action=self.action,
+            exc_traceback=exc_traceback,
+            detail={
+                "task": self.task,
+                "chunk": self.chunk_index,
+                "line": line,
+                "row": row,
+            },
+        )
+
+    def summary(self, numbered_rows):
+        return {
+            "chunk": self.chunk_index,
+            "first_line": numbered_rows[0][0] if numbered_rows else None,
+            "last_line": numbered_rows[-1][0] if numbered_rows else None,
+            "imported": self.imported,
+            "errors": self.errors,
+        }
+
+    def resolve(self, namespace, key, func):
+        """
+        Resolve (namespace, key) uma única vez no bloco;
+        a exceção também é memorizada e relançada nas próximas linhas
+        """
+        memo_key = (namespace, key)
+        if memo_key not in self._resolved:
+            try:
+                self._resolved[memo_key] = (func(), None)
+            except Exception as e:
+                self._resolved[memo_key] = (None, e)
+        obj, exc = self._resolved[memo_key]
+        if exc:
+            raise exc
+        return obj
+
+    def existing_location(self, row):
+        key = (row.get("country_code"), row.get("city_name"), row.get("state_name"))
+        return self.resolve(
+            "existing_location",
+            key,
+            lambda: Location.objects.get(
+                country__acronym=key[0], city__name=key[1], state__name=key[2]
+            ),
+        )
+
+    def location(self, row):
+        key = (row.get("country_code"), row.get("city_name"), row.get("state_name"))
+        return self.resolve(
+            "location",
+            key,
+            lambda: Location.create_or_update(
+                user=self.user,
+                country_acronym=key[0],
+                city_name=key[1],
+                state_text=key[2],
+            ),
+        )
+
+    def organization(self, name, location, row):
+        key = (
+            name,
+            row.get("acronym"),
+            location and location.pk,
+            row.get("url"),
+            row.get("institution_type_mec"),
+        )
+        return self.resolve(
+            "organization",
+            key,
+            lambda: Organization.create_or_update(
+                user=self.user,
+                name=name,
+                acronym=key[1],
+                location=location,
+                url=key[3],
+                institution_type_mec=key[4],
+            ),
+        )
+
+    def gender(self, code):
+        return self.resolve(
+            "gender", code, lambda: Gender.create_or_update(user=self.user, code=code)
+        )
+
+    def journal(self, row):
+        issn = row.get("issn_scielo")
+        if issn:
+            return self.resolve(
+                "journal_issn",
+                issn,
+                lambda: Journal.objects.get(
+                    Q(official__issn_print=issn) | Q(official__issn_electronic=issn)
+                ),
+            )
+        title = row.get("title_journal")
+        return self.resolve(
+            "journal_title", title, lambda: Journal.objects.get(title__icontains=title)
+        )
+
+    def orcids(self, values):
+        """
+        values: ORCIDs já validados (ResearcherOrcid.validate_orcid)
+
+        Retorna dict {orcid informado: ResearcherOrcid}
+        """
+        normalized = {
+            value: ResearcherOrcid.extract_orcid_number(value)
+            for value in values
+            if value
+        }
+
+        numbers = set(normalized.values())
+        found = {
+            obj.orcid: obj for obj in ResearcherOrcid.objects.filter(orcid__in=numbers)
+        }
+        missing = numbers - set(found)
+        if missing:
+            ResearcherOrcid.objects.bulk_create(
+                [ResearcherOrcid(orcid=number, creator=self.user) for number in missing],
+                ignore_conflicts=True,
+            )
+            found.update(
+                {
+                    obj.orcid: obj
+                    for obj in ResearcherOrcid.objects.filter(orcid__in=missing)
+                }
+            )
+        return {value: found.get(number) for value, number in normalized.items()}
+
+    @staticmethod
+    def researcher_key(item):
+        # deduplicação das linhas do bloco que não têm correspondente no banco
+        return (
+            item["orcid"] and item["orcid"].pk,
+            item["fullname"].lower(),
+            item["affiliation"] and item["affiliation"].pk,
+        )
+
+    @staticmethod
+    def match_researcher(resolver, item):
+        # critério de BlockingKeyResolver.match, mais tolerante que o de
+        # NewResearcher.get: prenomes compatíveis (ex.: "J. M." e "João
+        # Maria") quando há um único candidato; com ORCID, pelo ORCID e
+        # nome ou, se o candidato não tem ORCID, pelo nome e afiliação;
+        # sem ORCID, pelo nome e afiliação
+        orcid = item["orcid"]
+        affiliation_id = item["affiliation"] and item["affiliation"].pk
+
+        def accept(obj):
+            if orcid and obj.orcid_id:
+                return obj.orcid_id == orcid.pk
+            return obj.affiliation_id == affiliation_id
+
+        return resolver.match(
+            given_names=item["given_names"],
+            last_name=item["last_name"],
+            suffix=item["suffix"],
+            orcid=orcid and orcid.pk,
+            accept=accept,
+        )
+
+    def researchers(self, items):
+        """
+        items: lista de dicts com given_names, last_name, suffix,
+        affiliation, orcid, gender, gender_identification_status
+
+        Os candidatos são obtidos pela chave de bloqueio em uma única
+        consulta (BlockingKeyResolver). Retorna lista de NewResearcher na
+        mesma ordem de items
+        """
+        for item in items:
+            item["fullname"] = NewResearcher.join_names(
+                item["given_names"], item["last_name"], item["suffix"]
+            )
+
+        def resolve():
+            resolver = BlockingKeyResolver(
+                NewResearcher.objects.all(), items, orcid_of=lambda obj: obj.orcid_id
+            )
+            return [self.match_researcher(resolver, item) for item in items]
+
+        matched = resolve()
+        to_create = {}
+        for item, obj in zip(items, matched):
+            if obj is None:
+                key = self.researcher_key(item)
+                if key not in to_create:
+                    to_create[key] = NewResearcher(creator=self.user, **item)
+                    to_create[key].set_blocking_key()
+        if to_create:
+            NewResearcher.objects.bulk_create(to_create.values(), ignore_conflicts=True)
+            matched = resolve()
+
+        # o ORCID da linha é gravado no pesquisador encontrado sem ORCID
+        without_orcid = {}
+        for item, obj in zip(items, matched):
+            if (
+                obj is not None
+                and item["orcid"]
+                and not obj.orcid_id
+                and obj.pk not in without_orcid
+            ):
+                obj.orcid = item["orcid"]
+                without_orcid[obj.pk] = obj
+        if without_orcid:
+            NewResearcher.objects.bulk_update(without_orcid.values(), ["orcid"])
+        return matched
+
+    def researcher_ids(self, items):
+        """
+        items: lista de (linha, row, researcher, identifier, source_name)
+        """
+        normalized = []
+        for line, row, researcher, identifier, source_name in items:
+            try:
+                if source_name == "EMAIL":
+                    ResearcherIds.validate_email(identifier)
+                    identifier = extracts_normalized_email(identifier)
+                    ResearcherIds.validate_email(identifier)
+                elif source_name == "LATTES":
+                    ResearcherIds.validate_lattes(identifier)
+                    identifier = ResearcherIds.extract_lattes(identifier)
+            except ValidationError as e:
+                self.register_error(e, line, row)
+                continue
+            normalized.append((researcher.pk, source_name, identifier))
+
+        if not normalized:
+            return
+        existing = set(
+            ResearcherIds.objects.filter(
+                researcher_id__in={item[0] for item in normalized}
+            ).values_list("researcher_id", "source_name", "identifier")
+        )
+        to_create = {item for item in normalized if item not in existing}
+        ResearcherIds.objects.bulk_create(
+            [
+                ResearcherIds(
+                    creator=self.user,
+                    researcher_id=researcher_id,
+                    source_name=source_name,
+                    identifier=identifier,
+                )
+                for researcher_id, source_name, identifier in to_create
+            ]
+        )
+
+
+def import_organization_rows(user, numbered_rows, chunk_index=0):
+    importer = ChunkImporter(
+        user,
+        action="import_csv_organization",
+        task="organization.tasks.importar_csv_task_organization",
+        chunk_index=chunk_index,
+    )
+    for line, row in numbered_rows:
+        try:
+            location = importer.existing_location(row)
+            importer.organization(row.get("organization_name"), location, row)
+            importer.imported += 1
+        except Exception as e:
+            importer.register_error(e, line, row)
+    return importer.summary(numbered_rows)
+
+
+def _import_researchers(importer, numbered_rows):
+    """
+    Retorna dict {linha: NewResearcher} das linhas importadas
+    """
+    pending = []
+    for line, row in numbered_rows:
+        try:
+            location = importer.location(row)
+            affiliation = importer.organization(row.get("affiliation"), location, row)
+            gender = importer.gender(row.get("gender"))
+            if not row.get("given_names") or not row.get("last_name"):
+                raise ValueError(
+                    "Researcher.get requires given_names, last_name parameters"
+                )
+            if row.get("orcid"):
+                # ORCID inválido: a linha não é importada
+                ResearcherOrcid.validate_orcid(row["orcid"])
+            pending.append((line, row, affiliation, gender))
+        except Exception as e:
+            importer.register_error(e, line, row)
+
+    orcids = importer.orcids({row.get("orcid") for line, row, *_ in pending})
+    researchers = importer.researchers(
+        [
+            dict(
+                given_names=row.get("given_names"),
+                last_name=row.get("last_name"),
+                suffix=row.get("suffix"),
+                affiliation=affiliation,
+                orcid=orcids.get(row.get("orcid")),
+                gender=gender,
+                gender_identification_status=row.get("gender_identification_status"),
+            )
+            for line, row, affiliation, gender in pending
+        ]
+    )
+
+    imported = {}
+    ids = []
+    for (line, row, affiliation, gender), researcher in zip(pending, researchers):
+        if not researcher:
+            importer.register_error(
+                NewResearcher.DoesNotExist("NewResearcher not created"), line, row
+            )
+            continue
+        imported[line] = researcher
+        for source_name, name in (("LATTES", "lattes"), ("EMAIL", "email")):
+            if row.get(name):
+                ids.append((line, row, researcher, row[name], source_name))
+    importer.researcher_ids(ids)
+    return imported
+
+
+def import_newresearcher_rows(user, numbered_rows, chunk_index=0):
+    importer = ChunkImporter(
+        user,
+        action="import_csv_newresearcher",
+        task="organization.tasks.importar_csv_task_newresearcher",
+        chunk_index=chunk_index,
+    )
+    importer.imported = len(_import_researchers(importer, numbered_rows))
+    return importer.summary(numbered_rows)
+
+
+def import_editorialboardmember_rows(user, numbered_rows, chunk_index=0):
+    importer = ChunkImporter(
+        user,
+        action="importar_csv_task_editorialboardmember",
+        task="organization.tasks.importar_csv_task_editorialboardmember",
+        chunk_index=chunk_index,
+    )
+    with_journal = []
+    for line, row in numbered_rows:
+        try:
+            with_journal.append((line, row, importer.journal(row)))
+        except Exception as e:
+            importer.register_error(e, line, row)
+
+    researchers = _import_researchers(
+        importer, [(line, row) for line, row, journal in with_journal]
+    )
+    for line, row, journal in with_journal:
+        researcher = researchers.get(line)
+        if not researcher:
+            continue
+        try:
+            EditorialBoardMember.create_or_update(
+                user=user,
+                researcher=researcher,
+                journal=journal,
+                declared_role=row.get("declared_role"),
+                std_role=row.get("std_role"),
+                editorial_board_initial_year=date(int(row.get("initial_year")), 1, 1),
+                editorial_board_final_year=date(int(row.get("final_year")), 1, 1),
+            )
+            importer.imported += 1
+        except Exception as e:
+            importer.register_error(e, line, row)
+    return importer.summary(numbered_rows)
+
+
+IMPORTERS = {
+    "organization": (import_organization_rows, None),
+    "newresearcher": (import_newresearcher_rows, researcher_partition_key),
+    "editorialboardmember": (
+        import_editorialboardmember_rows,
+        researcher_partition_key,
+    ),
+}
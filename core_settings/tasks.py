@@ -1,20 +1,15 @@
-import csv
 import logging
-import sys
-from datetime import date
 
+from celery import chord, group
 from django.contrib.auth import get_user_model
-from django.db.models import Q
 
 from config import celery_app
+from core_settings import csv_import
 from core.models import Gender
 from core.utils.utils import _get_user
-from editorialboard.models import EditorialBoardMember
-from journal.models import Journal
 from location.models import Location
 from organization.models import Organization
 from researcher.models import NewResearcher, ResearcherIds, ResearcherOrcid
-from tracker.models import UnexpectedEvent
 
 User = get_user_model()
 
@@ -102,89 +97,84 @@ def create_or_update_researcher(
     return newresearcher
 
 
-def read_csv(tmp_path, delimiter=";"):
-    with open(tmp_path, "r", newline="", encoding="utf-8") as f:
-        return list(csv.DictReader(f, delimiter=delimiter))
+def _import_csv_in_chunks(tmp_path, username, type_csv, chunk_size=None):
+    """
+    Divide o CSV em blocos e processa cada bloco em uma subtarefa
+    (task_import_csv_chunk); arquivos com um único bloco são processados
+    na própria tarefa. Retorna csv_import.import_summary; com subtarefas,
+    o resumo final é gerado por task_summarize_csv_import
+    """
+    import_rows, partition_key = csv_import.IMPORTERS[type_csv]
+    numbered_rows = csv_import.read_rows(tmp_path)
+    chunks = csv_import.split_in_chunks(
+        numbered_rows, chunk_size or csv_import.get_chunk_size(), key=partition_key
+    )
+    logging.info(
+        f"[importar_csv_task_{type_csv}] {len(numbered_rows)} linhas em {len(chunks)} blocos"
+    )
+    if len(chunks) <= 1:
+        user = _get_user(request=None, user_id=None, username=username)
+        return csv_import.import_summary(
+            type_csv,
+            len(numbered_rows),
+            len(chunks),
+            [import_rows(user, chunk, 0) for chunk in chunks],
+        )
 
+    job = group(
+        task_import_csv_chunk.s(
+            username=username,
+            type_csv=type_csv,
+            numbered_rows=chunk,
+            chunk_index=index,
+            total_chunks=len(chunks),
+        )
+        for index, chunk in enumerate(chunks)
+    )
+    chord(
+        job,
+        task_summarize_csv_import.s(
+            type_csv=type_csv, lines=len(numbered_rows), chunks=len(chunks)
+        ),
+    ).apply_async()
+    return csv_import.import_summary(type_csv, len(numbered_rows), len(chunks))
 
-def clean_row(row):
-    return {k.strip().lower(): (v.strip() if isinstance(v, str) else v) for k, v in row.items()}
+
+@celery_app.task()
+def task_import_csv_chunk(username, type_csv, numbered_rows, chunk_index=0, total_chunks=1):
+    """
+    Importa um bloco de linhas ([linha, row]) do CSV e retorna o resumo
+    do bloco (linhas importadas e com erro)
+    """
+    user = _get_user(request=None, user_id=None, username=username)
+    import_rows, partition_key = csv_import.IMPORTERS[type_csv]
+    summary = import_rows(user, numbered_rows, chunk_index)
+    logging.info(
+        f"[importar_csv_task_{type_csv}] bloco {chunk_index + 1}/{total_chunks}: {summary}"
+    )
+    return summary
+
+
+@celery_app.task()
+def task_summarize_csv_import(chunk_summaries, type_csv, lines, chunks):
+    """
+    Resumo final da importação feita em subtarefas (callback do chord)
+    """
+    summary = csv_import.import_summary(type_csv, lines, chunks, chunk_summaries)
+    logging.info(f"[importar_csv_task_{type_csv}] {summary}")
+    return summary
 
 
 @celery_app.task()
 def importar_csv_task_organization(tmp_path, username):
     logging.info(f"[importar_csv_task_organization] Importing CSV file: {tmp_path}")
-    user = _get_user(request=None, user_id=None, username=username)
-    rows = read_csv(tmp_path)
-    for i, row in enumerate(rows):
-        try:
-            row = clean_row(row)
-            location = Location.objects.get(
-                country__acronym=row.get("country_code"),
-                city__name=row.get("city_name"),
-                state__name=row.get("state_name"),
-            )
-            organization = Organization.create_or_update(
-                user=user,
-                name=row.get("organization_name"),
-                acronym=row.get("acronym"),
-                location=location,
-                url=row.get("url"),
-                institution_type_mec=row.get("institution_type_mec"),
-            )
-        except Exception as e:
-            logging.exception(f"Linhs {i} com error: {e}")
-            exc_type, exc_value, exc_traceback = sys.exc_info()
-            UnexpectedEvent.create(
-                exception=e,
-                action="import_csv_organization",
-                exc_traceback=exc_traceback,
-                detail={
-                    "task": "organization.tasks.importar_csv_task_organization",
-                    "line": i,
-                    "row": row,
-                },
-            )
+    return _import_csv_in_chunks(tmp_path, username, "organization")
 
 
 @celery_app.task()
 def importar_csv_task_newresearcher(tmp_path, username):
     logging.info(f"[importar_csv_task_newresearcher] Importing CSV file: {tmp_path}")
-    rows = read_csv(tmp_path)
-    for i, row in enumerate(rows):
-        try:
-            row = clean_row(row)
-            create_or_update_researcher(
-                username=username,
-                country_code=row.get("country_code"),
-                city=row.get("city_name"),
-                state=row.get("state_name"),
-                organization_name=row.get("affiliation"),
-                acronym=row.get("acronym"),
-                url=row.get("url"),
-                institution_type_mec=row.get("institution_type_mec"),
-                orcid=row.get("orcid"),
-                given_names=row.get("given_names"),
-                last_name=row.get("last_name"),
-                suffix=row.get("suffix"),
-                email=row.get("email"),
-                lattes=row.get("lattes"),
-                gender=row.get("gender"),
-                gender_identification_status=row.get("gender_identification_status"),
-            )
-        except Exception as e:
-            logging.exception(f"Linhs {i} com error: {e}")
-            exc_type, exc_value, exc_traceback = sys.exc_info()
-            UnexpectedEvent.create(
-                exception=e,
-                action="import_csv_newresearcher",
-                exc_traceback=exc_traceback,
-                detail={
-                    "task": "organization.tasks.importar_csv_task_newresearcher",
-                    "line": i,
-                    "row": row,
-                },
-            )
+    return _import_csv_in_chunks(tmp_path, username, "newresearcher")
 
 
 @celery_app.task()
@@ -192,58 +182,7 @@ def importar_csv_task_editorialboardmember(tmp_path, username):
     logging.info(
         f"[importar_csv_task_editorialboardmember] Importing CSV file: {tmp_path}"
     )
-    user = _get_user(request=None, user_id=None, username=username)
-    rows = read_csv(tmp_path)
-    for i, row in enumerate(rows):
-        try:
-            row = clean_row(row)
-            if row.get("issn_scielo"):
-                journal = Journal.objects.get(Q(official__issn_print=row.get("issn_scielo")) | Q(official__issn_electronic=row.get("issn_scielo")))
-            else:
-                journal = Journal.objects.get(title__icontains=row.get("title_journal"))
-            researcher = create_or_update_researcher(
-                username=username,
-                country_code=row.get("country_code"),
-                city=row.get("city_name"),
-                state=row.get("state_name"),
-                organization_name=row.get("affiliation"),
-                acronym=row.get("acronym"),
-                url=row.get("url"),
-                institution_type_mec=row.get("institution_type_mec"),
-                orcid=row.get("orcid"),
-                given_names=row.get("given_names"),
-                last_name=row.get("last_name"),
-                suffix=row.get("suffix"),
-                email=row.get("email"),
-                lattes=row.get("lattes"),
-                gender=row.get("gender"),
-                gender_identification_status=row.get("gender_identification_status"),
-            )
-
-            initail_year = date(int(row.get("initial_year")), 1, 1)
-            final_year = date(int(row.get("final_year")), 1, 1)
-            EditorialBoardMember.create_or_update(
-                user=user,
-                researcher=researcher,
-                journal=journal,
-                declared_role=row.get("declared_role"),
-                std_role=row.get("std_role"),
-                editorial_board_initial_year=initail_year,
-                editorial_board_final_year=final_year,
-            )
-        except Exception as e:
-            logging.exception(f"Linhs {i} com error: {e}")
-            exc_type, exc_value, exc_traceback = sys.exc_info()
-            UnexpectedEvent.create(
-                exception=e,
-                action="importar_csv_task_editorialboardmember",
-                exc_traceback=exc_traceback,
-                detail={
-                    "task": "organization.tasks.importar_csv_task_editorialboardmember",
-                    "line": i,
-                    "row": row,
-                },
-            )
+    return _import_csv_in_chunks(tmp_path, username, "editorialboardmember")
 
 # TODO
 # @celery_app.task()
@@ -13,6 +13,7 @@ from location.models import Location
 from organization.models import Organization
 from researcher.models import NewResearcher
 
+from . import csv_import
 from .tasks import (
     importar_csv_task_editorialboardmember,
     importar_csv_task_newresearcher,
@@ -252,3 +253,125 @@ Organization 1;São Paulo;São Paulo;ORG1;www.org1.com.br;organização sem fins
         self.assertEqual(editorial_board_member.first().researcher.suffix, "Jr.")
         self.assertEqual(editorial_board_member.first().researcher.orcid.orcid, "0000-0002-9147-0547")
 
+    def test_import_newresearcher_rows_reuses_researcher_in_chunk(self):
+        temp_file = self.create_temp_file(
+            self.csv_content_newresearcher
+            + "\n0000-0002-9147-0547;Anna;Taomeaome;Jr.;Universidade Federal de São Carlos;"
+            "BR;São Paulo;SP;anna.taomeaome@ufsc.br"
+        )
+        numbered_rows = csv_import.read_rows(temp_file.file.name)
+        summary = csv_import.import_newresearcher_rows(self.user, numbered_rows)
+
+        self.assertEqual(summary["imported"], 2)
+        self.assertEqual(summary["errors"], 0)
+        self.assertEqual(NewResearcher.objects.count(), 1)
+        self.assertEqual(NewResearcher.objects.first().researcher_ids.count(), 1)
+
+    def test_split_in_chunks_keeps_researcher_rows_together(self):
+        rows = [
+            [i, {"orcid": f"0000-0000-0000-000{i % 3}", "given_names": "A", "last_name": "B"}]
+            for i in range(9)
+        ]
+        chunks = csv_import.split_in_chunks(
+            rows, 3, key=csv_import.researcher_partition_key
+        )
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 9)
+        for chunk in chunks:
+            orcids = {row["orcid"] for line, row in chunk}
+            for other in chunks:
+                if other is not chunk:
+                    self.assertFalse(orcids & {row["orcid"] for line, row in other})
+
+    def test_split_in_chunks_keeps_name_variants_together(self):
+        rows = [
+            [0, {"given_names": "João Maria", "last_name": "Silva"}],
+            [1, {"given_names": "J. Maria", "last_name": "Silva"}],
+            [2, {"given_names": "J M", "last_name": "Silva"}],
+        ] + [
+            [i, {"given_names": "Ana", "last_name": f"Souza{i}"}] for i in range(3, 12)
+        ]
+        chunks = csv_import.split_in_chunks(
+            rows, 3, key=csv_import.researcher_partition_key
+        )
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 12)
+        chunk_of = {line: index for index, chunk in enumerate(chunks) for line, row in chunk}
+        self.assertEqual(chunk_of[0], chunk_of[1])
+        self.assertEqual(chunk_of[0], chunk_of[2])
+
+    def test_import_newresearcher_rows_orcid_row_and_researcher_without_orcid(self):
+        researcher = NewResearcher.objects.create(
+            given_names="Anna",
+            last_name="Taomeaome",
+            suffix="Jr.",
+            fullname="Anna Taomeaome Jr.",
+            affiliation=Organization.objects.create(name="Outra Universidade"),
+            creator=self.user,
+        )
+
+        # outra afiliação: não é o mesmo pesquisador
+        temp_file = self.create_temp_file(self.csv_content_newresearcher)
+        numbered_rows = csv_import.read_rows(temp_file.file.name)
+        summary = csv_import.import_newresearcher_rows(self.user, numbered_rows)
+        self.assertEqual(summary["imported"], 1)
+        self.assertEqual(NewResearcher.objects.count(), 2)
+        researcher.refresh_from_db()
+        self.assertIsNone(researcher.orcid)
+        created = NewResearcher.objects.exclude(pk=researcher.pk).get()
+        self.assertEqual(created.orcid.orcid, "0000-0002-9147-0547")
+
+        # mesma afiliação: o ORCID da linha é gravado no pesquisador
+        created.orcid = None
+        created.save()
+        csv_import.import_newresearcher_rows(self.user, numbered_rows)
+        self.assertEqual(NewResearcher.objects.count(), 2)
+        created.refresh_from_db()
+        self.assertEqual(created.orcid.orcid, "0000-0002-9147-0547")
+
+    def test_import_newresearcher_rows_rejects_invalid_orcid(self):
+        temp_file = self.create_temp_file(
+            self.csv_content_newresearcher
+            + "\n0000-0000;Maria;Silva;;Universidade Federal de São Carlos;"
+            "BR;São Paulo;SP;maria.silva@ufsc.br"
+        )
+        numbered_rows = csv_import.read_rows(temp_file.file.name)
+        summary = csv_import.import_newresearcher_rows(self.user, numbered_rows)
+
+        self.assertEqual(summary["imported"], 1)
+        self.assertEqual(summary["errors"], 1)
+        self.assertFalse(NewResearcher.objects.filter(given_names="Maria").exists())
+
+    def test_import_csv_task_returns_summary(self):
+        temp_file = self.create_temp_file(content=self.csv_content_organization)
+        summary = importar_csv_task_organization(
+            username="teste",
+            tmp_path=temp_file.file.name,
+        )
+        self.assertEqual(
+            {
+                "type_csv": "organization",
+                "status": "done",
+                "lines": 1,
+                "chunks": 1,
+                "imported": 1,
+                "errors": 0,
+            },
+            summary,
+        )
+
+    @patch("core_settings.tasks.chord")
+    @patch("core_settings.tasks.group")
+    def test_import_csv_task_dispatches_one_subtask_per_chunk(self, mock_group, mock_chord):
+        temp_file = self.create_temp_file(
+            self.csv_content_organization
+            + "\nOrganization 2;BR;São Paulo;São Paulo;ORG2;www.org2.com.br;"
+            "organização sem fins de lucros"
+        )
+        with self.settings(CSV_IMPORT_CHUNK_SIZE=1):
+            summary = importar_csv_task_organization(
+                username="teste",
+                tmp_path=temp_file.file.name,
+            )
+        self.assertEqual(len(list(mock_group.call_args[0][0])), 2)
+        mock_chord.return_value.apply_async.assert_called_once()
+        self.assertEqual("dispatched", summary["status"])
+        self.assertEqual(2, summary["chunks"])
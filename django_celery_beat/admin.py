@@ -214,14 +214,14 @@ class PeriodicTaskAdmin(admin.ModelAdmin):
 
     def enable_tasks(self, request, queryset):
         rows_updated = queryset.update(enabled=True)
-        PeriodicTasks.update_changed()
+        PeriodicTasks.update_changed(queryset)
         self._message_user_about_update(request, rows_updated, "enabled")
 
     enable_tasks.short_description = _("Enable selected tasks")
 
     def disable_tasks(self, request, queryset):
         rows_updated = queryset.update(enabled=False)
-        PeriodicTasks.update_changed()
+        PeriodicTasks.update_changed(queryset)
         self._message_user_about_update(request, rows_updated, "disabled")
 
     disable_tasks.short_description = _("Disable selected tasks")
@@ -236,7 +236,7 @@ class PeriodicTaskAdmin(admin.ModelAdmin):
 
     def toggle_tasks(self, request, queryset):
         rows_updated = self._toggle_tasks_activity(queryset)
-        PeriodicTasks.update_changed()
+        PeriodicTasks.update_changed(queryset)
         self._message_user_about_update(request, rows_updated, "toggled")
 
     toggle_tasks.short_description = _("Toggle activity of selected tasks")
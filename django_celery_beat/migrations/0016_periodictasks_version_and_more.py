@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:10
+# flake8: noqa
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_celery_beat', '0015_edit_solarschedule_events_choices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='periodictasks',
+            name='version',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='periodictask',
+            name='change_version',
+            field=models.BigIntegerField(db_index=True, default=0, editable=False, help_text='Value of PeriodicTasks.version when this task last changed', verbose_name='Change Version'),
+        ),
+    ]
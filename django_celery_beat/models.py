@@ -6,7 +6,7 @@ from celery import current_app, schedules
 from django.conf import settings
 from django.core.exceptions import MultipleObjectsReturned, ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import signals
 from django.utils.translation import gettext_lazy as _
 from wagtail.admin.panels import (
@@ -385,21 +385,55 @@ class PeriodicTasks(models.Model):
     via django signals whenever anything is changed in the PeriodicTask model.
     Basically this acts like a DB data audit trigger.
     Doing this so we also track deletions, and not just insert/update.
+
+    version is a monotonic counter bumped on every change; changed
+    PeriodicTask rows are stamped with it (PeriodicTask.change_version),
+    so the scheduler reloads only the rows changed since its snapshot.
     """
 
     ident = models.SmallIntegerField(default=1, primary_key=True, unique=True)
     last_update = models.DateTimeField(null=False)
+    version = models.BigIntegerField(default=0)
 
     objects = managers.ExtendedManager()
 
+    schedule_fields = {
+        IntervalSchedule: "interval",
+        CrontabSchedule: "crontab",
+        SolarSchedule: "solar",
+        ClockedSchedule: "clocked",
+    }
+
     @classmethod
     def changed(cls, instance, **kwargs):
         if not instance.no_changes:
-            cls.update_changed()
+            instance.change_version = cls.update_changed()
 
     @classmethod
-    def update_changed(cls, **kwargs):
-        cls.objects.update_or_create(ident=1, defaults={"last_update": now()})
+    def update_changed(cls, queryset=None, **kwargs):
+        """Bump the change version and return it.
+
+        The rows of ``queryset`` (PeriodicTask), if given, are stamped with
+        the new version.  The row lock taken by the update serializes the
+        writers until commit, so versions become visible in order.
+        """
+        with transaction.atomic():
+            changes = cls.objects.filter(ident=1)
+            fields = {"last_update": now(), "version": models.F("version") + 1}
+            if not changes.update(**fields):
+                cls.objects.get_or_create(ident=1, defaults={"last_update": now()})
+                changes.update(**fields)
+            version = changes.values_list("version", flat=True).get()
+            if queryset is not None:
+                queryset.update(change_version=version)
+        return version
+
+    @classmethod
+    def schedule_changed(cls, sender, instance, **kwargs):
+        """Stamp the periodic tasks that use the changed schedule."""
+        cls.update_changed(
+            PeriodicTask.objects.filter(**{cls.schedule_fields[sender]: instance})
+        )
 
     @classmethod
     def last_change(cls):
@@ -408,6 +442,10 @@ class PeriodicTasks(models.Model):
         except cls.DoesNotExist:
             pass
 
+    @classmethod
+    def current_version(cls):
+        return cls.objects.filter(ident=1).values_list("version", flat=True).first()
+
 
 class PeriodicTask(models.Model):
     """Model representing a periodic task."""
@@ -600,6 +638,13 @@ class PeriodicTask(models.Model):
         verbose_name=_("Last Modified"),
         help_text=_("Datetime that this PeriodicTask was last modified"),
     )
+    change_version = models.BigIntegerField(
+        default=0,
+        editable=False,
+        db_index=True,
+        verbose_name=_("Change Version"),
+        help_text=_("Value of PeriodicTasks.version when this task last changed"),
+    )
     description = models.TextField(
         blank=True,
         verbose_name=_("Description"),
@@ -675,7 +720,10 @@ class PeriodicTask(models.Model):
             self.last_run_at = None
         self._clean_expires()
         self.validate_unique()
-        super().save(*args, **kwargs)
+        # the version bump (pre_save) and the row must commit together,
+        # otherwise the scheduler could skip this change
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     def _clean_expires(self):
         if self.expire_seconds is not None and self.expires:
@@ -714,10 +762,10 @@ class PeriodicTask(models.Model):
 signals.pre_delete.connect(PeriodicTasks.changed, sender=PeriodicTask)
 signals.pre_save.connect(PeriodicTasks.changed, sender=PeriodicTask)
 signals.pre_delete.connect(PeriodicTasks.update_changed, sender=IntervalSchedule)
-signals.post_save.connect(PeriodicTasks.update_changed, sender=IntervalSchedule)
+signals.post_save.connect(PeriodicTasks.schedule_changed, sender=IntervalSchedule)
 signals.post_delete.connect(PeriodicTasks.update_changed, sender=CrontabSchedule)
-signals.post_save.connect(PeriodicTasks.update_changed, sender=CrontabSchedule)
+signals.post_save.connect(PeriodicTasks.schedule_changed, sender=CrontabSchedule)
 signals.post_delete.connect(PeriodicTasks.update_changed, sender=SolarSchedule)
-signals.post_save.connect(PeriodicTasks.update_changed, sender=SolarSchedule)
+signals.post_save.connect(PeriodicTasks.schedule_changed, sender=SolarSchedule)
 signals.post_delete.connect(PeriodicTasks.update_changed, sender=ClockedSchedule)
-signals.post_save.connect(PeriodicTasks.update_changed, sender=ClockedSchedule)
+signals.post_save.connect(PeriodicTasks.schedule_changed, sender=ClockedSchedule)
@@ -2,6 +2,7 @@
 import datetime
 import logging
 import math
+import time
 from multiprocessing.util import Finalize
 
 from celery import current_app, schedules
@@ -9,8 +10,8 @@ from celery.beat import ScheduleEntry, Scheduler
 from celery.utils.log import get_logger
 from celery.utils.time import maybe_make_aware
 from django.conf import settings
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import close_old_connections, transaction
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Q
 from django.db.utils import DatabaseError, InterfaceError
 from kombu.utils.encoding import safe_repr, safe_str
 from kombu.utils.json import dumps, loads
@@ -31,6 +32,12 @@ from .utils import NEVER_CHECK_TIMEOUT
 # changes to the schedule into account.
 DEFAULT_MAX_INTERVAL = 5  # seconds
 
+# Minimum time between two checks of PeriodicTasks.version, see
+# DJANGO_CELERY_BEAT_CHANGE_CHECK_INTERVAL.
+DEFAULT_CHANGE_CHECK_INTERVAL = 5  # seconds
+
+SCHEDULE_RELATED = ("interval", "crontab", "solar", "clocked")
+
 ADD_ENTRY_ERROR = """\
 Cannot add entry %r to database schedule: %r. Contents: %r
 """
@@ -49,6 +56,9 @@ class ModelEntry(ScheduleEntry):
         (clocked, ClockedSchedule, "clocked"),
     )
     save_fields = ["last_run_at", "total_run_count", "no_changes"]
+    # columns written by DatabaseScheduler.sync (no_changes is not a column,
+    # bulk_update does not send pre_save)
+    sync_fields = ["last_run_at", "total_run_count"]
 
     def __init__(self, model, app=None):
         """Initialize the model entry."""
@@ -232,9 +242,12 @@ class DatabaseScheduler(Scheduler):
     Changes = PeriodicTasks
 
     _schedule = None
-    _last_timestamp = None
     _initial_read = True
     _heap_invalidated = False
+    # PeriodicTasks.version of the in-process snapshot (_schedule)
+    _version = None
+    _changed_version = None
+    _last_check = 0
 
     def __init__(self, *args, **kwargs):
         """Initialize the database scheduler."""
@@ -254,14 +267,46 @@ class DatabaseScheduler(Scheduler):
     def all_as_schedule(self):
         debug("DatabaseScheduler: Fetching database schedule")
         s = {}
-        for model in self.Model.objects.enabled():
+        for model in self.Model.objects.enabled().select_related(*SCHEDULE_RELATED):
             try:
                 s[model.name] = self.Entry(model, app=self.app)
             except ValueError:
                 pass
         return s
 
+    def apply_changes(self):
+        """Update the snapshot with the tasks changed since its version.
+
+        Tasks enabled or removed by bulk updates, which are not stamped
+        with a version, are found by comparing the enabled task names.
+        """
+        debug("DatabaseScheduler: Fetching changed tasks")
+        enabled = set(self.Model.objects.enabled().values_list("name", flat=True))
+        changed = self.Model.objects.filter(
+            Q(change_version__gt=self._version)
+            | Q(name__in=enabled.difference(self._schedule))
+        ).select_related(*SCHEDULE_RELATED)
+
+        for name in set(self._schedule).difference(enabled):
+            del self._schedule[name]
+        for model in changed:
+            self._schedule.pop(model.name, None)
+            if not model.enabled:
+                continue
+            try:
+                self._schedule[model.name] = self.Entry(model, app=self.app)
+            except ValueError:
+                pass
+
     def schedule_changed(self):
+        check_interval = getattr(
+            settings,
+            "DJANGO_CELERY_BEAT_CHANGE_CHECK_INTERVAL",
+            DEFAULT_CHANGE_CHECK_INTERVAL,
+        )
+        if time.monotonic() - self._last_check < check_interval:
+            return False
+        self._last_check = time.monotonic()
         try:
             close_old_connections()
 
@@ -269,12 +314,13 @@ class DatabaseScheduler(Scheduler):
             # REPEATABLE-READ (default), then we won't see changes done by
             # other transactions until the current transaction is
             # committed (Issue #41).
-            try:
-                transaction.commit()
-            except transaction.TransactionManagementError:
-                pass  # not in transaction management.
+            if connection.vendor == "mysql":
+                try:
+                    transaction.commit()
+                except transaction.TransactionManagementError:
+                    pass  # not in transaction management.
 
-            last, ts = self._last_timestamp, self.Changes.last_change()
+            self._changed_version = self.Changes.current_version()
         except DatabaseError as exc:
             logger.exception("Database gave error: %r", exc)
             return False
@@ -285,12 +331,7 @@ class DatabaseScheduler(Scheduler):
             )
             return False
 
-        try:
-            if ts and ts > (last if last else ts):
-                return True
-        finally:
-            self._last_timestamp = ts
-        return False
+        return self._changed_version != self._version
 
     def reserve(self, entry):
         new_entry = next(entry)
@@ -302,28 +343,28 @@ class DatabaseScheduler(Scheduler):
     def sync(self):
         if logger.isEnabledFor(logging.DEBUG):
             debug("Writing entries...")
-        _tried = set()
-        _failed = set()
+        dirty, self._dirty = self._dirty, set()
+        # entries removed from the schedule are not written
+        models = [
+            self._schedule[name].model
+            for name in dirty
+            if self._schedule and name in self._schedule
+        ]
+        if not models:
+            return
         try:
             close_old_connections()
-
-            while self._dirty:
-                name = self._dirty.pop()
-                try:
-                    self.schedule[name].save()
-                    _tried.add(name)
-                except (KeyError, ObjectDoesNotExist):
-                    _failed.add(name)
+            self.Model.objects.bulk_update(models, self.Entry.sync_fields)
         except DatabaseError as exc:
             logger.exception("Database error while sync: %r", exc)
+            # retry later
+            self._dirty |= dirty
         except InterfaceError:
             warning(
                 "DatabaseScheduler: InterfaceError in sync(), "
                 "waiting to retry in next call..."
             )
-        finally:
-            # retry later, only for the failed ones
-            self._dirty |= _failed
+            self._dirty |= dirty
 
     def update_from_dict(self, mapping):
         s = {}
@@ -363,13 +404,26 @@ class DatabaseScheduler(Scheduler):
             debug("DatabaseScheduler: initial read")
             initial = update = True
             self._initial_read = False
+            self.schedule_changed()
         elif self.schedule_changed():
             info("DatabaseScheduler: Schedule changed.")
             update = True
 
         if update:
             self.sync()
-            self._schedule = self.all_as_schedule()
+            try:
+                if self._schedule is None or self._version is None:
+                    self._schedule = self.all_as_schedule()
+                else:
+                    self.apply_changes()
+            except DatabaseError as exc:
+                # keeps the snapshot version, the changes are read again
+                # in the next check
+                logger.exception("Database error while loading schedule: %r", exc)
+                if self._schedule is None:
+                    raise
+            else:
+                self._version = self._changed_version
             # the schedule changed, invalidate the heap in Scheduler.tick
             if not initial:
                 self._heap = []
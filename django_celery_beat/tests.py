@@ -0,0 +1,124 @@
+from unittest.mock import patch
+
+from celery import current_app
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from django_celery_beat.models import IntervalSchedule, PeriodicTask, PeriodicTasks
+from django_celery_beat.schedulers import DatabaseScheduler
+
+
+def create_periodic_task(name, interval, **kwargs):
+    return PeriodicTask.objects.create(
+        name=name, task=f"tasks.{name}", interval=interval, **kwargs
+    )
+
+
+class PeriodicTasksVersionTest(TestCase):
+    def setUp(self):
+        self.interval = IntervalSchedule.objects.create(
+            every=10, period=IntervalSchedule.SECONDS
+        )
+
+    def test_save_bumps_version_and_stamps_task(self):
+        task = create_periodic_task("a", self.interval)
+        version = PeriodicTasks.current_version()
+        self.assertEqual(version, task.change_version)
+
+        task.description = "changed"
+        task.save()
+        task.refresh_from_db()
+        self.assertEqual(version + 1, PeriodicTasks.current_version())
+        self.assertEqual(version + 1, task.change_version)
+
+    def test_delete_bumps_version(self):
+        task = create_periodic_task("a", self.interval)
+        version = PeriodicTasks.current_version()
+        task.delete()
+        self.assertEqual(version + 1, PeriodicTasks.current_version())
+
+    def test_schedule_save_stamps_its_tasks(self):
+        task = create_periodic_task("a", self.interval)
+        other_interval = IntervalSchedule.objects.create(
+            every=1, period=IntervalSchedule.HOURS
+        )
+        other = create_periodic_task("b", other_interval)
+
+        self.interval.every = 20
+        self.interval.save()
+        version = PeriodicTasks.current_version()
+        task.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(version, task.change_version)
+        self.assertLess(other.change_version, version)
+
+
+@override_settings(DJANGO_CELERY_BEAT_CHANGE_CHECK_INTERVAL=0)
+class DatabaseSchedulerTest(TestCase):
+    def setUp(self):
+        # close_old_connections descartaria a conexão da transação do teste
+        patcher = patch("django_celery_beat.schedulers.close_old_connections")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.interval = IntervalSchedule.objects.create(
+            every=10, period=IntervalSchedule.SECONDS
+        )
+        self.tasks = {
+            name: create_periodic_task(name, self.interval) for name in "abc"
+        }
+        self.scheduler = DatabaseScheduler(app=current_app, lazy=True)
+
+    def test_apply_changes_reloads_only_changed_entries(self):
+        create_periodic_task("d", self.interval, enabled=False)
+        before = dict(self.scheduler.schedule)
+        self.assertEqual({"a", "b", "c"}, set(before))
+
+        self.tasks["b"].args = "[1]"
+        self.tasks["b"].save()
+        self.tasks["c"].delete()
+        # bulk update não carimba change_version: detectado pelos nomes
+        PeriodicTask.objects.filter(name="d").update(enabled=True)
+        create_periodic_task("e", self.interval)
+
+        with patch.object(
+            self.scheduler, "all_as_schedule", side_effect=AssertionError
+        ):
+            after = self.scheduler.schedule
+
+        self.assertEqual({"a", "b", "d", "e"}, set(after))
+        self.assertIs(before["a"], after["a"])
+        self.assertIsNot(before["b"], after["b"])
+        self.assertEqual([1], after["b"].args)
+        self.assertEqual(PeriodicTasks.current_version(), self.scheduler._version)
+
+    def test_schedule_is_not_reloaded_without_changes(self):
+        before = dict(self.scheduler.schedule)
+        with patch.object(self.scheduler, "apply_changes") as apply_changes:
+            after = self.scheduler.schedule
+        apply_changes.assert_not_called()
+        self.assertEqual(before, after)
+
+    def test_sync_writes_dirty_entries_in_one_update(self):
+        schedule = self.scheduler.schedule
+        version = PeriodicTasks.current_version()
+        self.scheduler.reserve(schedule["a"])
+        self.scheduler.reserve(schedule["b"])
+        self.scheduler.reserve(schedule["b"])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.scheduler.sync()
+
+        self.assertEqual(1, len(queries))
+        self.assertTrue(queries[0]["sql"].startswith("UPDATE"))
+        self.assertEqual(set(), self.scheduler._dirty)
+        tasks = {task.name: task for task in PeriodicTask.objects.all()}
+        self.assertEqual(1, tasks["a"].total_run_count)
+        self.assertEqual(2, tasks["b"].total_run_count)
+        self.assertIsNotNone(tasks["a"].last_run_at)
+        self.assertIsNotNone(tasks["b"].last_run_at)
+        self.assertEqual(0, tasks["c"].total_run_count)
+        self.assertIsNone(tasks["c"].last_run_at)
+        # sync não altera a versão: o beat não recarrega suas próprias escritas
+        self.assertEqual(version, PeriodicTasks.current_version())
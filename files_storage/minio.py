@@ -10,6 +10,8 @@ from zipfile import BadZipFile, ZipFile
 from minio import Minio
 from minio.error import S3Error
 
+from core.utils.tracing import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -407,9 +409,10 @@ class MinioStorage:
                 downloaded_file_path = self._create_tmp_file()
 
             # https://docs.min.io/docs/python-client-api-reference.html#fget_object
-            self._client.fget_object(
-                self.bucket_root, object_name, downloaded_file_path
-            )
+            with span("storage.fget", {"storage.object_name": object_name}):
+                self._client.fget_object(
+                    self.bucket_root, object_name, downloaded_file_path
+                )
 
             return downloaded_file_path
         except Exception as e:
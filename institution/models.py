@@ -1,5 +1,4 @@
 import csv
-import logging
 import os
 
 from django.db import models, IntegrityError
@@ -11,6 +10,7 @@ from wagtailautocomplete.edit_handlers import AutocompletePanel
 
 from core.forms import CoreAdminModelForm
 from core.models import CommonControlField
+from core.utils.bulk_loader import bulk_load, read_csv
 from core.utils.standardizer import remove_extra_spaces
 from location.models import Country, Location, State
 
@@ -347,36 +347,48 @@ class Institution(CommonControlField, ClusterableModel):
             "level_3": "Level_3",
         }
 
-        with open(file_path, "r") as csvfile:
-            rows = csv.DictReader(
-                csvfile, delimiter=";", fieldnames=list(column_labels.values())
-            )
-            country = Country.create_or_update(user, acronym="BR")
-            for line, row in enumerate(rows):
-                logging.info(row)
-                name = row.get(column_labels["name"])
-                acronym = row.get(column_labels["acronym"])
-
-                if name == column_labels["name"]:
-                    continue
-
+        rows = [
+            {key: remove_extra_spaces(row.get(label)) for key, label in column_labels.items()}
+            for row in read_csv(file_path, fieldnames=list(column_labels.values()))
+            if row.get(column_labels["name"]) != column_labels["name"]
+        ]
+        identifications = InstitutionIdentification.bulk_load(
+            user, rows, is_official=is_official
+        )
 
-                location = Location.create_or_update(
-                    user=user, country=country, city=None,
-                )
-                cls.create_or_update(
-                    user=user,
-                    name=name,
-                    acronym=acronym,
-                    level_1=None,
-                    level_2=None,
-                    level_3=None,
-                    location=location,
-                    official=None,
-                    is_official=is_official,
-                    url=None,
-                    institution_type=column_labels["type"],
-                )
+        country = Country.create_or_update(user, acronym="BR")
+        location = Location.create_or_update(user=user, country=country, city=None)
+        institutions = []
+        for row in rows:
+            identification = identifications.get(
+                InstitutionIdentification.bulk_key(row)
+            )
+            if not identification:
+                continue
+            institutions.append(
+                {
+                    "institution_identification_id": identification.pk,
+                    "level_1": None,
+                    "level_2": None,
+                    "level_3": None,
+                    "location_id": location and location.pk,
+                    "institution_type": row.get("type"),
+                }
+            )
+        bulk_load(
+            cls,
+            institutions,
+            user,
+            key_fields=[
+                "institution_identification_id",
+                "level_1",
+                "level_2",
+                "level_3",
+                "location_id",
+            ],
+            update_fields=["institution_type"],
+            normalize=str.casefold,
+        )
 
 
 class InstitutionHistory(models.Model):
@@ -1008,18 +1020,43 @@ class InstitutionIdentification(CommonControlField):
             "level_3": "Level_3",
         }
 
-        with open(file_path, "r") as csvfile:
-            rows = csv.DictReader(
-                csvfile, delimiter=";", fieldnames=list(column_labels.values())
-            )
-            for line, row in enumerate(rows):
-                cls.create_or_update(
-                    user=user,
-                    name=row.get(column_labels["name"]),
-                    acronym=row.get(column_labels["acronym"]),
-                    is_official=is_official,
-                    official=None,
-                )
+        rows = (
+            {
+                "name": remove_extra_spaces(row.get(column_labels["name"])),
+                "acronym": remove_extra_spaces(row.get(column_labels["acronym"])),
+            }
+            for row in read_csv(file_path, fieldnames=list(column_labels.values()))
+        )
+        cls.bulk_load(user, rows, is_official=is_official)
+
+    @staticmethod
+    def bulk_key(row):
+        return tuple(
+            value and value.casefold() for value in (row.get("name"), row.get("acronym"))
+        )
+
+    @classmethod
+    def bulk_load(cls, user, rows, is_official=False):
+        """
+        Carga em lote (rows: dicts com name e acronym), identificados
+        por name e acronym sem diferenciar maiúsculas, como em _get.
+        Retorna dict {bulk_key: objeto}
+        """
+        return bulk_load(
+            cls,
+            (
+                {
+                    "name": row.get("name"),
+                    "acronym": row.get("acronym"),
+                    "is_official": is_official or None,
+                }
+                for row in rows
+            ),
+            user,
+            key_fields=["name", "acronym"],
+            update_fields=["is_official"],
+            normalize=str.casefold,
+        )
 
 
 class InstitutionType(CommonControlField):
@@ -1046,12 +1083,12 @@ class InstitutionType(CommonControlField):
     def load(cls, user, file_path=None):
         file_path = file_path or "./institution/fixtures/institution_type.csv"
         with open(file_path, "r") as file:
-            name = csv.reader(file)
-            for n in name:
-                cls.create_or_update(
-                    name=n[0],
-                    user=user,
-                )
+            bulk_load(
+                cls,
+                ({"name": row[0]} for row in csv.reader(file) if row),
+                user,
+                key_fields=["name"],
+            )
 
     @classmethod
     def get(cls, name):
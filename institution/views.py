@@ -8,7 +8,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.utils.translation import gettext_lazy as _
 from wagtail.admin import messages
 
-from core.libs import chkcsv
+from core.utils.csv_validator import validate_csv_file
 
 from .models import Scimago, ScimagoFile
 
@@ -24,20 +24,16 @@ def validate_scimago(request):
     if request.method == "GET":
         try:
             upload_path = file_upload.attachment.file.path
-            cols = chkcsv.read_format_specs(
+            result = validate_csv_file(
+                upload_path,
                 os.path.dirname(os.path.abspath(__file__)) + "/scimago_chkcsvfmt.fmt",
-                True,
-                False,
-            )
-            errorlist = chkcsv.check_csv_file(
-                upload_path, cols, True, True, True, False
             )
+            errorlist = result.errors
             if errorlist:
                 raise Exception(_("Validation error"))
             else:
                 file_upload.is_valid = True
-                fp = open(upload_path)
-                file_upload.line_count = len(fp.readlines())
+                file_upload.line_count = result.line_count
                 file_upload.save()
         except Exception as ex:
             messages.error(request, _("Validation error: %s") % errorlist)
@@ -1,15 +1,24 @@
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from collection.models import Collection
+from core.models import Language
 from core.utils.harvesters import AMHarvester
 from core.utils import utils
 from core.utils.rename_dictionary_keys import rename_issue_dictionary_keys
 
-from issue.models import AMIssue, Issue
+from issue.models import (
+    AMIssue,
+    BibliographicStrip,
+    Issue,
+    IssueArticleMetaFormat,
+    IssueTitle,
+    TableOfContents,
+)
 from issue.articlemeta.correspondencia import correspondencia_issue
 from issue.articlemeta.issue_utils import extract_data_from_harvested_data
-from journal.models import SciELOJournal
+from journal.models import JournalTableOfContents, SciELOJournal
 from tracker.models import UnexpectedEvent
 
 
@@ -160,13 +169,14 @@ def complete_am_issue(user, am_issue):
         )
 
 
-def get_issue_data_from_am_issue(am_issue, user=None):
+def get_issue_data_from_am_issue(am_issue, user=None, journal=None):
     """
     Extrai e ajusta dados do AMIssue para criação de Issue.
 
     Args:
         am_issue: Instância de AMIssue
         user: Usuário para completar dados se necessário
+        journal: Journal do issue, se já conhecido (evita consulta)
 
     Returns:
         Dict com dados ajustados para Issue ou None se falhar
@@ -201,11 +211,12 @@ def get_issue_data_from_am_issue(am_issue, user=None):
         # Retornar dados ajustados para Issue
         extracted_data = extract_data_from_harvested_data(issue_dict, am_issue.pid)
 
-        scielo_journal = SciELOJournal.objects.get(
-            collection=am_issue.collection,
-            issn_scielo=am_issue.pid[:9],
-        )
-        extracted_data["journal"] = scielo_journal.journal
+        if not journal:
+            journal = SciELOJournal.objects.get(
+                collection=am_issue.collection,
+                issn_scielo=am_issue.pid[:9],
+            ).journal
+        extracted_data["journal"] = journal
         return extracted_data
     except Exception as e:
         exc_type, exc_value, exc_traceback = sys.exc_info()
@@ -433,3 +444,269 @@ def load_bibliographic_strips(user, issue, am_issue=None, issue_data=None, bibli
             },
         )
         return False
+
+
+def harvest_and_load_issues(
+    user, collection_acron, issue_identifiers, force_update, timeout=30, max_workers=8
+):
+    """
+    Carrega em lote uma página de identificadores obtidos por
+    harvest_issue_identifiers.
+
+    Os JSON são obtidos de forma concorrente, os AMIssue são gravados com
+    AMIssue.bulk_upsert, os periódicos são obtidos uma vez por ISSN e
+    issues, seções, títulos e tiras bibliográficas são criados com
+    bulk_create.
+
+    Returns:
+        Lista de Issue carregados
+    """
+    collection = Collection.objects.get(acron3=collection_acron)
+    identifiers = [
+        item for item in issue_identifiers if item.get("url") and item.get("code")
+    ]
+    if not identifiers:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        harvested_items = list(
+            executor.map(
+                lambda item: harvest_issue_data(item["url"], timeout=timeout),
+                identifiers,
+            )
+        )
+
+    records = []
+    for identifier, harvested_data in zip(identifiers, harvested_items):
+        records.append(
+            {
+                "pid": identifier["code"],
+                "collection": collection,
+                "url": identifier["url"],
+                "data": harvested_data.get("data"),
+                "status": harvested_data.get("status"),
+                "processing_date": identifier.get("processing_date"),
+            }
+        )
+    # registros com o mesmo processing_date não são retornados (sem mudança)
+    am_issues = [
+        item for item in AMIssue.bulk_upsert(records, user, force_update) if item.data
+    ]
+    if not am_issues:
+        return []
+
+    journals = {
+        scielo_journal.issn_scielo: scielo_journal.journal
+        for scielo_journal in SciELOJournal.objects.filter(
+            collection=collection,
+            issn_scielo__in={am_issue.pid[:9] for am_issue in am_issues},
+        ).select_related("journal")
+    }
+
+    items = []
+    for am_issue in am_issues:
+        journal = journals.get(am_issue.pid[:9])
+        if not journal:
+            UnexpectedEvent.create(
+                exception=SciELOJournal.DoesNotExist(
+                    f"SciELOJournal {am_issue.pid[:9]} {collection_acron}"
+                ),
+                action="issue.articlemeta.loader.harvest_and_load_issues",
+                detail={"am_issue": str(am_issue)},
+            )
+            continue
+        issue_data = get_issue_data_from_am_issue(am_issue, journal=journal)
+        if issue_data:
+            items.append((am_issue, issue_data))
+
+    issues = _bulk_get_or_create_issues(user, [data for am_issue, data in items])
+    for (am_issue, issue_data), issue in zip(items, issues):
+        am_issue.new_record = issue
+        am_issue.status = "completed"
+        am_issue.updated_by = user
+    AMIssue.objects.bulk_update(
+        [am_issue for am_issue, issue_data in items],
+        ["new_record", "status", "updated_by"],
+    )
+
+    _bulk_add_issue_children(user, collection, items, issues)
+    return issues
+
+
+def _issue_lookup_params(data):
+    return Issue.lookup_params(
+        data["journal"].id,
+        data.get("year"),
+        data.get("volume"),
+        data.get("number"),
+        data.get("supplement"),
+    )
+
+
+def _issue_matches(issue, params):
+    """
+    Equivale a Issue.objects.filter(**params) para um Issue já carregado
+    """
+    for name, value in params.items():
+        if name == "journal":
+            if issue.journal_id != value:
+                return False
+        elif getattr(issue, name) != str(value):
+            return False
+    return True
+
+
+def _bulk_get_or_create_issues(user, issue_data_list):
+    """
+    Obtém os Issue existentes em uma consulta e cria os ausentes com
+    bulk_create. Retorna os Issue na mesma ordem de issue_data_list.
+
+    A correspondência segue Issue.get: campos None não restringem a busca e,
+    havendo mais de um, fica o atualizado mais recentemente
+    """
+    lookups = [_issue_lookup_params(data) for data in issue_data_list]
+    years = {params.get("year") for params in lookups}
+    registered = Issue.objects.filter(
+        journal_id__in={params["journal"] for params in lookups}
+    )
+    if None not in years:
+        registered = registered.filter(year__in=years)
+
+    # candidatos por periódico, do menos para o mais recente; os criados
+    # neste lote são os mais recentes
+    candidates = {}
+    for issue in registered.order_by("updated"):
+        candidates.setdefault(issue.journal_id, []).append(issue)
+
+    issues = []
+    new_issues = []
+    for params, data in zip(lookups, issue_data_list):
+        journal_issues = candidates.setdefault(params["journal"], [])
+        issue = next(
+            (
+                issue
+                for issue in reversed(journal_issues)
+                if _issue_matches(issue, params)
+            ),
+            None,
+        )
+        if not issue:
+            issue = Issue(
+                journal=data["journal"],
+                volume=data.get("volume"),
+                number=data.get("number"),
+                season=data.get("season"),
+                year=data.get("year"),
+                month=data.get("month"),
+                supplement=data.get("supplement"),
+                markup_done=data.get("markup_done"),
+                creator=user,
+            )
+            issue.order = data.get("order") or issue.generate_order()
+            issue.issue_pid_suffix = (
+                data.get("issue_pid_suffix") or issue.generate_issue_pid_suffix()
+            )
+            issue.issue_folder = issue.generate_issue_folder()
+            journal_issues.append(issue)
+            new_issues.append(issue)
+        issues.append(issue)
+    Issue.objects.bulk_create(new_issues)
+    return issues
+
+
+def _bulk_add_issue_children(user, collection, items, issues):
+    """
+    Cria TableOfContents, IssueTitle e BibliographicStrip dos issues com
+    bulk_create, ignorando os já existentes (mesmo comportamento de
+    get_or_create)
+    """
+    languages = {}
+
+    def get_language(code):
+        if code not in languages:
+            try:
+                languages[code] = Language.get(code)
+            except (Language.DoesNotExist, ValueError):
+                languages[code] = None
+        return languages[code]
+
+    titles = []
+    strips = []
+    sections = []
+    for (am_issue, issue_data), issue in zip(items, issues):
+        for item in issue_data.get("issue_titles") or []:
+            language = item.get("language") and get_language(item["language"])
+            if item.get("title") and language:
+                titles.append(
+                    IssueTitle(
+                        issue=issue, language=language, title=item["title"], creator=user
+                    )
+                )
+        for item in issue_data.get("bibliographic_strip_list") or []:
+            language = item.get("language") and get_language(item["language"])
+            if item.get("text") and language:
+                strips.append(
+                    BibliographicStrip(
+                        issue=issue, language=language, text=item["text"], creator=user
+                    )
+                )
+        for item in issue_data.get("sections_data") or []:
+            if item.get("t") and item.get("l"):
+                sections.append(
+                    (issue, (issue.journal_id, item["l"].id, item["t"], item.get("c")))
+                )
+
+    journal_tocs = _bulk_get_or_create_journal_tocs(
+        user, collection, {key for issue, key in sections}
+    )
+    IssueTitle.objects.bulk_create(titles, ignore_conflicts=True)
+    BibliographicStrip.objects.bulk_create(strips, ignore_conflicts=True)
+    TableOfContents.objects.bulk_create(
+        [
+            TableOfContents(issue=issue, journal_toc=journal_tocs[key], creator=user)
+            for issue, key in sections
+            if key in journal_tocs
+        ],
+        ignore_conflicts=True,
+    )
+    # bulk_create não emite post_save
+    IssueArticleMetaFormat.invalidate(parent__in=issues)
+
+
+def _bulk_get_or_create_journal_tocs(user, collection, keys):
+    """
+    Obtém / cria os JournalTableOfContents identificados por
+    (journal_id, language_id, text, code) da coleção
+    """
+    if not keys:
+        return {}
+
+    def get_registered():
+        return {
+            (item.journal_id, item.language_id, item.text, item.code): item
+            for item in JournalTableOfContents.objects.filter(
+                collection=collection,
+                journal_id__in={key[0] for key in keys},
+                text__in={key[2] for key in keys},
+            )
+        }
+
+    registered = get_registered()
+    missing = keys - set(registered)
+    if missing:
+        JournalTableOfContents.objects.bulk_create(
+            [
+                JournalTableOfContents(
+                    journal_id=journal_id,
+                    collection=collection,
+                    language_id=language_id,
+                    text=text,
+                    code=code,
+                    creator=user,
+                )
+                for journal_id, language_id, text, code in missing
+            ],
+            ignore_conflicts=True,
+        )
+        registered = get_registered()
+    return registered
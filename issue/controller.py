@@ -42,14 +42,6 @@ def export_issue_to_articlemeta(
                 logging.info(
                     (user, issue, "articlemeta", pid, col, version, force_update)
                 )
-                events.append("check articlemeta exportation demand")
-                exporter = IssueExporter.get_demand(
-                    user, issue, "articlemeta", pid, col, version, force_update
-                )
-                if not exporter:
-                    # não encontrou necessidade de exportar
-                    continue
-
                 events.append("building articlemeta format for issue")
                 issue_data = issue.articlemeta_format(col.acron3)
 
@@ -60,6 +52,22 @@ def export_issue_to_articlemeta(
                     response = str(issue_data)
                     raise e
 
+                events.append("check articlemeta exportation demand")
+                content_hash = IssueExporter.generate_content_hash(issue_data)
+                exporter = IssueExporter.get_demand(
+                    user,
+                    issue,
+                    "articlemeta",
+                    pid,
+                    col,
+                    version,
+                    force_update,
+                    content_hash=content_hash,
+                )
+                if not exporter:
+                    # conteúdo não mudou desde a última exportação
+                    continue
+
                 events.append("writing issue to articlemeta database")
                 response = write_item("issues", issue_data)
                 exporter.finish(
@@ -69,6 +77,7 @@ def export_issue_to_articlemeta(
                     response=response,
                     errors=None,
                     exceptions=None,
+                    content_hash=content_hash,
                 )
             except Exception as e:
                 exc_type, exc_value, exc_traceback = sys.exc_info()
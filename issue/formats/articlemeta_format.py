@@ -1,5 +1,8 @@
+import copy
 from collections import defaultdict
-from functools import lru_cache
+from functools import cached_property
+
+from django.db.models import Count, F, prefetch_related_objects
 
 from article.models import Article
 from core.utils.articlemeta_dict_utils import (
@@ -7,8 +10,13 @@ from core.utils.articlemeta_dict_utils import (
     add_multiple_to_result,
     add_to_result,
 )
-from journal.formats.articlemeta_format import ArticlemetaJournalFormatter
-from journal.models import SciELOJournal, TitleInDatabase
+from journal.formats.articlemeta_format import (
+    JOURNAL_BATCH_SELECT_RELATED,
+    ArticlemetaJournalFormatter,
+    prefetch_journals_for_articlemeta_format,
+    select_scielo_journal,
+)
+from journal.models import Journal, SciELOJournal, TitleInDatabase
 
 def get_issue_type(issue):
     if issue.supplement:
@@ -30,33 +38,47 @@ class ArticlemetaIssueFormatter:
         self.result = defaultdict(list)
         self.result["issue"] = {}
         self.journal = self.obj.journal
-        self._scielo_journal = None
-        self._medline_titles = None
-        self.article = Article.objects.filter(issue=self.obj, journal=self.journal)
 
-    @property
+    @cached_property
     def scielo_journal(self):
-        if self._scielo_journal is not None:
-            return self._scielo_journal
+        prefetched = getattr(self.journal, "prefetched_scielo_journals", None)
+        if prefetched is not None:
+            return select_scielo_journal(prefetched, self.collection_acron)
 
         qs = SciELOJournal.objects.select_related("journal", "collection").filter(
             journal=self.journal,
         )
         if self.collection_acron:
             qs = qs.filter(collection__acron3=self.collection_acron)
+        return qs.first()
 
-        self._scielo_journal = qs.first()
-        return self._scielo_journal
-
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def medline_titles(self):
+        prefetched = getattr(self.journal, "prefetched_titles_in_database", None)
+        if prefetched is not None:
+            return [
+                t for t in prefetched
+                if t.indexed_at and (t.indexed_at.acronym or "").lower() == "medline"
+            ]
         return list(
             TitleInDatabase.objects.filter(
                 journal=self.journal, indexed_at__acronym__iexact="medline"
             )
         )
 
+    @cached_property
+    def article_count(self):
+        """
+        Total de artigos do fascículo, contado somente se houver artigos
+        do fascículo associados ao periódico
+        """
+        prefetched = getattr(self.obj, "prefetched_article_count", None)
+        if prefetched is not None:
+            return prefetched
+        if Article.objects.filter(issue=self.obj, journal=self.journal).exists():
+            return self.obj.article_set.count()
+        return 0
+
     def format(self):
         """Formata todos os dados do issue"""
         formatters = [
@@ -307,9 +329,8 @@ class ArticlemetaIssueFormatter:
 
     def _format_article_info(self):
         """Informações de artigo"""
-        if self.article.exists():
-            article_count = str(self.obj.article_set.count())
-            add_to_result("v122", article_count, self.result["issue"])
+        if self.article_count:
+            add_to_result("v122", str(self.article_count), self.result["issue"])
 
     def _format_issn_info(self):
         """Informações de edição"""
@@ -369,12 +390,86 @@ class ArticlemetaIssueFormatter:
             self.result["issue"]["v49"] = data
 
 
-def get_articlemeta_format_issue(obj, collection):
+def get_articlemeta_format_issue(obj, collection, journal_data=None):
     """
     Converte issue para formato ArticleMeta
+
+    journal_data: documento do periódico já formatado (opcional), evita
+    formatar novamente o periódico
     """
     data = {}
-    data["title"] = ArticlemetaJournalFormatter(obj.journal, collection).format()
+    data["title"] = journal_data or ArticlemetaJournalFormatter(obj.journal, collection).format()
     formatter_issue = ArticlemetaIssueFormatter(obj, collection).format()
     data.update(formatter_issue)
     return data
+
+
+def prefetch_issues_for_articlemeta_format(issues):
+    """
+    Carrega, uma única vez para todo o lote, os dados usados por
+    ArticlemetaIssueFormatter: periódicos (compartilhados entre os fascículos
+    do mesmo periódico), títulos dos fascículos e total de artigos.
+
+    issues: lista de Issue (ou queryset)
+    """
+    issues = list(issues)
+    journal_ids = {issue.journal_id for issue in issues if issue.journal_id}
+    journals = {
+        journal.id: journal
+        for journal in prefetch_journals_for_articlemeta_format(
+            Journal.objects.select_related(
+                *JOURNAL_BATCH_SELECT_RELATED, "contact_location__city"
+            ).filter(id__in=journal_ids)
+        )
+    }
+    for issue in issues:
+        if issue.journal_id in journals:
+            issue.journal = journals[issue.journal_id]
+
+    prefetch_related_objects(issues, "issue_title")
+
+    issue_ids = [issue.id for issue in issues]
+    totals = dict(
+        Article.objects.filter(issue_id__in=issue_ids)
+        .values_list("issue_id")
+        .annotate(total=Count("id"))
+    )
+    with_journal_articles = set(
+        Article.objects.filter(issue_id__in=issue_ids, journal_id=F("issue__journal_id"))
+        .values_list("issue_id", flat=True)
+        .distinct()
+    )
+    for issue in issues:
+        issue.prefetched_article_count = (
+            totals.get(issue.id, 0) if issue.id in with_journal_articles else 0
+        )
+    return issues
+
+
+def get_articlemeta_format_issues(issues, collection):
+    """
+    Formata um lote de fascículos no formato ArticleMeta, formatando cada
+    periódico uma única vez
+
+    issues: queryset ou lista de Issue
+    Retorna lista de tuplas (issue, dados formatados)
+    """
+    issues = prefetch_issues_for_articlemeta_format(issues)
+    journal_data = {}
+    items = []
+    for issue in issues:
+        if issue.journal_id not in journal_data:
+            journal_data[issue.journal_id] = ArticlemetaJournalFormatter(
+                issue.journal, collection
+            ).format()
+        items.append(
+            (
+                issue,
+                get_articlemeta_format_issue(
+                    issue,
+                    collection,
+                    journal_data=copy.deepcopy(journal_data[issue.journal_id]),
+                ),
+            )
+        )
+    return items
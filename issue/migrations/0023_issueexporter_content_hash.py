@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("issue", "0022_issuearticlemetaformat"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issueexporter",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, max_length=64, null=True, verbose_name="Content hash"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:02
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def delete_duplicated_records(apps, schema_editor):
+    """
+    Mantém somente o registro atualizado mais recentemente para cada
+    (pid, collection), condição para criar a restrição de unicidade
+    """
+    Model = apps.get_model("issue", "AMIssue")
+    duplicated = (
+        Model.objects.filter(pid__isnull=False, collection__isnull=False)
+        .values("pid", "collection")
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+    )
+    for item in duplicated.iterator():
+        ids = list(
+            Model.objects.filter(pid=item["pid"], collection=item["collection"])
+            .order_by("-updated")
+            .values_list("id", flat=True)
+        )
+        Model.objects.filter(id__in=ids[1:]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("issue", "0023_issueexporter_content_hash"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicated_records, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="amissue",
+            constraint=models.UniqueConstraint(
+                fields=("pid", "collection"), name="unique_amissue_pid_collection"
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:40
+
+from django.db import migrations
+
+# colunas JSON volumosas, lidas sob demanda (DeferredPayloadManager)
+PAYLOAD_COLUMNS = [
+    ("issue_amissue", "data"),
+    ("issue_issueexporter", "detail"),
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("issue", "0024_amissue_unique_amissue_pid_collection"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4"
+                for table, column in PAYLOAD_COLUMNS
+            ],
+            reverse_sql=[
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION pglz"
+                for table, column in PAYLOAD_COLUMNS
+            ],
+        ),
+    ]
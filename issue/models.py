@@ -1,6 +1,7 @@
 from django.utils.functional import cached_property
 
 from django.db import IntegrityError, models
+from django.db.models import signals
 from django.utils.translation import gettext_lazy as _
 from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
@@ -11,6 +12,7 @@ from wagtailautocomplete.edit_handlers import AutocompletePanel
 
 from core.forms import CoreAdminModelForm
 from core.models import (
+    BaseArticleMetaFormat,
     BaseExporter,
     BaseLegacyRecord,
     CommonControlField,
@@ -57,6 +59,12 @@ class AMIssue(BaseLegacyRecord):
                 ]
             ),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["pid", "collection"],
+                name="unique_amissue_pid_collection",
+            ),
+        ]
 
     panels = [
         AutocompletePanel("collection"),
@@ -235,7 +243,7 @@ class Issue(CommonControlField, ClusterableModel):
         if is_active:
             params["collection__is_active"] = bool(is_active)
         data = {}
-        for item in self.legacy_issue.filter(**params):
+        for item in self.legacy_issue.with_payload().filter(**params):
             data[item.collection.acron3] = item.legacy_keys
         if not data:
             UnexpectedEvent.create(
@@ -346,6 +354,22 @@ class Issue(CommonControlField, ClusterableModel):
     def bibliographic(self):
         return [bs.data for bs in self.bibliographic_strip.all()]
 
+    @staticmethod
+    def lookup_params(journal, year, volume=None, number=None, supplement=None):
+        """
+        Parâmetros de busca de Issue.get: valores None não restringem a busca
+        """
+        params = {"journal": journal}
+        if year is not None:
+            params["year"] = year
+        if number is not None:
+            params["number"] = number
+        if volume is not None:
+            params["volume"] = volume
+        if supplement is not None:
+            params["supplement"] = supplement
+        return params
+
     @classmethod
     def get(
         cls,
@@ -361,16 +385,7 @@ class Issue(CommonControlField, ClusterableModel):
         if not journal and not year:
             raise ValueError("Journal and year are required")
         
-        params = {'journal': journal}
-        if year is not None:
-            params['year'] = year
-        if number is not None:
-            params['number'] = number
-        if volume is not None:
-            params['volume'] = volume
-        if supplement is not None:
-            params['supplement'] = supplement
-        
+        params = cls.lookup_params(journal, year, volume, number, supplement)
         try:
             issue = cls.objects.get(**params)
         except cls.MultipleObjectsReturned:
@@ -626,7 +641,33 @@ class Issue(CommonControlField, ClusterableModel):
     def articlemeta_format(self, collection):
         # Evita importacao circular
         from .formats.articlemeta_format import get_articlemeta_format_issue
-        return get_articlemeta_format_issue(self, collection)
+
+        if not collection or not self.journal:
+            return get_articlemeta_format_issue(self, collection)
+        return self.stored_articlemeta_format(collection).data
+
+    def stored_articlemeta_format(self, collection):
+        """
+        Retorna o registro IssueArticleMetaFormat da coleção, regerando o
+        documento somente se o fascículo ou o documento do periódico mudou
+        """
+        from .formats.articlemeta_format import get_articlemeta_format_issue
+
+        journal_format = self.journal.stored_articlemeta_format(collection)
+        return IssueArticleMetaFormat.get_or_build(
+            parent=self,
+            collection_acron3=collection,
+            source_hash=IssueArticleMetaFormat.generate_source_hash(
+                self.pk,
+                self.updated.isoformat(),
+                collection,
+                journal_format.source_hash,
+                journal_format.updated.isoformat(),
+            ),
+            build=lambda: get_articlemeta_format_issue(
+                self, collection, journal_data=journal_format.data
+            ),
+        )
 
     def save(self, *args, **kwargs):
         # Gerar campos computados se estiverem ausentes
@@ -814,6 +855,22 @@ class IssueExporter(BaseExporter):
     )
 
 
+class IssueArticleMetaFormat(BaseArticleMetaFormat):
+    """
+    Documento do fascículo no formato ArticleMeta materializado por coleção
+    """
+
+    parent = ParentalKey(
+        Issue,
+        on_delete=models.CASCADE,
+        related_name="articlemeta_format_set",
+        verbose_name=_("Issue"),
+    )
+
+    class Meta:
+        unique_together = [("parent", "collection")]
+
+
 class TableOfContents(Orderable, CommonControlField):
     """
     Relacionamento ordenado entre Issue e JournalTableOfContents.
@@ -906,3 +963,38 @@ class TableOfContents(Orderable, CommonControlField):
             return cls.get(issue, journal_toc)
         except cls.DoesNotExist:
             return cls.create(user, issue, journal_toc)
+
+
+def track_article_issue(sender, instance, **kwargs):
+    """
+    Guarda o fascículo com que o artigo foi carregado; load_article, por
+    exemplo, associa o fascículo depois de criar o artigo
+    """
+    instance._loaded_issue_id = instance.__dict__.get("issue_id")
+
+
+def invalidate_issue_articlemeta_format(sender, instance, created=None, **kwargs):
+    """
+    Invalida o documento ArticleMeta materializado do fascículo relacionado
+    a instance (um dos objetos filhos de Issue ou um artigo do fascículo)
+    """
+    if sender._meta.label == "article.Article":
+        # somente a inclusão, a remoção ou a troca de fascículo de artigos
+        # altera o fascículo; __dict__ evita consultar issue_id adiado
+        current = instance.__dict__.get("issue_id")
+        previous = getattr(instance, "_loaded_issue_id", None)
+        if created is False and previous == current:
+            return
+        issue_ids = {current, previous}
+        instance._loaded_issue_id = current
+    else:
+        issue_ids = {getattr(instance, "issue_id", None)}
+    issue_ids.discard(None)
+    if issue_ids:
+        IssueArticleMetaFormat.invalidate(parent_id__in=issue_ids)
+
+
+signals.post_init.connect(track_article_issue, sender="article.Article")
+for _sender in (IssueTitle, TableOfContents, "article.Article"):
+    signals.post_save.connect(invalidate_issue_articlemeta_format, sender=_sender)
+    signals.post_delete.connect(invalidate_issue_articlemeta_format, sender=_sender)
@@ -7,7 +7,7 @@ from config import celery_app
 from core.utils.utils import _get_user
 from collection.models import Collection
 from issue import controller
-from issue.articlemeta.loader import harvest_issue_identifiers, harvest_and_load_issue
+from issue.articlemeta.loader import harvest_issue_identifiers, harvest_and_load_issue, harvest_and_load_issues
 from issue.articlemeta.loader import create_issue_from_am_issue, load_issue_sections, load_issue_titles, load_bibliographic_strips, get_issue_data_from_am_issue
 from issue.models import AMIssue
 from tracker.models import UnexpectedEvent
@@ -28,6 +28,7 @@ def load_issue_from_articlemeta(
     until_date=None,
     force_update=None,
     timeout=30,
+    batch_size=100,
 ):
     """
     Carrega issues do ArticleMeta para collections específicas.
@@ -40,6 +41,7 @@ def load_issue_from_articlemeta(
         until_date: Data final (YYYY-MM-DD)
         force_update: Forçar atualização de registros existentes
         timeout: Timeout para requisições HTTP
+        batch_size: Quantidade de identificadores por task de carga
     """
     try:
         user = _get_user(request=self.request, user_id=user_id, username=username)
@@ -52,32 +54,20 @@ def load_issue_from_articlemeta(
                 logger.info(f"Harvesting issues for collection {acron3}")
                 
                 # Coletar identificadores de issues
+                issue_identifiers = []
                 for issue_identifier in harvest_issue_identifiers(
                     acron3, from_date, until_date, force_update, timeout
                 ):
-                    try:
-                        logger.info(f"Scheduling load for issue {issue_identifier.get('code')} in collection {acron3}")
-                        
-                        # Agendar task para carregar issue específico
-                        task_harvest_and_load_issue.delay(
-                            user_id=user.id,
-                            collection_acron=acron3,
-                            issue_identifier=issue_identifier,
-                            force_update=force_update,
-                            timeout=timeout,
-                        )
-                    except Exception as e:
-                        exc_type, exc_value, exc_traceback = sys.exc_info()
-                        UnexpectedEvent.create(
-                            exception=e,
-                            exc_traceback=exc_traceback,
-                            action="issue.tasks.load_issue_from_articlemeta.schedule_task_load_issue",
-                            detail={
-                                "collection_acron": acron3,
-                                "issue_identifier": issue_identifier,
-                                "force_update": force_update,
-                            }
+                    issue_identifiers.append(issue_identifier)
+                    if len(issue_identifiers) == batch_size:
+                        _schedule_task_harvest_and_load_issues(
+                            user, acron3, issue_identifiers, force_update, timeout
                         )
+                        issue_identifiers = []
+                if issue_identifiers:
+                    _schedule_task_harvest_and_load_issues(
+                        user, acron3, issue_identifiers, force_update, timeout
+                    )
             except Exception as e:
                 exc_type, exc_value, exc_traceback = sys.exc_info()
                 UnexpectedEvent.create(
@@ -107,6 +97,88 @@ def load_issue_from_articlemeta(
         )
 
 
+def _schedule_task_harvest_and_load_issues(
+    user, collection_acron, issue_identifiers, force_update, timeout
+):
+    try:
+        logger.info(
+            f"Scheduling load for {len(issue_identifiers)} issues in collection {collection_acron}"
+        )
+        task_harvest_and_load_issues.delay(
+            user_id=user.id,
+            collection_acron=collection_acron,
+            issue_identifiers=issue_identifiers,
+            force_update=force_update,
+            timeout=timeout,
+        )
+    except Exception as e:
+        exc_type, exc_value, exc_traceback = sys.exc_info()
+        UnexpectedEvent.create(
+            exception=e,
+            exc_traceback=exc_traceback,
+            action="issue.tasks.load_issue_from_articlemeta.schedule_task_load_issues",
+            detail={
+                "collection_acron": collection_acron,
+                "issue_identifiers": issue_identifiers,
+                "force_update": force_update,
+            }
+        )
+
+
+@celery_app.task(bind=True)
+def task_harvest_and_load_issues(
+    self,
+    user_id=None,
+    username=None,
+    collection_acron=None,
+    issue_identifiers=None,
+    force_update=None,
+    timeout=30,
+):
+    """
+    Carrega em lote uma página de issues do ArticleMeta.
+
+    Args:
+        user_id: ID do usuário
+        username: Nome do usuário
+        collection_acron: Acrônimo da collection
+        issue_identifiers: Lista de identificadores (url, code, processing_date)
+        force_update: Forçar atualização de registros existentes
+        timeout: Timeout para requisições HTTP
+    """
+    try:
+        user = _get_user(request=self.request, user_id=user_id, username=username)
+
+        if not issue_identifiers:
+            raise ValueError("issue_identifiers is required")
+        if not collection_acron:
+            raise ValueError("collection_acron is required")
+
+        issues = harvest_and_load_issues(
+            user=user,
+            collection_acron=collection_acron,
+            issue_identifiers=issue_identifiers,
+            force_update=force_update,
+            timeout=timeout,
+        )
+        logger.info(f"Successfully loaded {len(issues)} issues")
+        return [issue.id for issue in issues]
+
+    except Exception as e:
+        exc_type, exc_value, exc_traceback = sys.exc_info()
+        UnexpectedEvent.create(
+            exception=e,
+            exc_traceback=exc_traceback,
+            action="issue.tasks.task_harvest_and_load_issues",
+            detail={
+                "collection_acron": collection_acron,
+                "issue_identifiers": issue_identifiers,
+                "force_update": force_update,
+            }
+        )
+        raise
+
+
 @celery_app.task(bind=True)
 def task_harvest_and_load_issue(
     self,
@@ -437,7 +509,7 @@ def task_update_issues_from_amissue(
                 filters["data__isnull"] = True
 
         # Obter queryset de AMIssue
-        am_issues = AMIssue.objects.filter(**filters)
+        am_issues = AMIssue.objects.with_payload().filter(**filters)
         
         if not am_issues.exists():
             result = {
@@ -1,4 +1,5 @@
 import json
+from unittest.mock import patch
 
 from django.test import TestCase
 
@@ -8,8 +9,15 @@ from core.models import Gender, Language, License
 from core.users.models import User
 from core.utils.rename_dictionary_keys import rename_issue_dictionary_keys
 from editorialboard.models import RoleModel
-from issue.formats.articlemeta_format import get_articlemeta_format_issue
-from issue.models import Issue
+from issue.articlemeta.loader import (
+    _bulk_get_or_create_issues,
+    harvest_and_load_issues,
+)
+from issue.formats.articlemeta_format import (
+    get_articlemeta_format_issue,
+    get_articlemeta_format_issues,
+)
+from issue.models import AMIssue, Issue, IssueArticleMetaFormat, IssueTitle
 from issue.articlemeta.correspondencia import correspondencia_issue
 from issue.articlemeta.issue_utils import get_or_create_issue
 from journal.models import (
@@ -17,6 +25,7 @@ from journal.models import (
     DigitalPreservationAgency,
     IndexedAt,
     Journal,
+    JournalArticleMetaFormat,
     Standard,
     Subject,
     WebOfKnowledge,
@@ -153,4 +162,174 @@ class TestAPIIssueArticleMeta(TestCase):
             with self.subTest(key=key):
                 expected = self.issue_json['title'].get(key)
                 result = formatter['title'].get(key)
-                self.get_articlemeta_format_issue(key, expected, result)
\ No newline at end of file
+                self.get_articlemeta_format_issue(key, expected, result)
+
+    def test_articlemeta_format_is_stored(self):
+        issue = Issue.objects.first()
+        expected = get_articlemeta_format_issue(issue, collection="scl")
+        result = issue.articlemeta_format("scl")
+        self.assertEqual(
+            json.loads(json.dumps(expected)), json.loads(json.dumps(result))
+        )
+        stored = IssueArticleMetaFormat.objects.get(parent=issue)
+        self.assertEqual(stored.collection.acron3, "scl")
+        self.assertEqual(
+            JournalArticleMetaFormat.objects.filter(parent=issue.journal).count(), 1
+        )
+
+        # sem mudanças, o documento não é regerado
+        issue.articlemeta_format("scl")
+        self.assertEqual(
+            IssueArticleMetaFormat.objects.get(parent=issue).updated, stored.updated
+        )
+
+    def test_articlemeta_format_is_invalidated_by_child_change(self):
+        issue = Issue.objects.first()
+        issue.articlemeta_format("scl")
+        IssueTitle.objects.create(issue=issue, title="Novo título")
+        self.assertFalse(IssueArticleMetaFormat.objects.filter(parent=issue).exists())
+        titles = issue.articlemeta_format("scl")["issue"]["v33"]
+        self.assertIn("Novo título", [item["_"] for item in titles])
+
+    @patch("issue.articlemeta.loader.harvest_issue_data")
+    def test_harvest_and_load_issues(self, mock_harvest_issue_data):
+        mock_harvest_issue_data.return_value = {
+            "data": self.issue_json,
+            "status": "pending",
+        }
+        identifiers = [
+            {
+                "code": self.issue_json["code"],
+                "url": "https://articlemeta.scielo.org/api/v1/issue/?code=0034-891020181001",
+                "processing_date": "2024-01-01",
+            }
+        ]
+        issues = harvest_and_load_issues(self.user, "scl", identifiers, force_update=False)
+
+        self.assertEqual(len(issues), 1)
+        am_issue = AMIssue.objects.get(pid=self.issue_json["code"])
+        self.assertEqual(am_issue.new_record, issues[0])
+        self.assertEqual(am_issue.status, "completed")
+        self.assertEqual(issues[0].journal, Journal.objects.first())
+
+        # mesmo processing_date: nada a carregar
+        self.assertEqual(
+            harvest_and_load_issues(self.user, "scl", identifiers, force_update=False),
+            [],
+        )
+
+    def test_bulk_issue_lookup_matches_issue_get(self):
+        issue = Issue.objects.first()
+        # campos None não restringem a busca, como em Issue.get
+        data = {
+            "journal": issue.journal,
+            "year": issue.year,
+            "volume": issue.volume,
+            "number": None,
+            "supplement": None,
+        }
+        total = Issue.objects.count()
+        self.assertEqual(
+            [Issue.get(issue.journal, issue.year, issue.volume)] * 2,
+            _bulk_get_or_create_issues(self.user, [data, dict(data)]),
+        )
+        self.assertEqual(total, Issue.objects.count())
+
+    def test_articlemeta_format_batch_matches_single(self):
+        expected = {
+            issue.id: get_articlemeta_format_issue(issue, collection="scl")
+            for issue in Issue.objects.all()
+        }
+        for issue, result in get_articlemeta_format_issues(
+            Issue.objects.all(), collection="scl"
+        ):
+            with self.subTest(issue=issue.id):
+                self.assertEqual(expected[issue.id], result)
+
+    def test_articlemeta_format_is_invalidated_when_article_changes_issue(self):
+        issue = Issue.objects.first()
+        article = Article.objects.create(pid_v2="S0034-891020180003", creator=self.user)
+        issue.articlemeta_format("scl")
+
+        # load_article associa o fascículo a um artigo já existente
+        article = Article.objects.get(pk=article.pk)
+        article.issue = issue
+        article.save()
+        self.assertFalse(IssueArticleMetaFormat.objects.filter(parent=issue).exists())
+
+        issue.articlemeta_format("scl")
+        article.save()
+        self.assertTrue(IssueArticleMetaFormat.objects.filter(parent=issue).exists())
+
+        article.issue = None
+        article.save()
+        self.assertFalse(IssueArticleMetaFormat.objects.filter(parent=issue).exists())
+
+
+class AMIssueBulkUpsertTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username="teste", password="teste")
+        self.collection = Collection.objects.create(
+            acron3="scl",
+            code="scl",
+            is_active=True,
+            domain="www.scielo.br",
+        )
+
+    def _records(self, processing_date, data=None):
+        return [
+            {
+                "pid": f"0034-89102018000{i}",
+                "collection": self.collection,
+                "url": f"https://articlemeta.scielo.org/api/v1/issue/?code={i}",
+                "processing_date": processing_date,
+                "data": data,
+            }
+            for i in range(3)
+        ]
+
+    def test_bulk_upsert_creates_records(self):
+        AMIssue.bulk_upsert(self._records("2024-01-01"), self.user)
+        self.assertEqual(AMIssue.objects.count(), 3)
+        self.assertEqual(
+            set(AMIssue.objects.values_list("status", flat=True)), {"todo"}
+        )
+
+    def test_bulk_upsert_skips_same_processing_date(self):
+        AMIssue.bulk_upsert(self._records("2024-01-01", {"v": 1}), self.user)
+        AMIssue.bulk_upsert(self._records("2024-01-01", {"v": 2}), self.user)
+        self.assertEqual(
+            [item.data for item in AMIssue.objects.all()], [{"v": 1}] * 3
+        )
+
+        AMIssue.bulk_upsert(
+            self._records("2024-01-01", {"v": 2}), self.user, force_update=True
+        )
+        self.assertEqual(
+            [item.data for item in AMIssue.objects.all()], [{"v": 2}] * 3
+        )
+
+    def test_bulk_upsert_keeps_fields_not_informed(self):
+        AMIssue.bulk_upsert(self._records("2024-01-01", {"v": 1}), self.user)
+        AMIssue.bulk_upsert(self._records("2024-02-01"), self.user)
+        self.assertEqual(AMIssue.objects.count(), 3)
+        for item in AMIssue.objects.all():
+            self.assertEqual(item.data, {"v": 1})
+            self.assertEqual(item.processing_date, "2024-02-01")
+
+    def test_delete_orphans(self):
+        AMIssue.objects.create(
+            pid="0034-891020180009", collection=self.collection, creator=self.user
+        )
+        AMIssue.bulk_upsert(self._records("2024-01-01"), self.user)
+        self.assertEqual(AMIssue.delete_orphans(), 1)
+        self.assertEqual(AMIssue.objects.count(), 3)
+
+    def test_data_is_deferred(self):
+        AMIssue.bulk_upsert(self._records("2024-01-01", {"v": 1}), self.user)
+        item = AMIssue.objects.first()
+        self.assertIn("data", item.get_deferred_fields())
+        self.assertEqual(item.data, {"v": 1})
+        self.assertEqual(
+            AMIssue.objects.with_payload().first().get_deferred_fields(), set()
+        )
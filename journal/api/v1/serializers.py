@@ -232,11 +232,9 @@ class JournalSerializer(serializers.ModelSerializer):
         return scielo_journal.journal_acron if scielo_journal else None
 
     def get_scielo_journal(self, obj):
-        results = models.SciELOJournal.objects.filter(journal=obj).prefetch_related(
-            "journal_history"
-        )
+        # usa o relacionamento para aproveitar o prefetch feito pelas views
         journals = []
-        for item in results:
+        for item in obj.scielojournal_set.all():
             journal_dict = {
                 "collection_acron": item.collection.acron3 if item.collection else None,
                 "issn_scielo": item.issn_scielo,
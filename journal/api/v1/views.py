@@ -21,6 +21,12 @@ class GenericJournalViewSet(viewsets.ModelViewSet):
     serializer_class = JournalSerializer
     http_method_names = ["get"]
     queryset = models.Journal.objects.prefetch_related(
+        Prefetch(
+            "scielojournal_set",
+            queryset=models.SciELOJournal.objects.select_related(
+                "collection"
+            ).prefetch_related("journal_history"),
+        ),
         Prefetch(
             "crossmark_policy",
             queryset=models.CrossmarkPolicy.objects
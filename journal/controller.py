@@ -49,17 +49,6 @@ def export_journal_to_articlemeta(
                 col = legacy_keys.get("collection")
                 pid = legacy_keys.get("pid")
                 logging.info(legacy_keys)
-                events.append("check articlemeta exportation demand")
-                logging.info(
-                    (user, journal, "articlemeta", pid, col, version, force_update)
-                )
-                exporter = JournalExporter.get_demand(
-                    user, journal, "articlemeta", pid, col, version, force_update
-                )
-                if not exporter:
-                    # não encontrou necessidade de exportar
-                    continue
-
                 events.append("building articlemeta format for journal")
                 journal_data = journal.articlemeta_format(col.acron3)
                 response = str(journal_data)
@@ -71,6 +60,25 @@ def export_journal_to_articlemeta(
                     response = str(journal_data)
                     raise e
 
+                events.append("check articlemeta exportation demand")
+                logging.info(
+                    (user, journal, "articlemeta", pid, col, version, force_update)
+                )
+                content_hash = JournalExporter.generate_content_hash(journal_data)
+                exporter = JournalExporter.get_demand(
+                    user,
+                    journal,
+                    "articlemeta",
+                    pid,
+                    col,
+                    version,
+                    force_update,
+                    content_hash=content_hash,
+                )
+                if not exporter:
+                    # conteúdo não mudou desde a última exportação
+                    continue
+
                 events.append("writing journal to articlemeta database")
                 response = write_item("journals", journal_data)
 
@@ -81,6 +89,7 @@ def export_journal_to_articlemeta(
                     response=response,
                     errors=None,
                     exceptions=None,
+                    content_hash=content_hash,
                 )
             except Exception as e:
                 exc_type, exc_value, exc_traceback = sys.exc_info()
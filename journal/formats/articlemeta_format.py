@@ -1,8 +1,67 @@
 from collections import defaultdict
-from functools import lru_cache
+from functools import cached_property
+
+from django.db.models import Prefetch, prefetch_related_objects
 
 from core.utils.articlemeta_dict_utils import add_items, add_to_result
-from journal.models import SciELOJournal, TitleInDatabase
+from journal.models import Mission, SciELOJournal, TitleInDatabase
+
+
+# Relacionamentos carregados uma única vez para um lote de periódicos.
+# Os atributos "prefetched_*" são usados pelos atributos preguiçosos do
+# formatador no lugar das consultas individuais.
+JOURNAL_BATCH_SELECT_RELATED = (
+    "official__new_title",
+    "vocabulary",
+    "journal_use_license",
+    "standard",
+)
+
+JOURNAL_BATCH_PREFETCH_RELATED = (
+    Prefetch(
+        "scielojournal_set",
+        queryset=SciELOJournal.objects.select_related(
+            "collection", "journal"
+        ).prefetch_related("journal_history"),
+        to_attr="prefetched_scielo_journals",
+    ),
+    Prefetch(
+        "title_in_database",
+        queryset=TitleInDatabase.objects.select_related("indexed_at"),
+        to_attr="prefetched_titles_in_database",
+    ),
+    Prefetch(
+        "mission",
+        queryset=Mission.objects.select_related("language"),
+        to_attr="prefetched_missions",
+    ),
+    "journal_email",
+    "text_language",
+    "abstract_language",
+    "notes",
+    "other_titles",
+    "official__old_title",
+    "indexed_at",
+    "additional_indexed_at",
+    "wos_db",
+    "wos_area",
+    "subject_descriptor",
+    "subject",
+    "owner_history",
+    "copyright_holder_history",
+    "sponsor_history",
+    "publisher_history",
+)
+
+
+def select_scielo_journal(scielo_journals, collection):
+    """Seleciona, entre os SciELOJournal carregados, o da coleção"""
+    for scielo_journal in scielo_journals:
+        if not collection or (
+            scielo_journal.collection and scielo_journal.collection.acron3 == collection
+        ):
+            return scielo_journal
+    return None
 
 
 class ArticlemetaJournalFormatter:
@@ -12,30 +71,40 @@ class ArticlemetaJournalFormatter:
         self.obj = obj
         self.collection = collection
         self.result = defaultdict(list)
-        self._scielo_journal = None
-        self._medline_titles = None
         self.official = getattr(self.obj, 'official', None)
 
-    @property
+    @cached_property
     def scielo_journal(self):
-        if self._scielo_journal is not None:
-            return self._scielo_journal
+        prefetched = getattr(self.obj, "prefetched_scielo_journals", None)
+        if prefetched is not None:
+            return select_scielo_journal(prefetched, self.collection)
 
         qs = SciELOJournal.objects.select_related('collection', 'journal').filter(journal=self.obj)
         if self.collection:
             qs = qs.filter(collection__acron3=self.collection)
+        return qs.first()
 
-        self._scielo_journal = qs.first()
-        return self._scielo_journal
-
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def titles_in_database_medline_secs(self):
-        titles_in_db = TitleInDatabase.objects.filter(
+        prefetched = getattr(self.obj, "prefetched_titles_in_database", None)
+        if prefetched is not None:
+            return [
+                t for t in prefetched
+                if t.indexed_at and t.indexed_at.acronym in ("medline", "secs")
+            ]
+        return list(
+            TitleInDatabase.objects.filter(
                 journal=self.obj,
                 indexed_at__acronym__in=["medline", "secs"]
             ).select_related("indexed_at")
-        return titles_in_db
+        )
+
+    @cached_property
+    def missions(self):
+        prefetched = getattr(self.obj, "prefetched_missions", None)
+        if prefetched is not None:
+            return prefetched
+        return list(self.obj.mission.select_related('language'))
 
     def format(self):
         """Formata todos os dados do journal"""
@@ -278,11 +347,8 @@ class ArticlemetaJournalFormatter:
         add_items("v441", [subject.code for subject in self.obj.subject.all()], self.result)
 
     def _format_mission_info(self):
-        if not hasattr(self.obj, 'mission') or not self.obj.mission.exists():
-            return
-            
         missions_data = []
-        for mission in self.obj.mission.select_related('language'):
+        for mission in self.missions:
             if mission.language and mission.get_text_pure:
                 missions_data.append({
                     "l": mission.language.code2,
@@ -328,4 +394,32 @@ class ArticlemetaJournalFormatter:
 
 def get_articlemeta_format_title(obj, collection):
     formatter = ArticlemetaJournalFormatter(obj, collection)
-    return formatter.format()
\ No newline at end of file
+    return formatter.format()
+
+
+def prefetch_journals_for_articlemeta_format(journals):
+    """
+    Carrega, com uma consulta por relacionamento para todo o lote, os dados
+    usados por ArticlemetaJournalFormatter.
+
+    journals: lista de Journal (ou queryset)
+    """
+    journals = list(journals)
+    prefetch_related_objects(journals, *JOURNAL_BATCH_PREFETCH_RELATED)
+    return journals
+
+
+def get_articlemeta_format_titles(journals, collection):
+    """
+    Formata um lote de periódicos no formato ArticleMeta
+
+    journals: queryset ou lista de Journal
+    Retorna lista de tuplas (journal, dados formatados)
+    """
+    if hasattr(journals, "select_related"):
+        journals = journals.select_related(*JOURNAL_BATCH_SELECT_RELATED)
+    journals = prefetch_journals_for_articlemeta_format(journals)
+    return [
+        (journal, ArticlemetaJournalFormatter(journal, collection).format())
+        for journal in journals
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:40
+
+from django.db import migrations
+
+# colunas JSON volumosas, lidas sob demanda (DeferredPayloadManager)
+PAYLOAD_COLUMNS = [
+    ("journal_amjournal", "data"),
+    ("journal_journalexporter", "detail"),
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("journal", "0062_amjournal_unique_amjournal_pid_collection"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4"
+                for table, column in PAYLOAD_COLUMNS
+            ],
+            reverse_sql=[
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION pglz"
+                for table, column in PAYLOAD_COLUMNS
+            ],
+        ),
+    ]
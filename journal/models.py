@@ -7,6 +7,7 @@ from datetime import datetime
 from django.contrib.auth import get_user_model
 from django.core.validators import RegexValidator
 from django.db import IntegrityError, models
+from django.db.models import signals
 from django.db.models import Prefetch, Q
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
@@ -22,6 +23,7 @@ from collection.models import Collection
 from core.choices import MONTHS, LICENSE_TYPES
 from core.forms import CoreAdminModelForm
 from core.models import (
+    BaseArticleMetaFormat,
     BaseExporter,
     BaseLegacyRecord,
     CommonControlField,
@@ -35,7 +37,8 @@ from core.models import (
     RawOrganizationMixin,
 )
 from core.utils import date_utils
-from core.utils.thread_context import get_current_collections, get_current_user
+from core.utils.bulk_loader import bulk_load, read_csv
+from core.utils.thread_context import get_current_collections, get_current_user, memoize
 from institution.models import (
     BaseHistoryItem,
     CopyrightHolder,
@@ -935,7 +938,25 @@ class Journal(CommonControlField, ClusterableModel):
         # Evita importacao circular
         from .formats.articlemeta_format import get_articlemeta_format_title
 
-        return get_articlemeta_format_title(self, collection)
+        if not collection:
+            return get_articlemeta_format_title(self, collection)
+        return self.stored_articlemeta_format(collection).data
+
+    def stored_articlemeta_format(self, collection):
+        """
+        Retorna o registro JournalArticleMetaFormat da coleção,
+        regerando o documento somente se o periódico mudou
+        """
+        from .formats.articlemeta_format import get_articlemeta_format_title
+
+        return JournalArticleMetaFormat.get_or_build(
+            parent=self,
+            collection_acron3=collection,
+            source_hash=JournalArticleMetaFormat.generate_source_hash(
+                self.pk, self.updated.isoformat(), collection
+            ),
+            build=lambda: get_articlemeta_format_title(self, collection),
+        )
 
     @classmethod
     def select_items(
@@ -1092,18 +1113,22 @@ class Journal(CommonControlField, ClusterableModel):
         created_institution = None
         if original_data:
             # Cria/busca a Institution baseado nos dados originais
-            created_institution = institution_class.get_or_create(
-                name=original_data,
-                acronym=None,
-                level_1=None,
-                level_2=None,
-                level_3=None,
-                user=user,
-                location=location,
-                official=None,
-                is_official=None,
-                url=None,
-                institution_type=None,
+            created_institution = memoize(
+                ("institution", institution_class.__name__),
+                (original_data, location and location.pk),
+                lambda: institution_class.get_or_create(
+                    name=original_data,
+                    acronym=None,
+                    level_1=None,
+                    level_2=None,
+                    level_3=None,
+                    user=user,
+                    location=location,
+                    official=None,
+                    is_official=None,
+                    url=None,
+                    institution_type=None,
+                ),
             )
 
         # Cria/busca o InstitutionHistory
@@ -2471,12 +2496,16 @@ class Subject(CommonControlField):
     @classmethod
     def load(cls, user):
         if not cls.objects.exists():
-            for item in choices.STUDY_AREA:
-                code, _ = item
-                cls.create_or_update(
-                    code=code,
-                    user=user,
-                )
+            bulk_load(
+                cls,
+                (
+                    {"code": code, "value": str(value)}
+                    for code, value in choices.STUDY_AREA
+                ),
+                user,
+                key_fields=["code"],
+                update_fields=["value"],
+            )
 
     @classmethod
     def get(cls, code):
@@ -2566,12 +2595,13 @@ class WebOfKnowledgeSubjectCategory(CommonControlField):
     def load(cls, user):
         if not cls.objects.exists():
             with open("./journal/fixture/subjects_categories_wok.csv", "r") as fp:
-                wos_area = fp.readlines()
-            for value in wos_area:
-                try:
-                    cls.get_or_create(value=value.strip(), user=user)
-                except Exception as e:
-                    logging.exception(e)
+                values = (value.strip() for value in fp)
+                bulk_load(
+                    cls,
+                    ({"value": value} for value in values if value),
+                    user,
+                    key_fields=["value"],
+                )
 
     @classmethod
     def get_or_create(cls, value, user):
@@ -2666,22 +2696,29 @@ class IndexedAt(CommonControlField):
 
     @classmethod
     def load(cls, user):
-        with open("./journal/fixture/index_at.csv", "r") as csvfile:
-            indexed_at = csv.DictReader(
-                csvfile,
-                fieldnames=["name", "acronym", "url", "type", "description"],
-                delimiter=",",
-            )
-            for row in indexed_at:
-                logging.info(row)
-                cls.create_or_update(
-                    name=row["name"],
-                    acronym=row["acronym"],
-                    url=row["url"],
-                    type=row["type"],
-                    description=row["description"],
-                    user=user,
-                )
+        types = dict(choices.TYPE)
+        rows = read_csv(
+            "./journal/fixture/index_at.csv",
+            fieldnames=["name", "acronym", "url", "type", "description"],
+            delimiter=",",
+            skip_header=True,
+        )
+        bulk_load(
+            cls,
+            (
+                {
+                    "name": row["name"],
+                    "acronym": row["acronym"],
+                    "url": row["url"],
+                    "type": row["type"] if row["type"] in types else None,
+                    "description": row["description"],
+                }
+                for row in rows
+            ),
+            user,
+            key_fields=["name"],
+            update_fields=["url", "type", "description"],
+        )
 
     @classmethod
     def get(
@@ -3456,6 +3493,22 @@ class JournalExporter(BaseExporter):
     )
 
 
+class JournalArticleMetaFormat(BaseArticleMetaFormat):
+    """
+    Documento do periódico no formato ArticleMeta materializado por coleção
+    """
+
+    parent = ParentalKey(
+        Journal,
+        on_delete=models.CASCADE,
+        related_name="articlemeta_format_set",
+        verbose_name=_("Journal"),
+    )
+
+    class Meta:
+        unique_together = [("parent", "collection")]
+
+
 class AMJournal(BaseLegacyRecord):
     """
     Modelo que representa a coleta de dados de Journal na API Article Meta.
@@ -3470,3 +3523,74 @@ class AMJournal(BaseLegacyRecord):
         blank=True,
         null=True,
     )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["pid", "collection"],
+                name="unique_amjournal_pid_collection",
+            ),
+        ]
+
+
+def invalidate_journal_articlemeta_format(sender, instance, **kwargs):
+    """
+    Invalida o documento ArticleMeta materializado do periódico relacionado
+    a instance (um dos objetos filhos de Journal)
+    """
+    action = kwargs.get("action")
+    if action:
+        # m2m_changed
+        if not action.startswith("post_"):
+            return
+        if kwargs.get("reverse"):
+            if not kwargs.get("pk_set"):
+                return
+            filters = {"parent_id__in": kwargs["pk_set"]}
+        else:
+            filters = {"parent": instance}
+    elif isinstance(instance, OfficialJournal):
+        filters = {"parent__official": instance}
+    elif isinstance(instance, JournalParallelTitle):
+        filters = {"parent__official_id": instance.official_journal_id}
+    elif isinstance(instance, JournalHistory):
+        filters = {"parent__scielojournal__journal_history": instance}
+    elif getattr(instance, "journal_id", None):
+        filters = {"parent_id": instance.journal_id}
+    else:
+        return
+    JournalArticleMetaFormat.invalidate(**filters)
+
+
+for _sender in (
+    OfficialJournal,
+    JournalParallelTitle,
+    SciELOJournal,
+    JournalHistory,
+    TitleInDatabase,
+    Mission,
+    OwnerHistory,
+    PublisherHistory,
+    SponsorHistory,
+    CopyrightHolderHistory,
+    JournalEmail,
+    JournalOtherTitle,
+    Annotation,
+):
+    signals.post_save.connect(invalidate_journal_articlemeta_format, sender=_sender)
+    signals.pre_delete.connect(invalidate_journal_articlemeta_format, sender=_sender)
+
+for _field in (
+    "subject_descriptor",
+    "subject",
+    "wos_db",
+    "wos_area",
+    "text_language",
+    "abstract_language",
+    "indexed_at",
+    "additional_indexed_at",
+):
+    signals.m2m_changed.connect(
+        invalidate_journal_articlemeta_format,
+        sender=getattr(Journal, _field).through,
+    )
@@ -11,6 +11,7 @@ from wagtail.images.models import Image
 
 from collection.exceptions import MainCollectionNotFoundError
 from core.models import Language
+from core.utils.thread_context import memoize
 from journal.models import (
     Annotation,
     Collection,
@@ -525,11 +526,19 @@ def get_or_create_mission(mission, journal, user):
             obj, created = Mission.objects.get_or_create(
                 journal=journal,
                 rich_text=m.get("mission"),
-                language=Language.get_or_create(code2=m.get("lang")),
+                language=get_or_create_language(m.get("lang")),
                 creator=user,
             )
 
 
+def get_or_create_language(code2, user=None):
+    return memoize(
+        "language",
+        code2,
+        lambda: Language.get_or_create(code2=code2, creator=user),
+    )
+
+
 def get_or_create_sponsor(sponsor, journal, user, location=None):
     """
     Ex sponsor:
@@ -578,9 +587,13 @@ def get_or_create_subject_descriptor(subject_descriptors, journal, user):
                 for word in re.split(",|;", s):
                     word = word.strip()
                     try:
-                        obj = SubjectDescriptor.get_or_create(
-                            value=word,
-                            user=user,
+                        obj = memoize(
+                            "subject_descriptor",
+                            word,
+                            lambda: SubjectDescriptor.get_or_create(
+                                value=word,
+                                user=user,
+                            ),
                         )
                         if obj:
                             data.append(obj)
@@ -606,9 +619,7 @@ def create_or_update_subject(subject, journal, user):
         if isinstance(sub, str):
             sub = [sub]
         for s in sub:
-            obj = Subject.get(
-                code=s,
-            )
+            obj = memoize("subject", s, lambda: Subject.get(code=s))
             data.append(obj)
         for subject in data:
             journal.subject.add(subject)
@@ -621,7 +632,7 @@ def create_or_update_journal_languages(language_data, journal, language_type, us
         if isinstance(langs, str):
             langs = [langs]
         for l in langs:
-            obj = Language.get_or_create(code2=l, creator=user)
+            obj = get_or_create_language(l, user)
             if obj:
                 data.append(obj)
 
@@ -634,14 +645,14 @@ def create_or_update_journal_languages(language_data, journal, language_type, us
 def get_or_create_vocabulary(vocabulary, journal, user):
     if vocabulary:
         v = extract_value(vocabulary)
-        obj = Vocabulary.get(acronym=v)
+        obj = memoize("vocabulary", v, lambda: Vocabulary.get(acronym=v))
         journal.vocabulary = obj
 
 
 def create_or_update_standard(standard, journal, user):
     if standard:
         standard = extract_value(standard)
-        journal.standard = Standard.get(standard)
+        journal.standard = memoize("standard", standard, lambda: Standard.get(standard))
 
 
 def create_or_update_wos_db(journal, wos_scie, wos_ssci, wos_ahci, user):
@@ -656,9 +667,13 @@ def create_or_update_wos_db(journal, wos_scie, wos_ssci, wos_ahci, user):
     for db in (wos_scie, wos_ssci, wos_ahci):
         wosdb = extract_value(db)
         if wosdb:
-            obj = WebOfKnowledge.create_or_update(
-                code=wosdb,
-                user=user,
+            obj = memoize(
+                "wos_db",
+                wosdb,
+                lambda: WebOfKnowledge.create_or_update(
+                    code=wosdb,
+                    user=user,
+                ),
             )
             data.append(obj)
     for wos in data:
@@ -679,8 +694,12 @@ def get_or_update_wos_areas(journal, wos_areas, user):
             areas = [areas]
         for value in areas:
             try:
-                obj = WebOfKnowledgeSubjectCategory.objects.get(
-                    value__iexact=value,
+                obj = memoize(
+                    "wos_area",
+                    value,
+                    lambda: WebOfKnowledgeSubjectCategory.objects.get(
+                        value__iexact=value,
+                    ),
                 )
                 data.append(obj)
             except WebOfKnowledgeSubjectCategory.DoesNotExist as e:
@@ -710,15 +729,23 @@ def get_or_create_indexed_at(journal, indexed_at, user):
             indexed = [indexed]
         for i in indexed:
             try:
-                obj_index = IndexedAt.objects.get(
-                    Q(name__iexact=i) | Q(acronym__iexact=i)
+                obj_index = memoize(
+                    "indexed_at",
+                    i,
+                    lambda: IndexedAt.objects.get(
+                        Q(name__iexact=i) | Q(acronym__iexact=i)
+                    ),
                 )
                 data_index.append(obj_index)
             except IndexedAt.DoesNotExist:
                 try:
-                    obj_additional_index = AdditionalIndexedAt.get_or_create(
-                        name=i,
-                        user=user,
+                    obj_additional_index = memoize(
+                        "additional_indexed_at",
+                        i,
+                        lambda: AdditionalIndexedAt.get_or_create(
+                            name=i,
+                            user=user,
+                        ),
                     )
                 except Exception as e:
                     # Nao registra error caso valor de i seja None
@@ -751,11 +778,15 @@ def create_or_update_location(
     state = standardize_location(extract_value(publisher_state), State, user=user)
 
     try:
-        location = Location.create_or_update(
-            user=user,
-            country=country,
-            state=state,
-            city=city,
+        location = memoize(
+            "location",
+            (country and country.pk, state and state.pk, city and city.pk),
+            lambda: Location.create_or_update(
+                user=user,
+                country=country,
+                state=state,
+                city=city,
+            ),
         )
     except Exception as e:
         location = None
@@ -782,6 +813,14 @@ def create_or_update_location(
 
 
 def standardize_location(value_location, ObjectLocation, user):
+    return memoize(
+        ("standardize_location", ObjectLocation.__name__),
+        str(value_location),
+        lambda: _standardize_location(value_location, ObjectLocation, user),
+    )
+
+
+def _standardize_location(value_location, ObjectLocation, user):
     standardized_value = None
     for item in ObjectLocation.standardize(value_location, user):
         standardized_value = next(iter(item.values()))
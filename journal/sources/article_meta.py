@@ -1,8 +1,10 @@
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from collection.models import Collection
 from core.utils.rename_dictionary_keys import rename_dictionary_keys
+from core.utils.thread_context import run_memo
 from core.utils.utils import fetch_data
 from journal.models import AMJournal
 from journal.sources import am_to_core
@@ -30,30 +32,69 @@ def _get_collection_journals(offset=None, limit=None, collection=None, verify=Tr
     return data
 
 
-def _fetch_and_store_journal(collection, issn, obj_collection, user, verify=True):
+def _fetch_journal(collection, issn, verify=True):
     url_journal = f"https://articlemeta.scielo.org/api/v1/journal/?collection={collection}&issn={issn}"
-    data_journal = fetch_data(url_journal, json=True, timeout=30, verify=verify)
-    AMJournal.create_or_update(
-        pid=issn,
-        collection=obj_collection,
-        data=data_journal,
-        user=user,
-    )
+    return fetch_data(url_journal, json=True, timeout=30, verify=verify)
+
+
+def _fetch_and_store_journals(
+    collection, issn_list, obj_collection, user, verify=True, max_workers=8
+):
+    """
+    Obtém os JSON dos periódicos de forma concorrente (threads para HTTP)
+    e grava os AMJournal na thread atual, à medida que são obtidos
+    (um único escritor no banco de dados)
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch_journal, collection, issn, verify): issn
+            for issn in issn_list
+        }
+        for future in as_completed(futures):
+            issn = futures[future]
+            try:
+                AMJournal.create_or_update(
+                    pid=issn,
+                    collection=obj_collection,
+                    data=future.result(),
+                    user=user,
+                )
+            except Exception as e:
+                exc_type, exc_value, exc_traceback = sys.exc_info()
+                UnexpectedEvent.create(
+                    exception=e,
+                    exc_traceback=exc_traceback,
+                    detail={
+                        "function": "journal.sources.article_meta._fetch_and_store_journals",
+                        "collection": collection,
+                        "issn": issn,
+                    },
+                )
 
 
-def process_journal_article_meta(collection, limit, user, journal_issn_list=None, verify=True):
+def process_journal_article_meta(
+    collection, limit, user, journal_issn_list=None, verify=True, max_workers=8
+):
     obj_collection = Collection.objects.get(acron3=collection)
     if journal_issn_list:
-        for issn in journal_issn_list:
-            _fetch_and_store_journal(collection, issn, obj_collection, user, verify=verify)
+        _fetch_and_store_journals(
+            collection, journal_issn_list, obj_collection, user,
+            verify=verify, max_workers=max_workers,
+        )
         return
 
     offset = 0
     data = _get_collection_journals(collection=collection, limit=limit, verify=verify)
     total_limit = data["meta"]["total"]
     while offset < total_limit:
-        for journal in data["objects"]:
-            _fetch_and_store_journal(collection, journal["code"], obj_collection, user, verify=verify)
+        _fetch_and_store_journals(
+            collection,
+            [journal["code"] for journal in data["objects"]],
+            obj_collection,
+            user,
+            verify=verify,
+            max_workers=max_workers,
+        )
 
         offset += limit or 10
         data = _get_collection_journals(
@@ -62,7 +103,20 @@ def process_journal_article_meta(collection, limit, user, journal_issn_list=None
 
 
 def _register_journal_data(user, collection_acron3, journal_issn_list=None):
-    journals = AMJournal.objects.filter(collection__acron3=collection_acron3)
+    """
+    Cria / atualiza Journal a partir de AMJournal
+
+    Os objetos resolvidos (localizações, instituições, assuntos, bases de
+    indexação etc) são memorizados durante a execução (run_memo)
+    """
+    with run_memo():
+        _register_journals(user, collection_acron3, journal_issn_list)
+
+
+def _register_journals(user, collection_acron3, journal_issn_list=None):
+    journals = AMJournal.objects.with_payload().filter(
+        collection__acron3=collection_acron3
+    )
     if journal_issn_list:
         journals = journals.filter(pid__in=journal_issn_list)
     for journal_am in journals:
@@ -96,6 +96,7 @@ def load_journal_from_article_meta_for_one_collection(
     load_data=None,
     journal_issn_list=None,
     verify=True,
+    max_workers=8,
 ):
     user = _get_user(self.request, username=username, user_id=user_id)
     try:
@@ -119,6 +120,7 @@ def load_journal_from_article_meta_for_one_collection(
                 user=user,
                 journal_issn_list=journal_issn_list,
                 verify=verify,
+                max_workers=max_workers,
             )
         _register_journal_data(
             user=user,
@@ -312,7 +314,7 @@ def load_license_of_use_in_journal(
     if issn_scielo:
         params["pid"] = issn_scielo
 
-    journals = AMJournal.objects.filter(**params)
+    journals = AMJournal.objects.with_payload().filter(**params)
     for journal in journals:
         if scielo_issn := journal.scielo_issn:
             if journal.data:
@@ -467,7 +469,7 @@ def task_replace_institution_by_raw_institution(
         processed_count = 0
         error_count = 0
         
-        for am_journal in AMJournal.objects.filter(**params).iterator():
+        for am_journal in AMJournal.objects.with_payload().filter(**params).iterator():
             try:
                 # Extract data from AMJournal
                 data = am_journal.data
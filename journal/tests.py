@@ -14,6 +14,7 @@ from journal.models import (
     DigitalPreservationAgency,
     IndexedAt,
     Journal,
+    JournalExporter,
     JournalLicense,
     SciELOJournal,
     Standard,
@@ -484,4 +485,43 @@ class TestClassicWebsiteGetJournalXml(TestCase):
         self.assertTrue(called_url.startswith("https://www.scielo.br/"))
 
 
+class JournalExporterContentHashTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username="teste", password="teste")
+        self.collection = Collection.objects.create(acron3="scl", code="scl")
+        self.journal = Journal.objects.create(title="Journal", creator=self.user)
+
+    def get_demand(self, content_hash, force_update=None):
+        return JournalExporter.get_demand(
+            self.user,
+            self.journal,
+            "articlemeta",
+            "0000-0000",
+            self.collection,
+            force_update=force_update,
+            content_hash=content_hash,
+        )
+
+    def test_unchanged_content_is_not_exported_again(self):
+        content_hash = JournalExporter.generate_content_hash({"v100": "Journal"})
+        exporter = self.get_demand(content_hash)
+        exporter.finish(self.user, True, events=[], content_hash=content_hash)
 
+        self.assertIsNone(self.get_demand(content_hash))
+        self.assertIsNone(self.get_demand(content_hash, force_update=True))
+
+    def test_changed_content_is_exported(self):
+        content_hash = JournalExporter.generate_content_hash({"v100": "Journal"})
+        exporter = self.get_demand(content_hash)
+        exporter.finish(self.user, True, events=[], content_hash=content_hash)
+
+        new_hash = JournalExporter.generate_content_hash({"v100": "New title"})
+        self.assertIsNotNone(self.get_demand(new_hash))
+
+    def test_failed_export_is_retried(self):
+        content_hash = JournalExporter.generate_content_hash({"v100": "Journal"})
+        exporter = self.get_demand(content_hash)
+        exporter.finish(
+            self.user, False, events=[], exceptions="error", content_hash=content_hash
+        )
+        self.assertIsNotNone(self.get_demand(content_hash))
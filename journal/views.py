@@ -7,7 +7,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.utils.translation import gettext_lazy as _
 from wagtail.admin import messages
 
-from core.libs import chkcsv
+from core.utils.csv_validator import validate_csv_file
 
 from .models import IndexedAt, IndexedAtFile
 
@@ -30,21 +30,18 @@ def validate(request):
     if request.method == "GET":
         try:
             upload_path = file_upload.attachment.file.path
-            cols = chkcsv.read_format_specs(
+            result = validate_csv_file(
+                upload_path,
                 os.path.dirname(os.path.abspath(__file__)) + "/chkcsvfmt.fmt",
-                False,
-                False,
-            )
-            errorlist = chkcsv.check_csv_file(
-                upload_path, cols, True, True, True, False
+                column_required=False,
             )
+            errorlist = result.errors
             print(errorlist)
             if errorlist:
                 raise Exception(_("Validation error"))
             else:
                 file_upload.is_valid = True
-                fp = open(upload_path)
-                file_upload.line_count = len(fp.readlines())
+                file_upload.line_count = result.line_count
                 file_upload.save()
         except Exception as ex:
             messages.error(request, _("Validation error: %s") % errorlist)
@@ -0,0 +1,197 @@
+"""
+Índice em memória (gazetteer) de City, State, Country / CountryName e Location
+
+Resolve nomes de lugares sem consultar o banco de dados. As chaves são
+normalizadas com fold_text (sem acentos, sem diferença entre maiúsculas e
+minúsculas), os países são indexados por sigla (2 e 3 letras), nome e
+todos os CountryName (multilíngue).
+
+O índice é construído na primeira consulta, atualizado após o commit das
+alterações, pelos sinais post_save / post_delete dos modelos (ver
+location.models), e recarregado
+após LOCATION_GAZETTEER_TTL segundos, para considerar alterações feitas
+por outros processos.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+
+from core.utils.standardizer import (
+    fold_text,
+    standardize_code_and_name,
+    standardize_name,
+)
+
+
+def _upper(value):
+    return value and value.strip().upper()
+
+
+def _id(obj):
+    return obj.pk if obj else None
+
+
+class Gazetteer:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._built_at = None
+        self.cities = {}
+        self.states = {}
+        self.countries_by_acronym = {}
+        self.countries_by_acron3 = {}
+        self.countries_by_name = {}
+        self.locations = {}
+
+    @property
+    def enabled(self):
+        return getattr(settings, "LOCATION_GAZETTEER_ENABLED", True)
+
+    @property
+    def is_stale(self):
+        if self._built_at is None:
+            return True
+        ttl = getattr(settings, "LOCATION_GAZETTEER_TTL", 600)
+        return time.monotonic() - self._built_at > ttl
+
+    def invalidate(self):
+        self._built_at = None
+
+    def _ensure_built(self):
+        if not self.enabled:
+            return False
+        if self.is_stale:
+            with self._lock:
+                if self.is_stale:
+                    self.build()
+        return True
+
+    def build(self):
+        from location.models import City, Country, Location, State
+
+        cities = {}
+        for city in City.objects.all().iterator():
+            cities.setdefault(fold_text(city.name), city)
+
+        states = {}
+        for state in State.objects.all().iterator():
+            states.setdefault(self._state_key(state.name, state.acronym), state)
+
+        by_acronym = {}
+        by_acron3 = {}
+        by_name = {}
+        for country in Country.objects.prefetch_related("country_name"):
+            if country.acronym:
+                by_acronym.setdefault(_upper(country.acronym), country)
+            if country.acron3:
+                by_acron3.setdefault(_upper(country.acron3), country)
+            if country.name:
+                by_name.setdefault(fold_text(country.name), country)
+            for country_name in country.country_name.all():
+                if country_name.text:
+                    by_name.setdefault(fold_text(country_name.text), country)
+
+        locations = {}
+        for location in Location.objects.all().iterator():
+            locations.setdefault(
+                (location.country_id, location.state_id, location.city_id), location
+            )
+
+        self.cities = cities
+        self.states = states
+        self.countries_by_acronym = by_acronym
+        self.countries_by_acron3 = by_acron3
+        self.countries_by_name = by_name
+        self.locations = locations
+        self._built_at = time.monotonic()
+
+    @staticmethod
+    def _state_key(name, acronym):
+        return (fold_text(name) or None, fold_text(acronym) or None)
+
+    # atualização incremental (post_save com created=True)
+    def add(self, obj):
+        from location.models import City, Location, State
+
+        if self._built_at is None:
+            return
+        with self._lock:
+            if isinstance(obj, City):
+                self.cities.setdefault(fold_text(obj.name), obj)
+            elif isinstance(obj, State):
+                self.states.setdefault(self._state_key(obj.name, obj.acronym), obj)
+            elif isinstance(obj, Location):
+                self.locations.setdefault(
+                    (obj.country_id, obj.state_id, obj.city_id), obj
+                )
+            else:
+                # Country e CountryName: chaves derivadas de vários registros
+                self.invalidate()
+
+    def get_city(self, name):
+        if not name or not self._ensure_built():
+            return None
+        return self.cities.get(fold_text(name))
+
+    def get_state(self, name=None, acronym=None):
+        """
+        Mesmo critério de State.get: o par (name, acronym) deve coincidir
+        """
+        if not (name or acronym) or not self._ensure_built():
+            return None
+        return self.states.get(self._state_key(name, acronym))
+
+    def get_country(self, name=None, acronym=None, acron3=None):
+        """
+        Mesmo critério de Country.get: sigla, sigla de 3 letras ou nome
+        (Country.name ou qualquer CountryName)
+        """
+        if not self._ensure_built():
+            return None
+        if acronym:
+            return self.countries_by_acronym.get(_upper(acronym))
+        if acron3:
+            return self.countries_by_acron3.get(_upper(acron3))
+        if name:
+            return self.countries_by_name.get(fold_text(name))
+        return None
+
+    def get_location(self, country=None, state=None, city=None):
+        if not (country or state or city) or not self._ensure_built():
+            return None
+        return self.locations.get((_id(country), _id(state), _id(city)))
+
+    def bulk_standardize(self, texts, kind):
+        """
+        Normalização em lote, sem gravação no banco de dados
+
+        texts: textos livres (ex.: "São Paulo/SP, Rio de Janeiro/RJ")
+        kind: "city", "state" ou "country"
+
+        Retorna dict {texto: [objeto encontrado ou None para cada item]},
+        seguindo a separação feita por City / State / Country.standardize
+        """
+        resolved = {}
+        for text in texts:
+            if text in resolved:
+                continue
+            items = []
+            if kind == "city":
+                for item in standardize_name(text) or []:
+                    items.append(self.get_city(item.get("name")))
+            elif kind == "state":
+                for item in standardize_code_and_name(text):
+                    items.append(self.get_state(item.get("name"), item.get("code")))
+            elif kind == "country":
+                for item in standardize_code_and_name(text):
+                    items.append(
+                        self.get_country(item.get("name"), acronym=item.get("code"))
+                    )
+            else:
+                raise ValueError(f"Gazetteer.bulk_standardize: invalid kind {kind}")
+            resolved[text] = items
+        return resolved
+
+
+gazetteer = Gazetteer()
@@ -1,9 +1,8 @@
-import csv
-import logging
 import os
 
-from django.db import models, IntegrityError
+from django.db import models, IntegrityError, transaction
 from django.db.models import Q
+from django.db.models import signals
 from django.utils.translation import gettext_lazy as _
 from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
@@ -14,7 +13,9 @@ from wagtailautocomplete.edit_handlers import AutocompletePanel
 
 from core.forms import CoreAdminModelForm
 from core.models import CommonControlField, Language, TextWithLang
+from core.utils.bulk_loader import bulk_load, read_csv
 from core.utils.standardizer import standardize_name, standardize_code_and_name, remove_extra_spaces
+from location.gazetteer import gazetteer
 
 
 class City(CommonControlField):
@@ -52,11 +53,15 @@ class City(CommonControlField):
     def load(cls, user, file_path=None):
         file_path = file_path or "./location/fixtures/cities.csv"
         with open(file_path, "r") as fp:
-            for name in fp.readlines():
-                try:
-                    cls.get_or_create(name=name, user=user)
-                except Exception as e:
-                    logging.exception(e)
+            names = (remove_extra_spaces(name) for name in fp)
+            bulk_load(
+                cls,
+                ({"name": name} for name in names if name),
+                user,
+                key_fields=["name"],
+                normalize=str.casefold,
+            )
+        transaction.on_commit(gazetteer.invalidate)
 
     @classmethod
     def get_or_create(cls, user=None, name=None):
@@ -70,6 +75,9 @@ class City(CommonControlField):
         name = remove_extra_spaces(name)
         if not name:
             raise ValueError("City.get_or_create requires name")
+        obj = gazetteer.get_city(name)
+        if obj:
+            return obj
         try:
             return cls.objects.get(name__iexact=name)
         except cls.MultipleObjectsReturned:
@@ -99,7 +107,9 @@ class City(CommonControlField):
         standardized_city = standardize_name(text)
         for item in standardized_city:
             if user:
-                item = City.get_or_create(user=user, name=item["name"])
+                item = gazetteer.get_city(item["name"]) or City.get_or_create(
+                    user=user, name=item["name"]
+                )
             yield {"city": item}
 
 
@@ -153,17 +163,21 @@ class State(CommonControlField):
     @classmethod
     def load(cls, user, file_path=None):
         file_path = file_path or "./location/fixtures/states.csv"
-        with open(file_path, "r") as csvfile:
-            rows = csv.DictReader(
-                csvfile, fieldnames=["name", "acronym", "region"], delimiter=";"
-            )
-            for row in rows:
-                logging.info(row)
-                cls.get_or_create(
-                    name=row["name"],
-                    acronym=row["acronym"],
-                    user=user,
-                )
+        rows = read_csv(file_path, fieldnames=["name", "acronym", "region"])
+        bulk_load(
+            cls,
+            (
+                {
+                    "name": remove_extra_spaces(row["name"]),
+                    "acronym": remove_extra_spaces(row["acronym"]),
+                }
+                for row in rows
+            ),
+            user,
+            key_fields=["name", "acronym"],
+            normalize=str.casefold,
+        )
+        transaction.on_commit(gazetteer.invalidate)
 
     @classmethod
     def get_or_create(cls, user=None, name=None, acronym=None):
@@ -174,6 +188,9 @@ class State(CommonControlField):
         name = remove_extra_spaces(name)
         acronym = remove_extra_spaces(acronym)
         if name or acronym:
+            obj = gazetteer.get_state(name, acronym)
+            if obj:
+                return obj
             try:
                 return cls.objects.get(name__iexact=name, acronym__iexact=acronym)
             except cls.MultipleObjectsReturned:
@@ -220,7 +237,10 @@ class State(CommonControlField):
         standardized_state = standardize_code_and_name(text)
         for item in standardized_state:
             if user:
-                item = State.create_or_update(
+                # registro já conhecido: evita a gravação de create_or_update
+                item = gazetteer.get_state(
+                    item.get("name"), item.get("code")
+                ) or State.create_or_update(
                     user, name=item.get("name"), acronym=item.get("code")
                 )
             yield {"state": item}
@@ -388,16 +408,59 @@ class Country(CommonControlField, ClusterableModel):
         # País (pt);País (en);Capital;Código ISO (3 letras);Código ISO (2 letras)
         fieldnames = ["name_pt", "name_en", "Capital", "acron3", "acron2"]
         file_path = file_path or "./location/fixtures/country.csv"
-        with open(file_path, newline="") as csvfile:
-            reader = csv.DictReader(csvfile, fieldnames=fieldnames, delimiter=";")
-            for row in reader:
-                cls.create_or_update(
-                    user,
-                    name=row["name_en"],
-                    acronym=row["acron2"],
-                    acron3=row["acron3"],
-                    country_names={"pt": row["name_pt"], "en": row["name_en"]},
+        rows = [
+            {name: remove_extra_spaces(value) for name, value in row.items()}
+            for row in read_csv(file_path, fieldnames=fieldnames)
+        ]
+        countries = cls.bulk_load(
+            user,
+            (
+                {
+                    "name": row["name_en"],
+                    "acronym": row["acron2"],
+                    "acron3": row["acron3"],
+                }
+                for row in rows
+            ),
+        )
+        languages = {
+            code2: Language.get_or_create(code2=code2) for code2 in ("pt", "en")
+        }
+        country_names = []
+        for row in rows:
+            country = countries.get((row["acron2"],))
+            if not country:
+                continue
+            for code2, language in languages.items():
+                country_names.append(
+                    {
+                        "country_id": country.pk,
+                        "language_id": language.pk,
+                        "text": row[f"name_{code2}"],
+                    }
                 )
+        bulk_load(
+            CountryName,
+            country_names,
+            user,
+            key_fields=["country_id", "language_id"],
+            update_fields=["text"],
+        )
+        transaction.on_commit(gazetteer.invalidate)
+
+    @classmethod
+    def bulk_load(cls, user, rows):
+        """
+        Carga em lote de países (rows: dicts com name, acronym e acron3),
+        identificados pela sigla, como em Country.get
+        """
+        return bulk_load(
+            cls,
+            rows,
+            user,
+            key_fields=["acronym"],
+            update_fields=["name", "acron3"],
+        )
 
     @classmethod
     def get(
@@ -410,6 +473,9 @@ class Country(CommonControlField, ClusterableModel):
         acronym = remove_extra_spaces(acronym)
         acron3 = remove_extra_spaces(acron3)
 
+        obj = gazetteer.get_country(name, acronym, acron3)
+        if obj:
+            return obj
         if acronym:
             return cls.objects.get(acronym=acronym)
         if acron3:
@@ -473,7 +539,9 @@ class Country(CommonControlField, ClusterableModel):
         standardized_country = standardize_code_and_name(text)
         for item in standardized_country:
             if user:
-                item = Country.create_or_update(
+                # registro já conhecido: evita a gravação de create_or_update
+                known = gazetteer.get_country(item.get("name"), item.get("code"))
+                item = known or Country.create_or_update(
                     user,
                     name=item.get("name"),
                     acronym=item.get("code"),
@@ -573,6 +641,9 @@ class Location(CommonControlField):
         city=None,
     ):
         if country or state or city:
+            obj = gazetteer.get_location(country, state, city)
+            if obj:
+                return obj
             try:
                 return cls.objects.get(
                     country=country,
@@ -679,3 +750,22 @@ class CountryFile(models.Model):
         return os.path.basename(self.attachment.name)
 
     panels = [FieldPanel("attachment")]
+
+
+def update_gazetteer(sender, instance, created=False, **kwargs):
+    """
+    Mantém o índice em memória (location.gazetteer) coerente com o banco:
+    registros novos são adicionados; alterações e exclusões invalidam
+    o índice, que é reconstruído na próxima consulta. O índice só é
+    alterado após o commit, para não guardar registros desfeitos por
+    rollback
+    """
+    if created:
+        transaction.on_commit(lambda: gazetteer.add(instance))
+    else:
+        transaction.on_commit(gazetteer.invalidate)
+
+
+for _model in (City, State, Country, CountryName, Location):
+    signals.post_save.connect(update_gazetteer, sender=_model)
+    signals.post_delete.connect(update_gazetteer, sender=_model)
@@ -1,8 +1,12 @@
-from django.test import TestCase
+import os
+import tempfile
+
+from django.test import TestCase, override_settings
 
 # Create your tests here.
 from django.contrib.auth import get_user_model
 from location import models
+from location.gazetteer import gazetteer
 
 
 User = get_user_model()
@@ -207,3 +211,84 @@ class CountryTest(TestCase):
                 self.assertIsInstance(item["country"], dict)
                 self.assertEqual("BR, MX, Chile", item["country"].get("name"))
                 self.assertEqual(None, item["country"].get("code"))
+
+
+@override_settings(LOCATION_GAZETTEER_ENABLED=True)
+class GazetteerTest(TestCase):
+    def setUp(self):
+        gazetteer.invalidate()
+        self.user, created = User.objects.get_or_create(username="adm")
+        self.state = models.State.create(self.user, name="São Paulo", acronym="SP")
+        self.country = models.Country.create_or_update(
+            self.user,
+            name="Brazil",
+            acronym="BR",
+            acron3="BRA",
+            country_names={"pt": "Brasil"},
+        )
+
+    def tearDown(self):
+        gazetteer.invalidate()
+
+    def test_get_state_ignores_accents_and_case(self):
+        self.assertEqual(self.state, gazetteer.get_state("sao paulo", "sp"))
+
+    def test_get_country_by_country_name(self):
+        self.assertEqual(self.country, gazetteer.get_country("BRASIL"))
+        self.assertEqual(self.country, gazetteer.get_country(None, acron3="bra"))
+
+    def test_new_city_is_added_after_commit(self):
+        self.assertIsNone(gazetteer.get_city("Campinas"))
+        with self.captureOnCommitCallbacks(execute=True):
+            city = models.City.create(self.user, "Campinas")
+            self.assertIsNone(gazetteer.get_city("campinas"))
+        self.assertEqual(city, gazetteer.get_city("campinas"))
+
+    def test_rolled_back_city_is_not_added(self):
+        self.assertIsNone(gazetteer.get_city("Campinas"))
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            models.City.create(self.user, "Campinas")
+        self.assertTrue(callbacks)
+        self.assertIsNone(gazetteer.get_city("campinas"))
+
+    def test_deleted_state_is_removed_after_commit(self):
+        self.assertEqual(self.state, gazetteer.get_state("São Paulo", "SP"))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.state.delete()
+        self.assertIsNone(gazetteer.get_state("São Paulo", "SP"))
+
+    def test_bulk_standardize(self):
+        result = gazetteer.bulk_standardize(["Brasil", "Chile"], "country")
+        self.assertEqual([self.country], result["Brasil"])
+        self.assertEqual([None], result["Chile"])
+
+
+class BulkLoadTest(TestCase):
+    def setUp(self):
+        self.user, created = User.objects.get_or_create(username="adm")
+
+    def test_city_load_skips_existing_names(self):
+        models.City.create(self.user, "Campinas")
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as fp:
+            fp.write("campinas\nSantos\nSantos\n  \n")
+        models.City.load(self.user, fp.name)
+        models.City.load(self.user, fp.name)
+        os.remove(fp.name)
+
+        self.assertEqual(
+            ["Campinas", "Santos"],
+            list(models.City.objects.order_by("name").values_list("name", flat=True)),
+        )
+
+    def test_country_load_creates_country_names(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as fp:
+            fp.write("Brasil;Brazil;Brasília;BRA;BR\n")
+        models.Country.load(self.user, fp.name)
+        os.remove(fp.name)
+
+        country = models.Country.objects.get(acronym="BR")
+        self.assertEqual("BRA", country.acron3)
+        self.assertEqual(
+            {"Brasil", "Brazil"},
+            set(country.country_name.values_list("text", flat=True)),
+        )
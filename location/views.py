@@ -8,8 +8,9 @@ from django.shortcuts import get_object_or_404, redirect
 from django.utils.translation import gettext_lazy as _
 from wagtail.admin import messages
 
-from core.libs import chkcsv
+from core.utils.csv_validator import validate_csv_file
 
+from .gazetteer import gazetteer
 from .models import Country, CountryFile
 
 
@@ -24,20 +25,16 @@ def validate_country(request):
     if request.method == "GET":
         try:
             upload_path = file_upload.attachment.file.path
-            cols = chkcsv.read_format_specs(
+            result = validate_csv_file(
+                upload_path,
                 os.path.dirname(os.path.abspath(__file__)) + "/country_chkcsvfmt.fmt",
-                True,
-                False,
-            )
-            errorlist = chkcsv.check_csv_file(
-                upload_path, cols, True, True, True, False
             )
+            errorlist = result.errors
             if errorlist:
                 raise Exception(_("Validation error"))
             else:
                 file_upload.is_valid = True
-                fp = open(upload_path)
-                file_upload.line_count = len(fp.readlines())
+                file_upload.line_count = result.line_count
                 file_upload.save()
         except Exception as ex:
             messages.error(request, _("Validation error: %s") % errorlist)
@@ -59,13 +56,17 @@ def import_file_country(request):
         with open(file_path, "r") as csvfile:
             data = csv.DictReader(csvfile, delimiter=";")
 
+            rows = []
             for line, row in enumerate(data):
-                c = Country()
-                c.name = row["Country"]
-                c.acronym = row["Acronym 2 letters"]
-                c.acron3 = row["Acronym 3 letters"]
-                c.creator = request.user
-                c.save()
+                rows.append(
+                    {
+                        "name": row["Country"],
+                        "acronym": row["Acronym 2 letters"],
+                        "acron3": row["Acronym 3 letters"],
+                    }
+                )
+        Country.bulk_load(request.user, rows)
+        gazetteer.invalidate()
 
     except Exception as ex:
         messages.error(request, _("Import error: %(exception)s, Line: %(line)s") % {'exception': ex, 'line': str(line + 2)})
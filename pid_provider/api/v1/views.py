@@ -1,6 +1,9 @@
+import base64
+import json
 import os
 import logging
 import sys
+from datetime import datetime, time
 from io import BytesIO
 from zipfile import ZipFile
 
@@ -8,7 +11,11 @@ from tempfile import NamedTemporaryFile, TemporaryDirectory
 from config.settings.base import TASK_EXPIRES, TASK_TIMEOUT, RUN_ASYNC
 
 from celery.exceptions import TimeoutError
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import status as rest_framework_status
+from rest_framework.exceptions import ValidationError
 from rest_framework.mixins import CreateModelMixin
 from rest_framework.parsers import FileUploadParser
 from rest_framework.permissions import IsAuthenticated
@@ -16,6 +23,7 @@ from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from core.utils.profiling_tools import profile_endpoint, profile_method  # ajuste o import conforme sua estrutura
+from pid_provider.models import PidProviderXML
 from pid_provider.provider import PidProvider
 from pid_provider.tasks import (
     task_delete_provide_pid_tmp_zip,
@@ -35,6 +43,24 @@ TASK_LOW_PRIORITY = 9
 # queue=queue          # Fila específica
 # TASK_QUEUE = "pid_provider"
 
+# quantidade de registros lidos por vez do cursor do banco de dados
+CHANGE_FEED_CHUNK_SIZE = 2000
+CHANGE_FEED_DEFAULT_LIMIT = 10000
+CHANGE_FEED_MAX_LIMIT = 100000
+
+
+def encode_continuation_token(item):
+    value = [item.feed_date, item.updated.isoformat(), item.id]
+    return base64.urlsafe_b64encode(json.dumps(value).encode("utf-8")).decode("ascii")
+
+
+def decode_continuation_token(token):
+    try:
+        feed_date, updated, pk = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        return feed_date, datetime.fromisoformat(updated), int(pk)
+    except Exception:
+        raise ValidationError({"cursor": f"Invalid continuation token: {token}"})
+
 
 class PidProviderViewSet(
     GenericViewSet,  # generic view functionality
@@ -294,3 +320,81 @@ class FixPidV2ViewSet(
                 {"error_type": str(type(e)), "error_message": str(e)},
                 status=rest_framework_status.HTTP_400_BAD_REQUEST,
             )
+
+
+class PidProviderXMLChangeFeedViewSet(GenericViewSet):
+    """
+    Feed de alterações de PidProviderXML em NDJSON (um JSON por linha)
+
+    # primeira requisição
+    curl -H 'Authorization: Bearer eyJhbGc...' \
+        'http://localhost:8000/api/v2/pid/change_feed/?from_date=2024-01-01'
+
+    # resposta
+    ```
+    {"v3": "...", "v2": "...", ..., "available_since": "...", "xml_uri": "..."}
+    ...
+    {"continuation_token": "WyIyMDI0LTAx...", "count": 10000}
+    ```
+    A última linha contém o token para continuar a leitura a partir do
+    último registro emitido (parâmetro ``cursor``). O token também deve ser
+    guardado quando ``count`` for menor que ``limit``, para consultar
+    as próximas alterações.
+    """
+
+    http_method_names = ["get"]
+    permission_classes = [IsAuthenticated]
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.query_params.get("limit") or CHANGE_FEED_DEFAULT_LIMIT)
+        except ValueError:
+            raise ValidationError({"limit": "limit must be an integer"})
+        return max(1, min(limit, CHANGE_FEED_MAX_LIMIT))
+
+    def get_from_date(self):
+        value = self.request.query_params.get("from_date")
+        if not value:
+            return None
+        try:
+            from_date = parse_datetime(value) or parse_date(value)
+        except ValueError:
+            from_date = None
+        if not from_date:
+            raise ValidationError(
+                {"from_date": "from_date must be an ISO date (YYYY-MM-DD[THH:MM:SS])"}
+            )
+        if not isinstance(from_date, datetime):
+            from_date = datetime.combine(from_date, time.min)
+        if timezone.is_naive(from_date):
+            from_date = timezone.make_aware(from_date)
+        return from_date
+
+    def list(self, request):
+        query_params = request.query_params
+        cursor = query_params.get("cursor")
+        after = cursor and decode_continuation_token(cursor)
+        limit = self.get_limit()
+        queryset = PidProviderXML.change_feed(
+            from_date=self.get_from_date(), after=after
+        )[:limit]
+        return StreamingHttpResponse(
+            self.stream(queryset, cursor),
+            content_type="application/x-ndjson",
+        )
+
+    def stream(self, queryset, cursor=None):
+        request = self.request
+        count = 0
+        last = None
+        # iterator() usa cursor no servidor: memória constante
+        for item in queryset.iterator(chunk_size=CHANGE_FEED_CHUNK_SIZE):
+            data = item.data
+            data["available_since"] = item.available_since
+            xml_uri = item.xml_uri
+            data["xml_uri"] = xml_uri and request.build_absolute_uri(xml_uri)
+            yield json.dumps(data) + "\n"
+            count += 1
+            last = item
+        token = encode_continuation_token(last) if last else cursor
+        yield json.dumps({"continuation_token": token, "count": count}) + "\n"
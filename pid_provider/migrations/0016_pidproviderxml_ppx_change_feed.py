@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-19 10:12
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pid_provider", "0015_alter_xmlversion_file_xmlurl"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="pidproviderxml",
+            index=models.Index(
+                django.db.models.functions.comparison.Coalesce(
+                    "available_since", models.Value("")
+                ),
+                models.F("updated"),
+                models.F("id"),
+                name="ppx_change_feed",
+            ),
+        ),
+    ]
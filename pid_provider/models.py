@@ -11,7 +11,8 @@ from zlib import crc32
 
 from django.core.files.base import ContentFile
 from django.db import IntegrityError, models
-from django.db.models import Q, Count, Min
+from django.db.models import Q, Count, Min, Value
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
@@ -25,6 +26,7 @@ from wagtailautocomplete.edit_handlers import AutocompletePanel
 from collection.models import Collection
 from core.forms import CoreAdminModelForm
 from core.models import CommonControlField
+from core.utils.metrics import timed_stage
 from core.utils.profiling_tools import (  # ajuste o import conforme sua estrutura
     profile_classmethod,
     profile_method,
@@ -32,6 +34,7 @@ from core.utils.profiling_tools import (  # ajuste o import conforme sua estrutu
     profile_staticmethod,
 )
 from core.utils.similarity import how_similar
+from core.utils.tracing import span
 from pid_provider import choices, exceptions
 from pid_provider.query_params import (
     get_score,
@@ -160,8 +163,9 @@ class XMLVersion(CommonControlField):
     @property
     def xml_with_pre(self):
         try:
-            for item in XMLWithPre.create(path=self.file.path):
-                return item
+            with span("storage.read", {"file.name": self.file.name}):
+                for item in XMLWithPre.create(path=self.file.path):
+                    return item
         except Exception as e:
             raise XMLVersionXmlWithPreError(
                 _("Unable to get xml with pre (XMLVersion) {}: {} {}").format(
@@ -492,6 +496,12 @@ class PidProviderXML(BasePidProviderXML, CommonControlField, ClusterableModel):
             models.Index(fields=["proc_status"]),
             models.Index(fields=["registered_in_core"]),
             models.Index(fields=["available_since", "-updated"]),
+            models.Index(
+                Coalesce("available_since", Value("")),
+                "updated",
+                "id",
+                name="ppx_change_feed",
+            ),
             # === Compostos ===
             models.Index(
                 fields=["issn_electronic", "elocation_id"],
@@ -575,6 +585,46 @@ class PidProviderXML(BasePidProviderXML, CommonControlField, ClusterableModel):
             current_version__pid_provider_xml__v3__isnull=False,
         ).iterator()
 
+    @classmethod
+    def change_feed(cls, from_date=None, after=None):
+        """
+        Documentos públicos ordenados por (available_since, updated, id)
+
+        after: tupla (available_since, updated, id) do último item recebido
+        pelo cliente; a consulta é retomada a partir do item seguinte
+        (paginação por keyset, sem OFFSET).
+        available_since nulo é tratado como "" e fica no início do feed.
+        """
+        now = datetime.utcnow().isoformat()[:10]
+        queryset = (
+            cls.objects.filter(
+                Q(available_since__isnull=True) | Q(available_since__lte=now),
+                v3__isnull=False,
+                current_version__isnull=False,
+            )
+            .annotate(feed_date=Coalesce("available_since", Value("")))
+            .select_related("current_version")
+        )
+        if from_date:
+            queryset = queryset.filter(
+                Q(created__gte=from_date) | Q(updated__gte=from_date)
+            )
+        if after:
+            feed_date, updated, pk = after
+            queryset = queryset.filter(
+                Q(feed_date__gt=feed_date)
+                | Q(feed_date=feed_date, updated__gt=updated)
+                | Q(feed_date=feed_date, updated=updated, id__gt=pk)
+            )
+        return queryset.order_by("feed_date", "updated", "id")
+
+    @property
+    def xml_uri(self):
+        try:
+            return self.current_version.file.url
+        except (AttributeError, ValueError):
+            return None
+
     @property
     def created_updated(self):
         return self.updated or self.created
@@ -629,6 +679,7 @@ class PidProviderXML(BasePidProviderXML, CommonControlField, ClusterableModel):
 
     @classmethod
     @profile_classmethod
+    @timed_stage("pid_provider_register")
     def register(
         cls,
         xml_with_pre,
@@ -1046,7 +1097,7 @@ class PidProviderXML(BasePidProviderXML, CommonControlField, ClusterableModel):
             if score > 50:
                 matched.append((score, item.updated.isoformat(), item.id))
 
-        if results.count() > 1 or not matched:
+        if len(data) > 1 or not matched:
             detail = {
                 "xml_adapter_data": xml_adapter.data,
                 "data": data,
@@ -1,3 +1,4 @@
+import json
 import logging
 from datetime import datetime
 from unittest import mock
@@ -1027,3 +1028,121 @@ class BasePidProviderXMLURITest(TestCase):
         xmlurl = models.XMLURL.get(url="http://example.com/article2.xml")
         self.assertEqual(xmlurl.status, "pid_provider_xml_failed")
         self.assertEqual(xmlurl.pid, "test_v3_pid")
+
+
+class PidProviderXMLChangeFeedTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="feeduser", password="testpass")
+        self.items = []
+        for i, available_since in enumerate(["2024-01-02", None, "2024-01-01", "2999-01-01"]):
+            item = models.PidProviderXML.objects.create(
+                creator=self.user,
+                pkg_name=f"pkg-{i}",
+                v3=f"{i:023d}",
+                available_since=available_since,
+            )
+            item.current_version = models.XMLVersion.objects.create(
+                creator=self.user, pid_provider_xml=item
+            )
+            item.save()
+            self.items.append(item)
+
+    def test_change_feed_ordered_by_available_since_updated_id(self):
+        result = [item.pkg_name for item in models.PidProviderXML.change_feed()]
+        # available_since futuro não é público
+        self.assertEqual(["pkg-1", "pkg-2", "pkg-0"], result)
+
+    def test_change_feed_resumes_after_last_item(self):
+        first = models.PidProviderXML.change_feed()[0]
+        after = (first.feed_date, first.updated, first.id)
+        result = [item.pkg_name for item in models.PidProviderXML.change_feed(after=after)]
+        self.assertEqual(["pkg-2", "pkg-0"], result)
+
+    def test_change_feed_returns_updated_item_again(self):
+        last = list(models.PidProviderXML.change_feed())[-1]
+        after = (last.feed_date, last.updated, last.id)
+        self.assertEqual([], list(models.PidProviderXML.change_feed(after=after)))
+
+        self.items[0].registered_in_core = True
+        self.items[0].save()
+        result = [item.pkg_name for item in models.PidProviderXML.change_feed(after=after)]
+        self.assertEqual(["pkg-0"], result)
+
+    def test_xml_uri_without_file(self):
+        item = models.PidProviderXML.change_feed()[0]
+        self.assertIsNone(item.xml_uri)
+
+    def get(self, **params):
+        from rest_framework.test import APIRequestFactory, force_authenticate
+
+        from pid_provider.api.v1.views import PidProviderXMLChangeFeedViewSet
+
+        request = APIRequestFactory().get("/api/v2/pid/change_feed/", params)
+        force_authenticate(request, user=self.user)
+        view = PidProviderXMLChangeFeedViewSet.as_view({"get": "list"})
+        return view(request)
+
+    def read_page(self, **params):
+        response = self.get(**params)
+        self.assertEqual(200, response.status_code)
+        lines = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode("utf-8").splitlines()
+        ]
+        return lines[:-1], lines[-1]
+
+    def test_cursor_resumes_without_gaps_or_repeats(self):
+        for i in range(4, 7):
+            item = models.PidProviderXML.objects.create(
+                creator=self.user,
+                pkg_name=f"pkg-{i}",
+                v3=f"{i:023d}",
+                available_since="2024-01-01",
+                current_version=self.items[0].current_version,
+            )
+            self.items.append(item)
+        # mesmo available_since e updated: o desempate é feito pelo id
+        models.PidProviderXML.objects.filter(available_since="2024-01-01").update(
+            updated=self.items[2].updated
+        )
+        expected = [
+            item.pkg_name for item in models.PidProviderXML.change_feed()
+        ]
+
+        result = []
+        cursor = None
+        for _ in range(len(expected) + 1):
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            rows, last = self.read_page(**params)
+            result.extend(row["pkg_name"] for row in rows)
+            self.assertEqual(len(rows), last["count"])
+            if not rows:
+                # sem novidades, o token recebido é devolvido
+                self.assertEqual(cursor, last["continuation_token"])
+                break
+            cursor = last["continuation_token"]
+
+        self.assertEqual(6, len(expected))
+        self.assertEqual(expected, result)
+
+    def test_from_date_filters_feed(self):
+        rows, last = self.read_page(from_date="2999-01-01")
+        self.assertEqual([], rows)
+        self.assertEqual(0, last["count"])
+
+        rows, last = self.read_page(from_date="2000-01-01T00:00:00")
+        self.assertEqual(3, last["count"])
+
+    def test_invalid_from_date_returns_400(self):
+        for value in ("bad", "2024-13-45"):
+            with self.subTest(value=value):
+                response = self.get(from_date=value)
+                self.assertEqual(400, response.status_code)
+                self.assertIn("from_date", response.data)
+
+    def test_invalid_cursor_returns_400(self):
+        response = self.get(cursor="bad")
+        self.assertEqual(400, response.status_code)
+        self.assertIn("cursor", response.data)
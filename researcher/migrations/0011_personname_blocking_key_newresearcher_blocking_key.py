@@ -0,0 +1,59 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:05
+
+from django.db import migrations, models
+
+from researcher.utils import name_blocking_key
+
+
+def fill_blocking_key(apps, schema_editor):
+    for model_name in ("PersonName", "NewResearcher"):
+        Model = apps.get_model("researcher", model_name)
+        batch = []
+        queryset = Model.objects.only(
+            "id", "given_names", "last_name", "declared_name"
+        )
+        for obj in queryset.iterator(chunk_size=2000):
+            obj.blocking_key = name_blocking_key(
+                obj.given_names, obj.last_name, obj.declared_name
+            )
+            batch.append(obj)
+            if len(batch) == 2000:
+                Model.objects.bulk_update(batch, ["blocking_key"])
+                batch = []
+        if batch:
+            Model.objects.bulk_update(batch, ["blocking_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("researcher", "0010_newresearcher_declared_name_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newresearcher",
+            name="blocking_key",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                max_length=255,
+                null=True,
+                verbose_name="Blocking key",
+            ),
+        ),
+        migrations.AddField(
+            model_name="personname",
+            name="blocking_key",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                max_length=255,
+                null=True,
+                verbose_name="Blocking key",
+            ),
+        ),
+        migrations.RunPython(fill_blocking_key, reverse_code=migrations.RunPython.noop),
+    ]
@@ -25,7 +25,7 @@ from core.utils.standardizer import remove_extra_spaces
 from . import choices
 from .exceptions import InvalidOrcidError, PersonNameCreateError
 from .forms import ResearcherForm
-from .utils import ORCID_REGEX, clean_orcid, extract_orcid_number
+from .utils import ORCID_REGEX, clean_orcid, extract_orcid_number, name_blocking_key
 
 
 class ResearchNameMixin(models.Model):
@@ -43,6 +43,15 @@ class ResearchNameMixin(models.Model):
     declared_name = models.CharField(
         _("Declared Name"), max_length=255, blank=True, null=True
     )
+    # sobrenome normalizado + iniciais (ver researcher.utils.name_blocking_key)
+    blocking_key = models.CharField(
+        _("Blocking key"),
+        max_length=255,
+        blank=True,
+        null=True,
+        editable=False,
+        db_index=True,
+    )
 
     class Meta:
         abstract = True
@@ -54,6 +63,16 @@ class ResearchNameMixin(models.Model):
     def join_names(given_names, last_name, suffix):
         return " ".join(filter(None, [given_names, last_name, suffix]))
 
+    def set_blocking_key(self):
+        self.blocking_key = name_blocking_key(
+            self.given_names, self.last_name, self.declared_name
+        )
+        return self.blocking_key
+
+    def save(self, *args, **kwargs):
+        self.set_blocking_key()
+        super().save(*args, **kwargs)
+
 
 class GenderMixin(models.Model):
     """
@@ -589,8 +608,11 @@ class PersonName(ResearchNameMixin, GenderMixin, CommonControlField):
         declared_name,
     ):
         if last_name or fullname:
+            # blocking_key usa o índice e restringe os candidatos
+            blocking_key = name_blocking_key(given_names, last_name, declared_name)
             try:
                 return cls.objects.get(
+                    blocking_key=blocking_key,
                     fullname__iexact=fullname,
                     last_name__iexact=last_name,
                     given_names__iexact=given_names,
@@ -599,6 +621,7 @@ class PersonName(ResearchNameMixin, GenderMixin, CommonControlField):
                 )
             except cls.MultipleObjectsReturned:
                 return cls.objects.filter(
+                    blocking_key=blocking_key,
                     fullname__iexact=fullname,
                     last_name__iexact=last_name,
                     given_names__iexact=given_names,
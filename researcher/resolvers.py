@@ -0,0 +1,119 @@
+"""
+Resolução em lote de pessoas (NewResearcher, ContribPerson, ...) pela
+chave de bloqueio (ResearchNameMixin.blocking_key)
+
+Todos os candidatos de um lote (autores de um artigo, bloco de CSV) são
+obtidos em uma única consulta; a escolha é feita em memória.
+"""
+
+from collections import defaultdict
+
+from core.utils.standardizer import fold_text
+
+from .utils import name_tokens, name_blocking_key
+
+
+def _folded(value):
+    return fold_text(value) or None
+
+
+def given_names_compatible(a, b):
+    """
+    Prenomes compatíveis: cada termo de um coincide com o termo do
+    outro na mesma posição ou é a sua inicial ("J. M." ~ "João Maria")
+    """
+    tokens_a = name_tokens(a)
+    tokens_b = name_tokens(b)
+    if not tokens_a or not tokens_b:
+        return not tokens_a and not tokens_b
+    for x, y in zip(tokens_a, tokens_b):
+        if x == y:
+            continue
+        if len(x) == 1 and y.startswith(x):
+            continue
+        if len(y) == 1 and x.startswith(y):
+            continue
+        return False
+    return True
+
+
+class BlockingKeyResolver:
+    """
+    queryset: registros candidatos (ex.: ContribPerson.objects.filter(article=article))
+    people: dicts com given_names, last_name, declared_name do lote
+    orcid_of: função que retorna o ORCID de um candidato, no mesmo formato
+        do orcid informado em match
+    """
+
+    def __init__(self, queryset, people, orcid_of=None):
+        self.orcid_of = orcid_of or (lambda obj: getattr(obj, "orcid", None))
+        keys = {
+            name_blocking_key(
+                person.get("given_names"),
+                person.get("last_name"),
+                person.get("declared_name"),
+            )
+            for person in people
+        }
+        keys.discard(None)
+        self.candidates = defaultdict(list)
+        if keys:
+            for obj in queryset.filter(blocking_key__in=keys).order_by("pk"):
+                self.candidates[obj.blocking_key].append(obj)
+
+    def add(self, obj):
+        if obj is not None and obj.blocking_key:
+            self.candidates[obj.blocking_key].append(obj)
+
+    def match(
+        self,
+        given_names=None,
+        last_name=None,
+        suffix=None,
+        declared_name=None,
+        orcid=None,
+        accept=None,
+    ):
+        """
+        Retorna o candidato que representa a pessoa ou None
+
+        1. mesmo ORCID; candidatos com outro ORCID são descartados
+        2. mesmos prenomes, sobrenome e sufixo (sem acentos / maiúsculas)
+        3. único candidato com prenomes compatíveis e mesmo sufixo
+        """
+        key = name_blocking_key(given_names, last_name, declared_name)
+        candidates = [
+            obj
+            for obj in self.candidates.get(key, [])
+            if not accept or accept(obj)
+        ]
+        if orcid:
+            for obj in candidates:
+                if self.orcid_of(obj) == orcid:
+                    return obj
+            candidates = [obj for obj in candidates if not self.orcid_of(obj)]
+
+        if not last_name and declared_name:
+            candidates = [
+                obj
+                for obj in candidates
+                if _folded(obj.declared_name) == _folded(declared_name)
+            ]
+            return candidates[0] if candidates else None
+
+        suffix = _folded(suffix)
+        candidates = [obj for obj in candidates if _folded(obj.suffix) == suffix]
+        given = _folded(given_names)
+        for obj in candidates:
+            if _folded(obj.given_names) == given and _folded(obj.last_name) == _folded(
+                last_name
+            ):
+                return obj
+        compatible = [
+            obj
+            for obj in candidates
+            if given_names_compatible(obj.given_names, given_names)
+        ]
+        if len(compatible) == 1:
+            return compatible[0]
+        return None
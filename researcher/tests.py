@@ -16,10 +16,12 @@ from researcher.models import (
     ResearcherOrcid,
 )
 
+from .resolvers import given_names_compatible
 from .tasks import (
     children_migrate_old_researcher_to_new_researcher,
     migrate_old_researcher_to_new_researcher,
 )
+from .utils import name_blocking_key
 
 
 class PersonNameJoinNameTest(SimpleTestCase):
@@ -36,6 +38,27 @@ class PersonNameJoinNameTest(SimpleTestCase):
                 self.assertEqual(expected, result)
 
 
+class NameBlockingKeyTest(SimpleTestCase):
+    def test_name_blocking_key(self):
+        test_cases = [
+            (["João Maria", "Silva", None], "silva|jm"),
+            (["J. M.", "da Silva", None], "dasilva|jm"),
+            (["JOAO MARIA", "SILVA", None], "silva|jm"),
+            ([None, None, "Silva, João M."], "silva|jm"),
+            ([None, None, "João M. Silva"], "silva|jm"),
+            (["João", None, None], None),
+        ]
+        for args, expected in test_cases:
+            with self.subTest(args=args, expected=expected):
+                self.assertEqual(expected, name_blocking_key(*args))
+
+    def test_given_names_compatible(self):
+        self.assertTrue(given_names_compatible("João Maria", "J. M."))
+        self.assertTrue(given_names_compatible("Joao", "JOÃO"))
+        self.assertFalse(given_names_compatible("João Maria", "José Maria"))
+        self.assertFalse(given_names_compatible("João", None))
+
+
 class ResearcherOrcidTest(TestCase):
     def setUp(self):
         self.user = User.objects.create(username="teste", password="teste")
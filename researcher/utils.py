@@ -5,6 +5,8 @@ import re
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+from core.utils.standardizer import fold_text
+
 
 # ORCID format regex - accepts URLs or just the ID
 ORCID_REGEX = re.compile(
@@ -64,3 +66,40 @@ def extract_orcid_number(orcid):
         ORCID in format XXXX-XXXX-XXXX-XXXX
     """
     return clean_orcid(orcid)
+
+
+def name_tokens(text):
+    return re.findall(r"[a-z0-9]+", fold_text(text) or "")
+
+
+def split_declared_name(declared_name):
+    """
+    Separa declared_name em (given_names, last_name):
+    "Silva, João M." -> ("João M.", "Silva"); "João M. Silva" -> ("João M.", "Silva")
+    """
+    if not declared_name:
+        return None, None
+    if "," in declared_name:
+        last_name, given_names = declared_name.split(",", 1)
+        return given_names.strip() or None, last_name.strip() or None
+    parts = declared_name.split()
+    return " ".join(parts[:-1]) or None, parts[-1]
+
+
+def name_blocking_key(given_names=None, last_name=None, declared_name=None):
+    """
+    Chave de bloqueio para deduplicação de pessoas: sobrenome normalizado
+    (sem acentos, maiúsculas, espaços e pontuação) + iniciais dos prenomes.
+
+    "Silva", "João Maria" -> "silva|jm"; "da Silva", "J. M." -> "dasilva|jm"
+
+    Variações de grafia do mesmo nome têm a mesma chave; a escolha entre
+    os candidatos de uma chave é feita por researcher.resolvers.
+    """
+    if not last_name and declared_name:
+        given_names, last_name = split_declared_name(declared_name)
+    surname = "".join(name_tokens(last_name))
+    if not surname:
+        return None
+    initials = "".join(token[0] for token in name_tokens(given_names))
+    return f"{surname}|{initials}"[:255]
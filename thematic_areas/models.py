@@ -1,4 +1,3 @@
-import csv
 import os
 
 from django.db import models
@@ -7,6 +6,7 @@ from wagtail.admin.panels import FieldPanel
 
 from core.forms import CoreAdminModelForm
 from core.models import CommonControlField, Language
+from core.utils.bulk_loader import bulk_load, read_csv
 
 from . import choices
 
@@ -184,15 +184,13 @@ class ThematicArea(CommonControlField):
     def load(cls, user, thematic_area_data=None):
         if not cls.objects.exists():
             thematic_area_data = thematic_area_data or "./thematic_areas/fixtures/thematic_areas.csv"
-            with open(thematic_area_data, "r") as csvfile:
-                reader = csv.DictReader(csvfile, fieldnames=["level0", "level1", "level2"], delimiter=";")
-                for row in reader:
-                    cls.get_or_create(
-                        level0=row["level0"],
-                        level1=row["level1"],
-                        level2=row["level2"],
-                        user=user,
-                    )
+            rows = read_csv(thematic_area_data, fieldnames=["level0", "level1", "level2"])
+            bulk_load(
+                cls,
+                rows,
+                user,
+                key_fields=["level0", "level1", "level2"],
+            )
 
     @classmethod
     def get_or_create(cls, level0, level1, level2, user):
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tracker", "0005_payload_columns_compression"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="unexpectedevent",
+            name="fingerprint",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=40,
+                null=True,
+                verbose_name="Fingerprint",
+            ),
+        ),
+        migrations.AddField(
+            model_name="unexpectedevent",
+            name="occurrences",
+            field=models.PositiveIntegerField(default=1, verbose_name="Occurrences"),
+        ),
+        migrations.AddField(
+            model_name="unexpectedevent",
+            name="first_seen",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="First seen"),
+        ),
+        migrations.AddField(
+            model_name="unexpectedevent",
+            name="last_seen",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="Last seen"),
+        ),
+        migrations.AddIndex(
+            model_name="unexpectedevent",
+            index=models.Index(
+                fields=["fingerprint", "last_seen"], name="tracker_une_fingerprint_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:30
+
+from django.db import migrations
+
+from core.utils.partitioning import convert_to_partitioned
+
+
+def partition_tables(apps, schema_editor):
+    for model_name in ("UnexpectedEvent", "Hello"):
+        model = apps.get_model("tracker", model_name)
+        convert_to_partitioned(schema_editor, model._meta.db_table)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tracker", "0006_unexpectedevent_fingerprint_occurrences"),
+    ]
+
+    operations = [
+        # as tabelas particionadas continuam compatíveis com os modelos
+        migrations.RunPython(partition_tables, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,19 @@
+import atexit
+import hashlib
 import json
 import logging
+import threading
+import time
 import traceback
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
+from django.conf import settings
 from django.core.files.base import ContentFile
-from django.db import models
+from django.core.signals import request_finished
+from django.db import connection, models, transaction
+from django.db.models import F
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
@@ -14,7 +22,7 @@ from wagtail.models import Orderable
 from wagtailautocomplete.edit_handlers import AutocompletePanel
 
 from core.forms import CoreAdminModelForm
-from core.models import CommonControlField
+from core.models import CommonControlField, DeferredPayloadManager
 from tracker import choices
 
 
@@ -113,12 +121,26 @@ class UnexpectedEvent(models.Model):
         null=True,
         blank=True,
     )
+    # ocorrências repetidas (mesmo action, exception_type e item e, sem
+    # action ou item, mesma origem) são agregadas em um único registro
+    # (UnexpectedEventRecorder)
+    fingerprint = models.CharField(
+        _("Fingerprint"), max_length=40, null=True, blank=True, editable=False
+    )
+    occurrences = models.PositiveIntegerField(_("Occurrences"), default=1)
+    first_seen = models.DateTimeField(_("First seen"), null=True, blank=True)
+    last_seen = models.DateTimeField(_("Last seen"), null=True, blank=True)
+
+    objects = DeferredPayloadManager("traceback", "detail")
 
     class Meta:
         indexes = [
             models.Index(fields=["exception_type"]),
             models.Index(fields=["item"]),
             models.Index(fields=["action"]),
+            models.Index(
+                fields=["fingerprint", "last_seen"], name="tracker_une_fingerprint_idx"
+            ),
         ]
         ordering = ["-created"]
 
@@ -137,8 +159,79 @@ class UnexpectedEvent(models.Model):
             exception_msg=self.exception_msg,
             traceback=json.dumps(self.traceback),
             detail=json.dumps(self.detail),
+            occurrences=self.occurrences,
+            first_seen=self.first_seen and self.first_seen.isoformat(),
+            last_seen=self.last_seen and self.last_seen.isoformat(),
         )
 
+    @staticmethod
+    def get_origin(detail=None, exc_traceback=None):
+        """
+        Origem do evento: function / task / operation de detail ou, na
+        falta, o primeiro quadro do traceback
+        """
+        if isinstance(detail, dict):
+            for key in ("function", "task", "operation"):
+                if detail.get(key):
+                    return str(detail[key])
+        if exc_traceback:
+            frame = traceback.extract_tb(exc_traceback, limit=1)[0]
+            return f"{frame.filename}:{frame.name}"
+        return None
+
+    @staticmethod
+    def get_fingerprint(action, exception_type, item, origin=None):
+        key = f"{action}|{exception_type}|{item}"
+        if origin and not (action and item):
+            # sem action ou item, exceções do mesmo tipo em pontos
+            # diferentes do código não são agregadas
+            key = f"{key}|{origin}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def cap_detail(detail):
+        """
+        Retorna detail serializável em JSON, com no máximo
+        settings.UNEXPECTED_EVENT_MAX_DETAIL_SIZE caracteres
+        """
+        try:
+            text = json.dumps(detail)
+        except Exception:
+            detail = text = str(detail)
+        max_size = getattr(settings, "UNEXPECTED_EVENT_MAX_DETAIL_SIZE", 20000)
+        if len(text) <= max_size:
+            return detail
+        return {"truncated": True, "size": len(text), "preview": text[:max_size]}
+
+    @classmethod
+    def build(
+        cls,
+        exception=None,
+        exc_traceback=None,
+        item=None,
+        action=None,
+        detail=None,
+    ):
+        now = timezone.now()
+        obj = cls()
+        obj.created = now
+        obj.first_seen = now
+        obj.last_seen = now
+        obj.item = item and str(item)[:256]
+        obj.action = action and str(action)[:256]
+        obj.exception_msg = str(exception)
+        obj.exception_type = str(type(exception))
+        obj.fingerprint = cls.get_fingerprint(
+            obj.action,
+            obj.exception_type,
+            obj.item,
+            cls.get_origin(detail, exc_traceback),
+        )
+        obj.detail = cls.cap_detail(detail)
+        if exc_traceback:
+            obj.traceback = traceback.format_tb(exc_traceback)
+        return obj
+
     @classmethod
     def create(
         cls,
@@ -148,23 +241,19 @@ class UnexpectedEvent(models.Model):
         action=None,
         detail=None,
     ):
+        """
+        Registra o evento; com settings.UNEXPECTED_EVENT_BUFFERED, o registro
+        é feito em lote por unexpected_event_recorder e o objeto retornado,
+        com os dados desta ocorrência, não é gravado
+        """
         try:
+            if getattr(settings, "UNEXPECTED_EVENT_BUFFERED", False):
+                return unexpected_event_recorder.record(
+                    exception, exc_traceback, item, action, detail
+                )
             if exception:
                 logging.exception(exception)
-
-            obj = cls()
-            obj.item = item
-            obj.action = action
-            obj.exception_msg = str(exception)
-            obj.exception_type = str(type(exception))
-            try:
-                json.dumps(detail)
-                obj.detail = detail
-            except Exception as e:
-                obj.detail = str(detail)
-
-            if exc_traceback:
-                obj.traceback = traceback.format_tb(exc_traceback)
+            obj = cls.build(exception, exc_traceback, item, action, detail)
             obj.save()
             return obj
         except Exception as exc:
@@ -173,6 +262,120 @@ class UnexpectedEvent(models.Model):
             )
 
 
+class UnexpectedEventRecorder:
+    """
+    Acumula UnexpectedEvent em memória, agrupados por fingerprint
+    (action, exception_type, item e, sem action ou item, a origem do
+    evento; ver UnexpectedEvent.get_origin): repetições só incrementam
+    occurrences e last_seen. Os eventos são gravados em lote ao atingir
+    UNEXPECTED_EVENT_BATCH_SIZE fingerprints, a cada
+    UNEXPECTED_EVENT_FLUSH_INTERVAL segundos, ao final de cada requisição /
+    tarefa Celery e ao encerrar o processo. Dentro de uma transação
+    (ATOMIC_REQUESTS, por exemplo) record não grava: o rollback descartaria
+    também os eventos dos outros threads.
+
+    Na gravação, eventos com o mesmo fingerprint vistos há menos de
+    UNEXPECTED_EVENT_AGGREGATION_WINDOW segundos são somados ao registro
+    existente, em vez de criar um novo.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._flushed_at = time.monotonic()
+
+    def record(self, exception=None, exc_traceback=None, item=None, action=None, detail=None):
+        """
+        Retorna um UnexpectedEvent, não gravado, com os dados desta
+        ocorrência; o registro agregado fica em _pending
+        """
+        event = UnexpectedEvent.build(exception, exc_traceback, item, action, detail)
+        fingerprint = event.fingerprint
+        with self._lock:
+            obj = self._pending.get(fingerprint)
+            if obj is not None:
+                obj.occurrences += 1
+                obj.last_seen = event.last_seen
+        if obj is None:
+            # primeira ocorrência: registrada no log uma vez; o registro
+            # agregado é outro objeto, o retornado pertence ao chamador
+            if exception:
+                logging.exception(exception)
+            new_obj = UnexpectedEvent.build(
+                exception, exc_traceback, item, action, detail
+            )
+            with self._lock:
+                obj = self._pending.setdefault(fingerprint, new_obj)
+                if obj is not new_obj:
+                    obj.occurrences += 1
+                    obj.last_seen = new_obj.last_seen
+
+        if connection.in_atomic_block:
+            return event
+        if len(self._pending) >= getattr(
+            settings, "UNEXPECTED_EVENT_BATCH_SIZE", 100
+        ) or time.monotonic() - self._flushed_at >= getattr(
+            settings, "UNEXPECTED_EVENT_FLUSH_INTERVAL", 10
+        ):
+            self.flush()
+        return event
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return
+        try:
+            self._save(pending)
+        except Exception as e:
+            logging.exception(f"Unable to flush unexpected events: {e}")
+            self._restore(pending)
+
+    def _restore(self, pending):
+        """
+        Devolve ao buffer os eventos que não foram gravados
+        """
+        with self._lock:
+            for fingerprint, obj in pending.items():
+                current = self._pending.get(fingerprint)
+                if current is not None:
+                    obj.occurrences += current.occurrences
+                    obj.last_seen = max(obj.last_seen, current.last_seen)
+                self._pending[fingerprint] = obj
+
+    @staticmethod
+    def _save(pending):
+        window = getattr(settings, "UNEXPECTED_EVENT_AGGREGATION_WINDOW", 3600)
+        since = timezone.now() - timedelta(seconds=window)
+        with transaction.atomic():
+            existing = {}
+            for row in (
+                UnexpectedEvent.objects.filter(
+                    fingerprint__in=list(pending), last_seen__gte=since
+                )
+                .order_by("last_seen")
+                .only("id", "fingerprint")
+            ):
+                existing[row.fingerprint] = row.id
+
+            to_create = []
+            for fingerprint, obj in pending.items():
+                row_id = existing.get(fingerprint)
+                if row_id is None:
+                    to_create.append(obj)
+                    continue
+                UnexpectedEvent.objects.filter(id=row_id).update(
+                    occurrences=F("occurrences") + obj.occurrences,
+                    last_seen=obj.last_seen,
+                )
+            UnexpectedEvent.objects.bulk_create(to_create)
+
+
+unexpected_event_recorder = UnexpectedEventRecorder()
+atexit.register(unexpected_event_recorder.flush)
+
+
 def tracker_file_directory_path(instance, filename):
     # file will be uploaded to MEDIA_ROOT/user_<id>/<filename>
 
@@ -229,3 +432,10 @@ class Hello(models.Model):
             obj.traceback = traceback.format_tb(exc_traceback)
         obj.save()
         return obj
+
+
+def flush_unexpected_events(sender, **kwargs):
+    unexpected_event_recorder.flush()
+
+
+request_finished.connect(flush_unexpected_events)
@@ -6,6 +6,7 @@ from datetime import datetime
 from django.contrib.auth import get_user_model
 
 from config import celery_app
+from core.utils.partitioning import maintain_partitions
 from .models import UnexpectedEvent, Hello
 
 
@@ -56,3 +57,12 @@ def hello(self, user_id=None):
             exception=e,
             exc_traceback=exc_traceback,
         )
+
+
+@celery_app.task(bind=True)
+def task_maintain_event_partitions(self, user_id=None, username=None):
+    """
+    Cria as partições mensais dos próximos meses das tabelas de eventos e
+    remove as que saíram do prazo de retenção (EVENT_RETENTION_MONTHS)
+    """
+    return maintain_partitions()
@@ -0,0 +1,153 @@
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from tracker.models import UnexpectedEvent, unexpected_event_recorder
+
+
+@override_settings(
+    UNEXPECTED_EVENT_BUFFERED=True,
+    UNEXPECTED_EVENT_BATCH_SIZE=100,
+    UNEXPECTED_EVENT_FLUSH_INTERVAL=3600,
+)
+class UnexpectedEventRecorderTest(TestCase):
+    def setUp(self):
+        unexpected_event_recorder.flush()
+
+    def test_repeated_events_are_aggregated(self):
+        for i in range(5):
+            UnexpectedEvent.create(
+                exception=ValueError(f"error {i}"),
+                action="load",
+                item="S0001",
+                detail={"i": i},
+            )
+        UnexpectedEvent.create(exception=KeyError("x"), action="load", item="S0001")
+        self.assertEqual(0, UnexpectedEvent.objects.count())
+
+        unexpected_event_recorder.flush()
+
+        events = {obj.exception_type: obj for obj in UnexpectedEvent.objects.all()}
+        self.assertEqual(2, len(events))
+        value_error = events[str(ValueError)]
+        self.assertEqual(5, value_error.occurrences)
+        self.assertEqual("error 0", value_error.exception_msg)
+        self.assertEqual({"i": 0}, value_error.detail)
+        self.assertLessEqual(value_error.first_seen, value_error.last_seen)
+        self.assertEqual(1, events[str(KeyError)].occurrences)
+
+    def test_events_without_action_are_grouped_by_origin(self):
+        for function in ("a.load", "b.export", "a.load"):
+            UnexpectedEvent.create(
+                exception=ValueError("x"), detail={"function": function}
+            )
+        unexpected_event_recorder.flush()
+
+        events = {
+            obj.detail["function"]: obj.occurrences
+            for obj in UnexpectedEvent.objects.all()
+        }
+        self.assertEqual({"a.load": 2, "b.export": 1}, events)
+
+    def test_events_without_action_are_grouped_by_traceback_origin(self):
+        def fail_in_load():
+            try:
+                raise ValueError("x")
+            except ValueError as e:
+                UnexpectedEvent.create(exception=e, exc_traceback=e.__traceback__)
+
+        def fail_in_export():
+            try:
+                raise ValueError("x")
+            except ValueError as e:
+                UnexpectedEvent.create(exception=e, exc_traceback=e.__traceback__)
+
+        fail_in_load()
+        fail_in_export()
+        unexpected_event_recorder.flush()
+        self.assertEqual(2, UnexpectedEvent.objects.count())
+
+    def test_caller_gets_its_own_event(self):
+        first = UnexpectedEvent.create(
+            exception=ValueError("x"), action="load", item="S0001", detail={"i": 1}
+        )
+        second = UnexpectedEvent.create(
+            exception=ValueError("y"), action="load", item="S0001", detail={"i": 2}
+        )
+        self.assertIsNot(first, second)
+        self.assertEqual('{"i": 2}', second.data["detail"])
+        self.assertEqual("y", second.data["exception_msg"])
+        self.assertEqual(1, first.occurrences)
+
+        unexpected_event_recorder.flush()
+        self.assertEqual(2, UnexpectedEvent.objects.get().occurrences)
+
+    def test_flush_adds_to_recent_event(self):
+        UnexpectedEvent.create(exception=ValueError("x"), action="load", item="S0001")
+        unexpected_event_recorder.flush()
+        UnexpectedEvent.create(exception=ValueError("x"), action="load", item="S0001")
+        UnexpectedEvent.create(exception=ValueError("x"), action="load", item="S0001")
+        unexpected_event_recorder.flush()
+
+        obj = UnexpectedEvent.objects.get()
+        self.assertEqual(3, obj.occurrences)
+
+    @override_settings(UNEXPECTED_EVENT_BATCH_SIZE=2)
+    def test_no_flush_on_batch_size_inside_transaction(self):
+        UnexpectedEvent.create(exception=ValueError("x"), action="a")
+        UnexpectedEvent.create(exception=ValueError("x"), action="b")
+        self.assertEqual(0, UnexpectedEvent.objects.count())
+        unexpected_event_recorder.flush()
+        self.assertEqual(2, UnexpectedEvent.objects.count())
+
+    def test_failed_flush_keeps_events(self):
+        UnexpectedEvent.create(exception=ValueError("x"), action="load")
+        with patch.object(
+            unexpected_event_recorder, "_save", side_effect=RuntimeError("db")
+        ):
+            unexpected_event_recorder.flush()
+        UnexpectedEvent.create(exception=ValueError("x"), action="load")
+        unexpected_event_recorder.flush()
+
+        self.assertEqual(2, UnexpectedEvent.objects.get().occurrences)
+
+
+@override_settings(
+    UNEXPECTED_EVENT_BUFFERED=True,
+    UNEXPECTED_EVENT_BATCH_SIZE=2,
+    UNEXPECTED_EVENT_FLUSH_INTERVAL=3600,
+)
+class UnexpectedEventRecorderAutocommitTest(TransactionTestCase):
+    def setUp(self):
+        unexpected_event_recorder.flush()
+
+    def test_flush_on_batch_size(self):
+        UnexpectedEvent.create(exception=ValueError("x"), action="a")
+        self.assertEqual(0, UnexpectedEvent.objects.count())
+        UnexpectedEvent.create(exception=ValueError("x"), action="b")
+        self.assertEqual(2, UnexpectedEvent.objects.count())
+
+    def test_rollback_does_not_discard_buffer(self):
+        UnexpectedEvent.create(exception=ValueError("x"), action="a")
+        try:
+            with transaction.atomic():
+                UnexpectedEvent.create(exception=ValueError("x"), action="b")
+                raise RuntimeError("rollback")
+        except RuntimeError:
+            pass
+        self.assertEqual(0, UnexpectedEvent.objects.count())
+        unexpected_event_recorder.flush()
+        self.assertEqual(2, UnexpectedEvent.objects.count())
+
+
+class UnexpectedEventCapDetailTest(TestCase):
+    @override_settings(UNEXPECTED_EVENT_MAX_DETAIL_SIZE=50)
+    def test_cap_detail(self):
+        detail = UnexpectedEvent.cap_detail({"data": ["x" * 20] * 10})
+        self.assertTrue(detail["truncated"])
+        self.assertEqual(50, len(detail["preview"]))
+
+    def test_not_serializable_detail(self):
+        detail = UnexpectedEvent.cap_detail({"obj": object()})
+        self.assertIsInstance(detail, str)
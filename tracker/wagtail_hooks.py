@@ -4,11 +4,12 @@ from wagtail.snippets.models import register_snippet
 from wagtail.snippets.views.snippets import SnippetViewSet, SnippetViewSetGroup
 
 from config.menu import get_menu_order
+from core.viewsets import RecentEventsViewSetMixin
 
 from .models import UnexpectedEvent, Hello
 
 
-class UnexpectedEventModelAdmin(SnippetViewSet):
+class UnexpectedEventModelAdmin(RecentEventsViewSetMixin, SnippetViewSet):
     model = UnexpectedEvent
     inspect_view_enabled = True
     menu_label = _("Unexpected Events")
@@ -22,9 +23,11 @@ class UnexpectedEventModelAdmin(SnippetViewSet):
         "action",
         "exception_type",
         "exception_msg",
+        "occurrences",
+        "last_seen",
         "created",
     )
-    list_filter = ("action", "exception_type", )
+    list_filter = ("action", "exception_type", "created")
     search_fields = (
         "exception_msg",
         "detail",
@@ -38,11 +41,14 @@ class UnexpectedEventModelAdmin(SnippetViewSet):
         "exception_msg",
         "traceback",
         "detail",
+        "occurrences",
+        "first_seen",
+        "last_seen",
         "created",
     )
 
 
-class HelloModelAdmin(SnippetViewSet):
+class HelloModelAdmin(RecentEventsViewSetMixin, SnippetViewSet):
     model = Hello
     inspect_view_enabled = True
     menu_label = _("Hello events")
@@ -58,7 +64,7 @@ class HelloModelAdmin(SnippetViewSet):
         "traceback",
         "created",
     )
-    list_filter = ("status", "exception_type",)
+    list_filter = ("status", "exception_type", "created")
     search_fields = (
         "exception_msg",
         "detail",